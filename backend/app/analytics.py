@@ -0,0 +1,220 @@
+"""
+Write-behind analytics: career page / job views and apply clicks.
+
+Events are aggregated in this worker's memory, per (company, job, day), in
+lock-sharded counters with a HyperLogLog sketch of distinct visitors, and
+flushed to `analytics_daily` as one batched upsert every
+`analytics_flush_seconds` or as soon as `analytics_flush_events` events are
+pending. A request therefore never writes to the database itself. A failed
+flush puts the batch back, and shutdown flushes whatever is left.
+"""
+import logging
+import threading
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app import database
+from app.middleware.admission import client_ip
+from app.models.analytics import AnalyticsRollup
+from app.utils.hyperloglog import HyperLogLog
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+VIEW = 0
+APPLY_CLICK = 1
+# job_id used for the career page itself
+CAREER_PAGE = 0
+
+Key = Tuple[int, int, date]  # (company_id, job_id, day)
+
+
+class _Shard:
+    __slots__ = ("lock", "counts", "visitors")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[Key, List[int]] = {}  # key -> [views, apply_clicks]
+        self.visitors: Dict[Key, HyperLogLog] = {}
+
+
+class AnalyticsBuffer:
+    """
+    In-memory event aggregation. Keys are spread over `shards` independently
+    locked shards so threadpool requests rarely contend on the same lock.
+    """
+
+    def __init__(self, shards: int = 16, flush_events: int = 5000):
+        self._shards = [_Shard() for _ in range(shards)]
+        self.flush_events = flush_events
+        # Approximate (updated without a lock); only used to trigger a flush
+        self.pending = 0
+        self.flush_requested = threading.Event()
+
+    def record(self, metric: int, company_id: int, job_id: int, visitor: Optional[int]) -> None:
+        key = (company_id, job_id, datetime.now(timezone.utc).date())
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.lock:
+            counts = shard.counts.get(key)
+            if counts is None:
+                counts = shard.counts[key] = [0, 0]
+            counts[metric] += 1
+            if visitor is not None and metric == VIEW:
+                sketch = shard.visitors.get(key)
+                if sketch is None:
+                    sketch = shard.visitors[key] = HyperLogLog()
+                sketch.add_hash(visitor)
+
+        self.pending += 1
+        if self.pending >= self.flush_events:
+            self.flush_requested.set()
+
+    def drain(self) -> Tuple[Dict[Key, List[int]], Dict[Key, HyperLogLog]]:
+        """Take everything recorded so far, leaving the buffer empty."""
+        counts: Dict[Key, List[int]] = {}
+        visitors: Dict[Key, HyperLogLog] = {}
+        self.pending = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard_counts, shard.counts = shard.counts, {}
+                shard_visitors, shard.visitors = shard.visitors, {}
+            # A key always lands on the same shard, so shards never overlap.
+            counts.update(shard_counts)
+            visitors.update(shard_visitors)
+        return counts, visitors
+
+    def restore(self, counts: Dict[Key, List[int]], visitors: Dict[Key, HyperLogLog]) -> None:
+        """Merge a drained batch back in (after a failed flush)."""
+        for key, (views, apply_clicks) in counts.items():
+            shard = self._shards[hash(key) % len(self._shards)]
+            with shard.lock:
+                current = shard.counts.setdefault(key, [0, 0])
+                current[VIEW] += views
+                current[APPLY_CLICK] += apply_clicks
+                if key in visitors:
+                    sketch = shard.visitors.get(key)
+                    shard.visitors[key] = sketch.merge(visitors[key]) if sketch else visitors[key]
+            self.pending += views + apply_clicks
+
+    def flush(self, db: Session) -> int:
+        """Write pending aggregates to `analytics_daily`. Returns rows touched."""
+        counts, visitors = self.drain()
+        if not counts:
+            return 0
+        try:
+            _write_rollups(db, counts, visitors)
+        except Exception:
+            db.rollback()
+            self.restore(counts, visitors)
+            raise
+        return len(counts)
+
+
+def _write_rollups(db: Session, counts: Dict[Key, List[int]], visitors: Dict[Key, HyperLogLog]) -> None:
+    # Sorted so concurrent flushes from several workers lock rows in the same
+    # order and cannot deadlock.
+    keys = sorted(counts)
+    pk = tuple_(AnalyticsRollup.company_id, AnalyticsRollup.job_id, AnalyticsRollup.day)
+
+    db.execute(
+        insert(AnalyticsRollup)
+        .values([{"company_id": c, "job_id": j, "day": d} for c, j, d in keys])
+        .on_conflict_do_nothing()
+    )
+    # Row locks held until commit make the read-merge-write below atomic,
+    # including the sketch merge, which SQL cannot do.
+    current = db.execute(
+        select(
+            AnalyticsRollup.company_id,
+            AnalyticsRollup.job_id,
+            AnalyticsRollup.day,
+            AnalyticsRollup.views,
+            AnalyticsRollup.apply_clicks,
+            AnalyticsRollup.visitors_hll,
+        )
+        .where(pk.in_(keys))
+        .order_by(AnalyticsRollup.company_id, AnalyticsRollup.job_id, AnalyticsRollup.day)
+        .with_for_update()
+    ).all()
+
+    rows = []
+    for company_id, job_id, day, views, apply_clicks, visitors_hll in current:
+        key = (company_id, job_id, day)
+        delta = counts[key]
+        row = {
+            "company_id": company_id,
+            "job_id": job_id,
+            "day": day,
+            "views": views + delta[VIEW],
+            "apply_clicks": apply_clicks + delta[APPLY_CLICK],
+            "visitors_hll": visitors_hll,
+        }
+        if key in visitors:
+            sketch = visitors[key]
+            if visitors_hll:
+                sketch = HyperLogLog.from_bytes(visitors_hll).merge(sketch)
+            row["visitors_hll"] = sketch.to_bytes()
+        rows.append(row)
+
+    # Bulk UPDATE by primary key (executemany)
+    db.execute(update(AnalyticsRollup), rows)
+    db.commit()
+
+
+buffer = AnalyticsBuffer(flush_events=settings.analytics_flush_events)
+
+_stop = threading.Event()
+_flusher: Optional[threading.Thread] = None
+
+
+def visitor_hash(request) -> int:
+    """Cookie-less visitor identity: client address + user agent."""
+    user_agent = request.headers.get("user-agent", "")
+    return HyperLogLog.hash(f"{client_ip(request.scope)}|{user_agent}")
+
+
+def track(request, metric: int, company_id: int, job_id: int = CAREER_PAGE) -> None:
+    if settings.analytics_enabled:
+        buffer.record(metric, company_id, job_id, visitor_hash(request))
+
+
+def flush_now() -> None:
+    try:
+        flushed = database.run_in_session(buffer.flush)
+        if flushed:
+            logger.debug("Flushed %s analytics rows", flushed)
+    except Exception:
+        logger.exception("Analytics flush failed; will retry")
+
+
+def _flush_loop() -> None:
+    while not _stop.is_set():
+        buffer.flush_requested.wait(settings.analytics_flush_seconds)
+        buffer.flush_requested.clear()
+        if not _stop.is_set():
+            flush_now()
+
+
+def start_flusher() -> None:
+    """Start the background flush thread (called from the app lifespan)."""
+    global _flusher
+    if not settings.analytics_enabled or _flusher is not None:
+        return
+    _stop.clear()
+    _flusher = threading.Thread(target=_flush_loop, name="analytics-flush", daemon=True)
+    _flusher.start()
+
+
+def stop_flusher() -> None:
+    """Stop the flush thread and write out everything still buffered."""
+    global _flusher
+    if _flusher is not None:
+        _stop.set()
+        buffer.flush_requested.set()
+        _flusher.join(timeout=30)
+        _flusher = None
+    flush_now()
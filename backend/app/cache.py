@@ -0,0 +1,431 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.utils.singleflight import SingleFlight
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Background stale-while-revalidate refreshes
+_refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with a per-entry time-to-live.
+    Values should be plain data (dicts / lists), never ORM instances,
+    because sessions are closed once the request finishes.
+
+    With `stale_seconds` > 0, expired entries are kept that much longer so
+    `get_stale` can serve them while a refresh runs (stale-while-revalidate).
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 1024, stale_seconds: int = 0):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        # key -> (fresh_until, stale_until, value)
+        self._data: Dict[str, Tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        value, fresh = self.get_stale(key)
+        return value if fresh else None
+
+    def get_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Returns `(value, is_fresh)`; value is None once past the stale window."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None, False
+            fresh_until, stale_until, value = entry
+            now = time.monotonic()
+            if stale_until < now:
+                del self._data[key]
+                return None, False
+            return value, fresh_until >= now
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        fresh_until = time.monotonic() + ttl
+        with self._lock:
+            if len(self._data) >= self.max_entries and key not in self._data:
+                # Drop the entry closest to expiry to make room.
+                oldest = min(self._data, key=lambda k: self._data[k][1])
+                del self._data[oldest]
+            self._data[key] = (fresh_until, fresh_until + self.stale_seconds, value)
+
+    def mark_stale(self, key: str) -> None:
+        """Expire an entry but keep it servable for the stale window."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                self._data[key] = (0.0, now + self.stale_seconds, entry[2])
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# --- Shared (L2) backends ---
+
+
+class MemoryBackend:
+    """
+    Process-local stand-in for the shared backend. Used when REDIS_URL is not
+    set (single worker, local development) and as a Redis double in tests.
+    Nothing published here leaves the process, which is why serve.py refuses
+    to start several workers without REDIS_URL.
+    """
+
+    def __init__(self):
+        self._store = TTLCache(ttl_seconds=0, max_entries=100_000)
+        self._subscribers: List[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._store.get(key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._store.get(key) for key in keys]
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._store.set(key, value, ttl_seconds)
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        with self._lock:
+            value = int(self._store.get(key) or 0) + 1
+            self._store.set(key, str(value), ttl_seconds)
+        return value
+
+    def delete(self, key: str) -> None:
+        self._store.delete(key)
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def close(self) -> None:
+        with self._lock:
+            self._subscribers.clear()
+
+
+class RedisBackend:
+    """Shared backend speaking the Redis protocol (Redis, Valkey, KeyDB, ...)."""
+
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed when REDIS_URL is set
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._listener = None
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return self._client.mget(keys)
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._client.set(key, value, ex=ttl_seconds)
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        pipe = self._client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, ttl_seconds)
+        value, _ = pipe.execute()
+        return value
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def publish(self, channel: str, message: str) -> None:
+        self._client.publish(channel, message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{channel: lambda message: callback(message["data"])})
+        self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._client.close()
+
+
+def create_backend(url: str):
+    if url:
+        return RedisBackend(url)
+    return MemoryBackend()
+
+
+# --- Two-tier cache ---
+
+
+class TwoTierCache:
+    """
+    Per-worker L1 (`TTLCache`) in front of a shared L2 backend. Writers call
+    `invalidate`, which removes the key from L2 and publishes it on the
+    invalidation channel so every other worker marks its L1 copy stale.
+
+    `get_or_load` coalesces concurrent misses for a key into one load and,
+    within the stale window, serves the previous value while a single
+    background refresh runs.
+
+    A load can finish after an `invalidate` that happened while it ran, with a
+    value read before the write. So every key has a generation, bumped by
+    `invalidate`: L2 entries carry the generation they were loaded under and
+    are ignored once it is stale, and L1 keeps a local counter for the same
+    purpose.
+
+    Values must be JSON-serializable.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        l1_ttl_seconds: int,
+        l2_ttl_seconds: int,
+        stale_seconds: int = 0,
+    ):
+        self.namespace = namespace
+        self.l2_ttl_seconds = l2_ttl_seconds
+        self.local = TTLCache(ttl_seconds=l1_ttl_seconds, stale_seconds=stale_seconds)
+        self._flight = SingleFlight()
+        self._refreshing: Set[str] = set()
+        self._refreshing_lock = threading.Lock()
+        # key -> local invalidation count (see `_load_through`)
+        self._local_generations: Dict[str, int] = {}
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}:generation"
+
+    @property
+    def _generation_ttl_seconds(self) -> int:
+        # Outlives any entry written under an older generation, so an expired
+        # counter restarting from 0 cannot make one of them valid again.
+        return self.l2_ttl_seconds * 2
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        value, _ = self._get_shared(key)
+        if value is not None:
+            self.local.set(key, value)
+        return value
+
+    def _get_shared(self, key: str) -> Tuple[Optional[Any], Optional[int]]:
+        """
+        `(value, generation)` from L2. The value is None on a miss or when it
+        was loaded before the last invalidation; the generation is None when
+        L2 is unreachable.
+        """
+        try:
+            raw, generation = backend.get_many(
+                [self._shared_key(key), self._generation_key(key)]
+            )
+        except Exception:
+            logger.warning("Shared cache read failed for %s", key, exc_info=True)
+            return None, None
+        generation = int(generation or 0)
+        if raw is None:
+            return None, generation
+
+        entry = json.loads(raw)
+        if not isinstance(entry, dict) or entry.get("generation") != generation:
+            return None, generation
+        return entry["value"], generation
+
+    def _set_shared(self, key: str, value: Any, generation: int) -> None:
+        entry = {"generation": generation, "value": value}
+        try:
+            backend.set(self._shared_key(key), json.dumps(entry), self.l2_ttl_seconds)
+        except Exception:
+            logger.warning("Shared cache write failed for %s", key, exc_info=True)
+
+    def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Any],
+        refresh: Optional[Callable[[], Any]] = None,
+        immutable: bool = False,
+    ) -> Optional[Any]:
+        """
+        Cached value for `key`, calling `load` on a miss. Only one `load` runs
+        per key at a time; concurrent callers wait for its result. A None
+        result is returned but not cached.
+
+        `refresh` must not depend on the caller's request (it typically opens
+        its own DB session on the primary). When given, a stale L1 entry is
+        returned right away and `refresh` runs once in the background; without
+        it stale entries are treated as misses.
+
+        Only the primary fills the shared tier: `load` may read a lagging
+        replica, and a pre-update value written to L2 after an invalidation
+        would outlive it. So a miss loads through `refresh` when there is one,
+        and otherwise keeps the `load` result in L1 only, unless `immutable`
+        (the value never changes once it exists, e.g. a published version).
+        """
+        value, fresh = self.local.get_stale(key)
+        if value is not None and fresh:
+            return value
+        if value is not None and refresh is not None:
+            self._schedule_refresh(key, refresh)
+            return value
+
+        if refresh is not None:
+            return self._flight.do(key, lambda: self._load_through(key, refresh))
+        return self._flight.do(key, lambda: self._load_through(key, load, shared=immutable))
+
+    def _load_through(
+        self, key: str, load: Callable[[], Any], shared: bool = True
+    ) -> Optional[Any]:
+        # Generations are read before loading: if the key is invalidated
+        # while `load` runs, its (possibly pre-update) result is returned to
+        # the callers that were already waiting but not cached.
+        local_generation = self._local_generations.get(key, 0)
+        value, generation = self._get_shared(key)
+        if value is None:
+            value = load()
+            if value is not None and shared and generation is not None:
+                self._set_shared(key, value, generation)
+        if value is not None and self._local_generations.get(key, 0) == local_generation:
+            self.local.set(key, value)
+        return value
+
+    def _bump_local_generation(self, key: str) -> None:
+        self._local_generations[key] = self._local_generations.get(key, 0) + 1
+
+    def _schedule_refresh(self, key: str, refresh: Callable[[], Any]) -> None:
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._flight.do(key, lambda: self._load_through(key, refresh))
+            except Exception:
+                logger.warning("Background refresh failed for %s", key, exc_info=True)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        _refresh_pool.submit(run)
+
+    def invalidate(self, key: str) -> None:
+        self._bump_local_generation(key)
+        self.local.delete(key)
+        shared_key = self._shared_key(key)
+        try:
+            backend.incr(self._generation_key(key), self._generation_ttl_seconds)
+            backend.delete(shared_key)
+            backend.publish(INVALIDATION_CHANNEL, shared_key)
+        except Exception:
+            # L1 entries elsewhere still expire after l1 TTL.
+            logger.warning("Cache invalidation failed for %s", key, exc_info=True)
+
+    def evict_local(self, key: str) -> None:
+        # Other workers keep serving the old value until one refresh lands.
+        self._bump_local_generation(key)
+        self.local.mark_stale(key)
+
+
+_caches: Dict[str, TwoTierCache] = {}
+# Non-cache state reloaded on invalidation messages (e.g. the custom-domain map)
+_listeners: Dict[str, Callable[[str], None]] = {}
+
+
+def _on_invalidation(message: str) -> None:
+    namespace, _, key = message.partition(":")
+    listener = _listeners.get(namespace)
+    if listener is not None:
+        listener(key)
+        return
+    cache = _caches.get(namespace)
+    if cache is not None:
+        cache.evict_local(key)
+
+
+def add_invalidation_listener(namespace: str, callback: Callable[[str], None]) -> None:
+    """Call `callback(key)` in every worker when `publish_invalidation(namespace, key)` runs."""
+    _listeners[namespace] = callback
+
+
+def publish_invalidation(namespace: str, key: str = "") -> None:
+    try:
+        backend.publish(INVALIDATION_CHANNEL, f"{namespace}:{key}")
+    except Exception:
+        logger.warning("Could not publish invalidation for %s", namespace, exc_info=True)
+
+
+def start_invalidation_listener() -> None:
+    """Subscribe this worker to L1 evictions (called from the app lifespan)."""
+    try:
+        backend.subscribe(INVALIDATION_CHANNEL, _on_invalidation)
+    except Exception:
+        # Without the subscription L1 entries still expire after their TTL.
+        logger.exception("Could not subscribe to cache invalidations")
+
+
+def stop_invalidation_listener() -> None:
+    backend.close()
+
+
+def _register(cache: TwoTierCache) -> TwoTierCache:
+    _caches[cache.namespace] = cache
+    return cache
+
+
+backend = create_backend(settings.redis_url)
+
+# Public career page payloads keyed by company slug.
+company_cache = _register(
+    TwoTierCache(
+        "company",
+        l1_ttl_seconds=settings.cache_ttl_seconds,
+        l2_ttl_seconds=settings.cache_shared_ttl_seconds,
+        stale_seconds=settings.cache_stale_seconds,
+    )
+)
+
+# Active job summaries (unfiltered public list) keyed by company id.
+jobs_cache = _register(
+    TwoTierCache(
+        "jobs",
+        l1_ttl_seconds=settings.cache_ttl_seconds,
+        l2_ttl_seconds=settings.cache_shared_ttl_seconds,
+        stale_seconds=settings.cache_stale_seconds,
+    )
+)
+
+# Published page snapshots keyed by version id. Immutable, so never invalidated.
+version_cache = _register(
+    TwoTierCache(
+        "version",
+        l1_ttl_seconds=settings.cache_version_ttl_seconds,
+        l2_ttl_seconds=settings.cache_version_ttl_seconds,
+    )
+)
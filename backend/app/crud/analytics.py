@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from app.analytics import CAREER_PAGE
+from app.models.analytics import AnalyticsRollup
+from app.models.job import Job
+from app.models.job_archive import ArchivedJob
+from app.utils.hyperloglog import HyperLogLog
+
+
+def _sketch(data) -> HyperLogLog:
+    return HyperLogLog.from_bytes(data) if data else HyperLogLog()
+
+
+def get_company_stats(db: Session, company_id: int, days: int = 30) -> dict:
+    """
+    View / apply-click rollups of a company over the last `days` days: per day
+    for the career page, and per job summed over the range. Distinct visitors
+    over the range come from merging the daily sketches, so a visitor seen on
+    several days counts once. Events still buffered in workers (up to
+    `analytics_flush_seconds` old) are not included.
+    """
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    rows = (
+        db.query(AnalyticsRollup)
+        .filter(AnalyticsRollup.company_id == company_id, AnalyticsRollup.day >= since)
+        .order_by(AnalyticsRollup.day)
+        .all()
+    )
+
+    career_page = []
+    page_visitors = HyperLogLog()
+    jobs: Dict[int, dict] = {}
+    job_visitors: Dict[int, HyperLogLog] = {}
+
+    for row in rows:
+        sketch = _sketch(row.visitors_hll)
+        if row.job_id == CAREER_PAGE:
+            career_page.append(
+                {
+                    "day": row.day,
+                    "views": row.views,
+                    "apply_clicks": row.apply_clicks,
+                    "unique_visitors": sketch.count(),
+                }
+            )
+            page_visitors.merge(sketch)
+            continue
+
+        totals = jobs.setdefault(
+            row.job_id, {"job_id": row.job_id, "views": 0, "apply_clicks": 0}
+        )
+        totals["views"] += row.views
+        totals["apply_clicks"] += row.apply_clicks
+        job_visitors.setdefault(row.job_id, HyperLogLog()).merge(sketch)
+
+    titles = dict(db.query(Job.id, Job.title).filter(Job.id.in_(list(jobs))))
+    missing = [job_id for job_id in jobs if job_id not in titles]
+    if missing:
+        titles.update(db.query(ArchivedJob.id, ArchivedJob.title).filter(ArchivedJob.id.in_(missing)))
+
+    for job_id, totals in jobs.items():
+        totals["title"] = titles.get(job_id)
+        totals["unique_visitors"] = job_visitors[job_id].count()
+
+    return {
+        "since": since,
+        "career_page": career_page,
+        "career_page_unique_visitors": page_visitors.count(),
+        "jobs": sorted(jobs.values(), key=lambda totals: totals["views"], reverse=True),
+    }
@@ -0,0 +1,135 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.external_services.notification import send_notification
+from app.external_services.storage import resume_storage
+from app.models.application import Application, ApplicationStatus
+from app.models.company import Company
+from app.utils.resume_text import extract_text
+
+logger = logging.getLogger(__name__)
+
+
+def create_application(
+    db: Session,
+    company_id: int,
+    job_id: int,
+    application_in: schemas.ApplicationCreate,
+    resume: dict,
+) -> Application:
+    """
+    Record an application whose resume is already in `resume_storage`.
+    `resume` holds key, filename, content_type, size and sha256.
+    """
+    db_application = Application(
+        company_id=company_id,
+        job_id=job_id,
+        candidate_name=application_in.candidate_name,
+        candidate_email=application_in.candidate_email.lower(),
+        phone=application_in.phone,
+        cover_letter=application_in.cover_letter,
+        resume_key=resume["key"],
+        resume_filename=resume["filename"],
+        resume_content_type=resume["content_type"],
+        resume_size=resume["size"],
+        resume_sha256=resume["sha256"],
+        status=ApplicationStatus.RECEIVED,
+    )
+    db.add(db_application)
+    db.commit()
+    db.refresh(db_application)
+    return db_application
+
+
+def process_application(db: Session, application_id: int) -> None:
+    """
+    Post-processing, run in the background pool: extract the resume text,
+    link duplicates (same resume or email for the same job) and notify the
+    recruiter.
+    """
+    # Row lock: another worker requeueing pending applications at startup
+    # skips this one instead of processing it twice.
+    application = (
+        db.query(Application)
+        .filter(
+            Application.id == application_id,
+            Application.status == ApplicationStatus.RECEIVED,
+        )
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if application is None:
+        return
+
+    extension = os.path.splitext(application.resume_key)[1]
+    try:
+        application.resume_text = extract_text(
+            resume_storage.path(application.resume_key), extension
+        )
+        application.status = ApplicationStatus.PROCESSED
+    except ValueError:
+        logger.warning("Could not read resume of application %s", application_id, exc_info=True)
+        application.status = ApplicationStatus.FAILED
+
+    application.duplicate_of_id = (
+        db.query(Application.id)
+        .filter(
+            Application.job_id == application.job_id,
+            Application.id < application.id,
+            or_(
+                Application.resume_sha256 == application.resume_sha256,
+                Application.candidate_email == application.candidate_email,
+            ),
+        )
+        .order_by(Application.id)
+        .limit(1)
+        .scalar()
+    )
+    application.processed_at = datetime.now(timezone.utc)
+    db.commit()
+
+    company = db.get(Company, application.company_id)
+    note = f" (duplicate of #{application.duplicate_of_id})" if application.duplicate_of_id else ""
+    send_notification(
+        f"New application #{application.id} for job {application.job_id} at "
+        f"{company.slug} from {application.candidate_name}{note}",
+        channel="applications",
+    )
+
+
+def get_pending_application_ids(db: Session, limit: int = 500) -> List[int]:
+    """Applications whose post-processing never ran (e.g. the worker stopped)."""
+    rows = (
+        db.query(Application.id)
+        .filter(Application.status == ApplicationStatus.RECEIVED)
+        .order_by(Application.id)
+        .limit(limit)
+    )
+    return [application_id for (application_id,) in rows]
+
+
+def get_applications_for_job(
+    db: Session, company_id: int, job_id: int, limit: int = 50, offset: int = 0
+) -> List[Application]:
+    return (
+        db.query(Application)
+        .filter(Application.company_id == company_id, Application.job_id == job_id)
+        .order_by(Application.id.desc())
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+
+
+def get_application(db: Session, application_id: int, company_id: int) -> Optional[Application]:
+    return (
+        db.query(Application)
+        .filter(Application.id == application_id, Application.company_id == company_id)
+        .first()
+    )
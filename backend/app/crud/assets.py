@@ -0,0 +1,111 @@
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.external_services.storage import storage
+from app.models.asset import Asset
+
+_SHA256_RE = re.compile(r"^([0-9a-f]{64})/")
+
+
+def get_asset(db: Session, sha256: str) -> Optional[Asset]:
+    return db.query(Asset).filter(Asset.sha256 == sha256).first()
+
+
+def create_asset(
+    db: Session,
+    company_id: int,
+    sha256: str,
+    size_bytes: int,
+    original_key: str,
+    info: dict,
+) -> Asset:
+    """
+    Record an uploaded image and its generated variants. If the same image was
+    recorded concurrently (same content hash), returns that asset instead.
+    """
+    db_asset = Asset(
+        sha256=sha256,
+        company_id=company_id,
+        content_type=info["content_type"],
+        size_bytes=size_bytes,
+        width=info["width"],
+        height=info["height"],
+        original_key=original_key,
+        variants=[
+            {
+                "width": variant["width"],
+                "format": variant["format"],
+                "key": f"{sha256}/{variant['filename']}",
+            }
+            for variant in info["variants"]
+        ],
+    )
+    db.add(db_asset)
+    try:
+        db.commit()
+    except IntegrityError:  # identical upload won the race; files are the same
+        db.rollback()
+        return get_asset(db, sha256)
+    db.refresh(db_asset)
+    return db_asset
+
+
+def build_srcset(variants: List[dict], fmt: str) -> str:
+    return ", ".join(
+        f"{storage.url(v['key'])} {v['width']}w"
+        for v in sorted(variants, key=lambda v: v["width"])
+        if v["format"] == fmt
+    )
+
+
+def largest_variant_url(variants: List[dict], fmt: str = "webp") -> Optional[str]:
+    candidates = [v for v in variants if v["format"] == fmt]
+    if not candidates:
+        return None
+    return storage.url(max(candidates, key=lambda v: v["width"])["key"])
+
+
+def _asset_hash(url: Optional[str]) -> Optional[str]:
+    key = storage.key_from_url(url)
+    match = _SHA256_RE.match(key) if key else None
+    return match.group(1) if match else None
+
+
+def attach_srcsets(db: Session, branding: dict, page_content: dict) -> Tuple[dict, dict]:
+    """
+    Point image references at uploaded assets' resized variants.
+
+    For every `logo_url` / `image_url` that refers to an uploaded asset, the
+    URL is replaced by the largest WebP variant and a matching `*_srcset` is
+    added. Other URLs are left untouched. Returns new dicts.
+    """
+    branding = dict(branding or {})
+    page_content = dict(page_content or {})
+    sections = [dict(section) for section in page_content.get("about_sections", [])]
+
+    hashes = {_asset_hash(branding.get("logo_url"))}
+    hashes.update(_asset_hash(section.get("image_url")) for section in sections)
+    hashes.discard(None)
+    if not hashes:
+        return branding, page_content
+
+    assets = {
+        asset.sha256: asset
+        for asset in db.query(Asset).filter(Asset.sha256.in_(hashes))
+    }
+
+    def rewrite(target: dict, url_field: str, srcset_field: str) -> None:
+        asset = assets.get(_asset_hash(target.get(url_field)))
+        if asset is None or not asset.variants:
+            return
+        target[url_field] = largest_variant_url(asset.variants) or target[url_field]
+        target[srcset_field] = build_srcset(asset.variants, "webp")
+
+    rewrite(branding, "logo_url", "logo_srcset")
+    for section in sections:
+        rewrite(section, "image_url", "image_srcset")
+    page_content["about_sections"] = sections
+    return branding, page_content
@@ -0,0 +1,148 @@
+import base64
+from typing import List, Optional, Tuple
+
+from sqlalchemy import literal_column, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.change_log import ChangeLogEntry
+from app.models.company import Company
+from app.models.job import Job
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+# Oldest transaction id still running as of the reading statement's snapshot
+_RUNNING_XMIN = literal_column("pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
+# A feed position: (transaction id, change log id)
+Position = Tuple[int, int]
+
+
+def encode_cursor(position: Position) -> str:
+    """Opaque, URL-safe cursor for a change log position."""
+    txid, entry_id = position
+    raw = txid.to_bytes(8, "big") + entry_id.to_bytes(8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[int], int]:
+    """
+    Inverse of `encode_cursor`; None / "" is the start of the log. Cursors
+    issued when the log was ordered by id alone (a bare id, up to 8 bytes)
+    decode to `(None, id)`. Raises ValueError.
+    """
+    if not cursor:
+        return 0, 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if len(raw) == 16:
+        return int.from_bytes(raw[:8], "big"), int.from_bytes(raw[8:], "big")
+    if not raw or len(raw) > 8:
+        raise ValueError("Invalid cursor")
+    return None, int.from_bytes(raw, "big")
+
+
+def resolve_cursor(db: Session, cursor: Optional[str]) -> Position:
+    """Feed position of `cursor`, including old bare-id cursors. Raises ValueError."""
+    txid, entry_id = decode_cursor(cursor)
+    if txid is None:
+        # Rows logged before the txid column all share the migration's txid
+        txid = (
+            db.query(ChangeLogEntry.txid)
+            .filter(ChangeLogEntry.id <= entry_id)
+            .order_by(ChangeLogEntry.id.desc())
+            .limit(1)
+            .scalar()
+        ) or 0
+    return txid, entry_id
+
+
+def record_change(
+    db: Session, entity: str, entity_id: int, company_id: int, op: str, data: Optional[dict]
+) -> None:
+    """
+    Append a change to the log inside the caller's transaction; call it just
+    before the commit. The row records the writing transaction's id (see
+    `get_changes`), so writers never wait on each other.
+    """
+    db.add(
+        ChangeLogEntry(
+            entity=entity, entity_id=entity_id, company_id=company_id, op=op, data=data
+        )
+    )
+
+
+def job_change_data(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "title": job.title,
+        "location": job.location,
+        "job_type": job.job_type.value if job.job_type else None,
+        "min_salary": job.min_salary,
+        "max_salary": job.max_salary,
+        "currency": job.currency,
+        "description_html": job.description_html,
+        "description_excerpt": job.description_excerpt,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+
+def record_job_change(db: Session, job: Job, op: str) -> None:
+    """Log a change to a job as partners see it: only active jobs are public."""
+    db.flush()  # assigns ids / server-side timestamps
+    data = job_change_data(job) if op != DELETE else None
+    record_change(db, "job", job.id, job.company_id, op, data)
+
+
+def record_company_change(db: Session, company: Company, op: str) -> None:
+    db.flush()
+    data = {
+        "slug": company.slug,
+        "company_name": company.company_name,
+        "published_version_id": company.published_version_id,
+    }
+    record_change(db, "company", company.id, company.id, op, data)
+
+
+def get_changes(
+    db: Session, after: Position, limit: int = 500, company_id: Optional[int] = None
+) -> List:
+    """
+    Change log entries after position `after` in `(txid, id)` order, with the
+    company slug. Without `company_id`, only entries of published companies.
+
+    Ids are taken at insert but become visible at commit, in a different
+    order, so a bare id cursor could skip a row committed late with a lower
+    id. Instead only rows of transactions older than the oldest one still
+    running are returned: every row that commits later has a txid at least
+    that large, so it sorts after everything already returned. The cost is
+    latency, not throughput: a long-running transaction holds the feed back
+    until it ends.
+    """
+    query = (
+        db.query(
+            ChangeLogEntry.txid,
+            ChangeLogEntry.id,
+            ChangeLogEntry.entity,
+            ChangeLogEntry.entity_id,
+            ChangeLogEntry.op,
+            ChangeLogEntry.data,
+            ChangeLogEntry.created_at,
+            Company.slug.label("company_slug"),
+        )
+        .join(Company, Company.id == ChangeLogEntry.company_id)
+        .filter(
+            tuple_(ChangeLogEntry.txid, ChangeLogEntry.id) > tuple_(*after),
+            ChangeLogEntry.txid < _RUNNING_XMIN,
+        )
+    )
+    if company_id is not None:
+        query = query.filter(ChangeLogEntry.company_id == company_id)
+    else:
+        # The global feed lists published companies only
+        query = query.filter(Company.published_version_id.isnot(None))
+    return query.order_by(ChangeLogEntry.txid, ChangeLogEntry.id).limit(limit).all()
@@ -1,10 +1,19 @@
 import re
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app import schemas
+from app import idempotency, schemas
+from app.utils.json_patch import apply_patch
+from app.cache import company_cache, version_cache
+from app.crud import changes
+from app.crud.assets import attach_srcsets
+from app.database import run_in_session
 from app.models.company import Company
+from app.models.company_version import CompanyPageVersion
+from app.models.job import Job
 
 
 def _slugify(name: str) -> str:
@@ -54,36 +63,287 @@ def create_company(
     )
 
     db.add(db_company)
+    db.flush()
+    # New companies go live with their initial content as version 1.
+    _snapshot(db, db_company)
+    changes.record_company_change(db, db_company, changes.CREATE)
+    idempotency.record_response(db, db_company)
     db.commit()
     db.refresh(db_company)
     return db_company
 
 
+class StaleDraftError(Exception):
+    """The draft changed since the client's `base_version`."""
+
+
 def update_company(
     db: Session, slug: str, company_in: schemas.CompanyUpdate
 ) -> Optional[Company]:
-
+    """
+    Replace the draft branding / page content. Like `patch_company_draft`, the
+    write is conditional on the `draft_version` that was loaded, so a
+    concurrent draft edit is never silently overwritten: raises
+    `StaleDraftError` if another write got in first.
+    """
     db_company = db.query(Company).filter(Company.slug == slug).first()
 
     if not db_company:
         return None
 
+    values = {}
     if company_in.branding:
-        db_company.branding_config = company_in.branding.model_dump(mode="json")
+        values["branding_config"] = company_in.branding.model_dump(mode="json")
 
     if company_in.page_content:  # ← CHANGE: "content" to "page_content"
-        db_company.page_content = company_in.page_content.model_dump(mode="json")
+        values["page_content"] = company_in.page_content.model_dump(mode="json")
+
+    values["draft_version"] = Company.draft_version + 1
+    values["updated_at"] = func.now()
+    updated = (
+        db.query(Company)
+        .filter(Company.id == db_company.id, Company.draft_version == db_company.draft_version)
+        .update(values, synchronize_session=False)
+    )
+    if not updated:
+        db.rollback()
+        raise StaleDraftError()
+
+    if db_company.published_version_id is None:
+        changes.record_company_change(db, db_company, changes.UPDATE)
+    db.commit()
+    db.refresh(db_company)
+    # Edits only touch the draft. Companies that were never published still
+    # serve the draft publicly, so their cached payload must be dropped.
+    if db_company.published_version_id is None:
+        company_cache.invalidate(slug)
+    return db_company
+
+
+def patch_company_draft(
+    db: Session, db_company: Company, patch: schemas.CompanyPatch
+) -> Company:
+    """
+    Apply JSON Patch operations to the draft branding / page content.
+
+    The patched documents are validated against `BrandingConfig` and
+    `PageContent` before anything is written, and the write is conditional on
+    `draft_version` so concurrent editors cannot silently overwrite each other.
+
+    Raises `JsonPatchError` / `pydantic.ValidationError` for bad patches and
+    `StaleDraftError` when `base_version` is out of date.
+    """
+    base_version = db_company.draft_version
+    if patch.base_version is not None and patch.base_version != base_version:
+        raise StaleDraftError()
+
+    values = {}
+    for field, schema, operations in (
+        ("branding_config", schemas.BrandingConfig, patch.branding),
+        ("page_content", schemas.PageContent, patch.page_content),
+    ):
+        if not operations:
+            continue
+        current = getattr(db_company, field) or {}
+        patched = apply_patch(
+            current,
+            [op.model_dump(by_alias=True, exclude_unset=True) for op in operations],
+        )
+        patched = schema.model_validate(patched).model_dump(mode="json")
+        if patched != current:
+            values[field] = patched
+
+    # Nothing changed (or only `test` ops): skip the write entirely.
+    if not values:
+        return db_company
+
+    values["draft_version"] = Company.draft_version + 1
+    values["updated_at"] = func.now()
+    updated = (
+        db.query(Company)
+        .filter(Company.id == db_company.id, Company.draft_version == base_version)
+        .update(values, synchronize_session=False)
+    )
+    if not updated:
+        db.rollback()
+        raise StaleDraftError()
 
+    if db_company.published_version_id is None:
+        changes.record_company_change(db, db_company, changes.UPDATE)
     db.commit()
     db.refresh(db_company)
+    if db_company.published_version_id is None:
+        company_cache.invalidate(db_company.slug)
     return db_company
 
 
+def _snapshot(db: Session, db_company: Company) -> CompanyPageVersion:
+    """Copy the draft into a new version row and point the company at it."""
+    latest = (
+        db.query(func.max(CompanyPageVersion.version))
+        .filter(CompanyPageVersion.company_id == db_company.id)
+        .scalar()
+    )
+    # Published pages reference resized, immutable asset variants.
+    branding_config, page_content = attach_srcsets(
+        db, db_company.branding_config, db_company.page_content
+    )
+    db_version = CompanyPageVersion(
+        company_id=db_company.id,
+        version=(latest or 0) + 1,
+        branding_config=branding_config,
+        page_content=page_content,
+    )
+    db.add(db_version)
+    db.flush()
+    db_company.published_version_id = db_version.id
+    return db_version
+
+
+def publish_company(db: Session, db_company: Company) -> CompanyPageVersion:
+    """Publish the current draft as a new immutable version."""
+    # Lock the company row so concurrent publishes get sequential versions.
+    db.query(Company.id).filter(Company.id == db_company.id).with_for_update().one()
+    db_version = _snapshot(db, db_company)
+    changes.record_company_change(db, db_company, changes.UPDATE)
+    db.commit()
+    db.refresh(db_version)
+    company_cache.invalidate(db_company.slug)
+    return db_version
+
+
+def rollback_company(
+    db: Session, db_company: Company, version: int
+) -> Optional[CompanyPageVersion]:
+    """Point the public page back at an earlier published version."""
+    db_version = (
+        db.query(CompanyPageVersion)
+        .filter(
+            CompanyPageVersion.company_id == db_company.id,
+            CompanyPageVersion.version == version,
+        )
+        .first()
+    )
+    if not db_version:
+        return None
+
+    db_company.published_version_id = db_version.id
+    changes.record_company_change(db, db_company, changes.UPDATE)
+    db.commit()
+    company_cache.invalidate(db_company.slug)
+    return db_version
+
+
+def get_company_versions(db: Session, company_id: int):
+    """List published versions (metadata only, newest first)."""
+    return (
+        db.query(
+            CompanyPageVersion.id,
+            CompanyPageVersion.version,
+            CompanyPageVersion.published_at,
+        )
+        .filter(CompanyPageVersion.company_id == company_id)
+        .order_by(CompanyPageVersion.version.desc())
+        .all()
+    )
+
+
 def get_company_by_slug_public(db: Session, slug: str) -> Optional[Company]:
     """Fetch company data by slug for public access (no auth required)."""
     return db.query(Company).filter(Company.slug == slug).first()
 
 
+def get_company_public_ref(db: Session, slug: str) -> Optional[dict]:
+    """
+    Small cached record for `slug`: id, name and the published version pointer.
+    Public job routes only need this to resolve the tenant.
+    Returns None if the company does not exist.
+    """
+    return company_cache.get_or_load(
+        slug,
+        lambda: _load_company_ref(db, slug),
+        refresh=lambda: run_in_session(_load_company_ref, slug),
+    )
+
+
+def _load_company_ref(db: Session, slug: str) -> Optional[dict]:
+    company = get_company_by_slug_public(db, slug)
+    if not company:
+        return None
+
+    ref = {
+        "id": company.id,
+        "slug": company.slug,
+        "company_name": company.company_name,
+        "created_at": company.created_at.isoformat(),
+        "published_version_id": company.published_version_id,
+    }
+    if company.published_version_id is None:
+        # Never published (created before versioning): serve the draft.
+        ref["branding_config"] = company.branding_config or {}
+        ref["page_content"] = company.page_content or {}
+    return ref
+
+
+def get_version_payload(db: Session, version_id: int) -> Optional[dict]:
+    """Published snapshot by id. Versions are immutable, so this caches forever."""
+    return version_cache.get_or_load(
+        str(version_id), lambda: _load_version_payload(db, version_id), immutable=True
+    )
+
+
+def _load_version_payload(db: Session, version_id: int) -> Optional[dict]:
+    db_version = (
+        db.query(CompanyPageVersion).filter(CompanyPageVersion.id == version_id).first()
+    )
+    if not db_version:
+        return None
+
+    return {
+        "version": db_version.version,
+        "branding_config": db_version.branding_config,
+        "page_content": db_version.page_content,
+        "published_at": db_version.published_at.isoformat(),
+    }
+
+
+def get_company_public_payload(db: Session, slug: str) -> Optional[dict]:
+    """
+    Public career page payload for `slug`: the company ref merged with its
+    published snapshot. Returns None if the company does not exist.
+    """
+    ref = get_company_public_ref(db, slug)
+    if ref is None or ref["published_version_id"] is None:
+        return ref
+
+    snapshot = get_version_payload(db, ref["published_version_id"])
+    if snapshot is None:
+        return None
+    return {**ref, **snapshot}
+
+
+def prime_company_cache(db: Session, limit: int) -> int:
+    """
+    Warm the public cache for the `limit` companies with the most active jobs
+    (our best proxy for traffic). Returns the number of slugs primed.
+    """
+    if limit <= 0:
+        return 0
+
+    top_slugs = (
+        db.query(Company.slug)
+        .outerjoin(Job, (Job.company_id == Company.id) & (Job.is_active == True))
+        .group_by(Company.id, Company.slug)
+        .order_by(func.count(Job.id).desc())
+        .limit(limit)
+        .all()
+    )
+
+    for (slug,) in top_slugs:
+        get_company_public_payload(db, slug)
+    return len(top_slugs)
+
+
 def get_company_by_recruiter(
     db: Session, company_slug: str, recruiter_id: str
 ) -> Optional[Company]:
@@ -109,3 +369,37 @@ def get_all_companies_by_recruiter(db: Session, recruiter_id: str):
         .filter(Company.recruiter_id == recruiter_id)
         .all()
     )
+
+
+def get_recruiter_dashboard(db: Session, recruiter_id: str, recent_days: int = 7):
+    """
+    Every company of a recruiter with job counts, in one grouped query:
+    total / active jobs, jobs created in the last `recent_days` days, and the
+    latest change to the company or any of its jobs.
+    """
+    recent_since = datetime.now(timezone.utc) - timedelta(days=recent_days)
+    last_job_update = func.max(Job.updated_at)
+
+    return (
+        db.query(
+            Company.id,
+            Company.slug,
+            Company.company_name,
+            Company.branding_config,
+            Company.published_version_id,
+            Company.created_at,
+            func.count(Job.id).label("total_jobs"),
+            func.count(Job.id).filter(Job.is_active == True).label("active_jobs"),
+            func.count(Job.id)
+            .filter(Job.created_at >= recent_since)
+            .label("recent_jobs"),
+            func.greatest(
+                Company.updated_at, func.coalesce(last_job_update, Company.updated_at)
+            ).label("last_updated_at"),
+        )
+        .outerjoin(Job, (Job.company_id == Company.id) & Job.deleted_at.is_(None))
+        .filter(Company.recruiter_id == recruiter_id)
+        .group_by(Company.id)
+        .order_by(Company.created_at.desc())
+        .all()
+    )
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import domains
+from app.models.custom_domain import CustomDomain
+
+
+def get_domains(db: Session, company_id: int) -> List[CustomDomain]:
+    return (
+        db.query(CustomDomain)
+        .filter(CustomDomain.company_id == company_id)
+        .order_by(CustomDomain.hostname)
+        .all()
+    )
+
+
+def add_domain(db: Session, company_id: int, hostname: str) -> Optional[CustomDomain]:
+    """
+    Claim `hostname` for the company, pending verification. An unverified
+    claim of another company is taken over (it grants nothing). Returns None
+    if another company has verified it.
+    """
+    existing = db.get(CustomDomain, hostname)
+    if existing is not None:
+        if existing.company_id == company_id:
+            return existing
+        if existing.verified_at is not None:
+            return None
+        existing.company_id = company_id
+        existing.created_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(existing)
+        return existing
+
+    db_domain = CustomDomain(hostname=hostname, company_id=company_id)
+    db.add(db_domain)
+    try:
+        db.commit()
+    except IntegrityError:  # claimed concurrently
+        db.rollback()
+        return None
+    db.refresh(db_domain)
+    return db_domain
+
+
+def verify_domain(db: Session, company_id: int, hostname: str) -> Optional[CustomDomain]:
+    """
+    Check the company's TXT record for `hostname` and put the domain live if it
+    is there. Returns None if the company has no claim on `hostname`; check
+    `verified_at` on the result for the outcome.
+    """
+    db_domain = (
+        db.query(CustomDomain)
+        .filter(CustomDomain.hostname == hostname, CustomDomain.company_id == company_id)
+        .first()
+    )
+    if db_domain is None or db_domain.verified_at is not None:
+        return db_domain
+
+    # No transaction open across the DNS lookup
+    db.rollback()
+    if not domains.verify_ownership(company_id, hostname):
+        return db_domain
+
+    # Only if the claim is still ours and unverified (not taken over meanwhile)
+    verified = (
+        db.query(CustomDomain)
+        .filter(
+            CustomDomain.hostname == hostname,
+            CustomDomain.company_id == company_id,
+            CustomDomain.verified_at.is_(None),
+        )
+        .update({"verified_at": datetime.now(timezone.utc)}, synchronize_session=False)
+    )
+    db.commit()
+    if verified:
+        domains.publish_change()
+    db.refresh(db_domain)
+    return db_domain
+
+
+def remove_domain(db: Session, company_id: int, hostname: str) -> bool:
+    deleted = (
+        db.query(CustomDomain)
+        .filter(CustomDomain.hostname == hostname, CustomDomain.company_id == company_id)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    if deleted:
+        domains.publish_change()
+    return bool(deleted)
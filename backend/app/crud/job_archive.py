@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import DateTime, and_, cast, delete, func, insert, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.job_archive import ArchivedJob
+from config import settings
+
+# Columns copied between `jobs` and `jobs_archive`, matched by name.
+_JOB_COLUMNS = [column.name for column in Job.__table__.columns]
+
+
+def _stale_jobs_filter(now: datetime):
+    deleted_before = now - timedelta(days=settings.job_delete_retention_days)
+    inactive_before = now - timedelta(days=settings.job_archive_inactive_days)
+    return or_(
+        Job.deleted_at < deleted_before,
+        and_(
+            Job.is_active == False,
+            Job.deleted_at.is_(None),
+            Job.updated_at < inactive_before,
+        ),
+    )
+
+
+def archive_stale_jobs(db: Session, batch_size: int = 1000) -> int:
+    """
+    Move jobs deleted longer than the retention window, or inactive longer
+    than the idle window, from `jobs` to `jobs_archive`. Each batch is one
+    `DELETE ... RETURNING` feeding an `INSERT`, committed on its own so locks
+    stay short; rows locked by a concurrent write are skipped until next run.
+    Returns the number of jobs archived.
+    """
+    stale = _stale_jobs_filter(datetime.now(timezone.utc))
+    archived = 0
+    while True:
+        batch = (
+            select(Job.id)
+            .where(stale)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Job)
+            .where(Job.id.in_(batch.scalar_subquery()))
+            .returning(*Job.__table__.columns)
+            .cte("moved")
+        )
+        result = db.execute(
+            insert(ArchivedJob).from_select(
+                _JOB_COLUMNS, select(*[moved.c[name] for name in _JOB_COLUMNS])
+            )
+        )
+        db.commit()
+        archived += result.rowcount
+        if result.rowcount < batch_size:
+            return archived
+
+
+def list_archived_jobs(
+    db: Session, company_id: int, limit: int = 50, offset: int = 0
+) -> List:
+    """
+    Deleted and archived postings of a company, most recently removed first:
+    soft-deleted jobs still in `jobs` (no `archived_at`) and `jobs_archive` rows.
+    """
+    columns = ["id", "title", "location", "job_type", "min_salary", "max_salary",
+               "currency", "created_at", "deleted_at"]
+    pending = select(
+        *[getattr(Job, name) for name in columns],
+        cast(null(), DateTime(timezone=True)).label("archived_at"),
+    ).where(Job.company_id == company_id, Job.deleted_at.isnot(None))
+    archived = select(
+        *[getattr(ArchivedJob, name) for name in columns],
+        ArchivedJob.archived_at,
+    ).where(ArchivedJob.company_id == company_id)
+
+    removed = union_all(pending, archived).subquery()
+    return db.execute(
+        select(removed)
+        .order_by(
+            func.coalesce(removed.c.archived_at, removed.c.deleted_at).desc(),
+            removed.c.id.desc(),
+        )
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+
+def restore_job(db: Session, job_id: int, company_id: int) -> Optional[Job]:
+    """
+    Bring a deleted or archived posting of `company_id` back as an inactive job
+    (the recruiter re-activates it explicitly). Returns None if there is
+    nothing to restore.
+    """
+    db_job = (
+        db.query(Job).filter(Job.id == job_id, Job.company_id == company_id).first()
+    )
+    if db_job:
+        if db_job.deleted_at is None:
+            return None
+        db_job.deleted_at = None
+        db.commit()
+        db.refresh(db_job)
+        return db_job
+
+    # `updated_at` is reset so the archiver does not move it straight back.
+    restored_values = {
+        "is_active": literal(False),
+        "deleted_at": cast(null(), DateTime(timezone=True)),
+        "updated_at": func.now(),
+    }
+    moved = (
+        delete(ArchivedJob)
+        .where(ArchivedJob.id == job_id, ArchivedJob.company_id == company_id)
+        .returning(*[getattr(ArchivedJob, name) for name in _JOB_COLUMNS])
+        .cte("moved")
+    )
+    result = db.execute(
+        insert(Job).from_select(
+            _JOB_COLUMNS,
+            select(
+                *[restored_values.get(name, moved.c[name]) for name in _JOB_COLUMNS]
+            ),
+        )
+    )
+    db.commit()
+    if not result.rowcount:
+        return None
+    return db.get(Job, job_id)
@@ -0,0 +1,240 @@
+from typing import Optional
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.crud.locations import location_filters
+from app.models.company import Company
+from app.models.job import Job
+from app.models.job_search import JobSearchEntry
+from app.utils.singleflight import SingleFlight
+
+# Text search configuration. 'simple' does no stemming / stop words, which
+# suits job titles and place names better than a language dictionary.
+TS_CONFIG = "simple"
+
+MAX_PAGE_SIZE = 100
+
+_flight = SingleFlight()
+
+_INDEXED_COLUMNS = [
+    "job_id",
+    "company_id",
+    "company_name",
+    "company_slug",
+    "title",
+    "location",
+    "job_type",
+    "min_salary",
+    "max_salary",
+    "currency",
+    "min_salary_normalized",
+    "max_salary_normalized",
+    "place_id",
+    "latitude",
+    "longitude",
+    "geohash",
+    "is_remote",
+    "is_hybrid",
+    "description_excerpt",
+    "created_at",
+    "search_vector",
+]
+
+
+def _search_vector(title, company_name, location):
+    # Title matches outrank company name, which outranks location.
+    return (
+        func.setweight(func.to_tsvector(TS_CONFIG, title), "A")
+        .op("||")(func.setweight(func.to_tsvector(TS_CONFIG, company_name), "B"))
+        .op("||")(func.setweight(func.to_tsvector(TS_CONFIG, location), "C"))
+    )
+
+
+def _index_active_jobs(db: Session, *filters) -> None:
+    """Upsert index rows for the active jobs matching `filters`, in one statement."""
+    source = (
+        select(
+            Job.id,
+            Job.company_id,
+            Company.company_name,
+            Company.slug,
+            Job.title,
+            Job.location,
+            Job.job_type,
+            Job.min_salary,
+            Job.max_salary,
+            Job.currency,
+            Job.min_salary_normalized,
+            Job.max_salary_normalized,
+            Job.place_id,
+            Job.latitude,
+            Job.longitude,
+            Job.geohash,
+            Job.is_remote,
+            Job.is_hybrid,
+            Job.description_excerpt,
+            Job.created_at,
+            _search_vector(Job.title, Company.company_name, Job.location),
+        )
+        .join(Company, Company.id == Job.company_id)
+        .where(Job.is_active == True, *filters)
+    )
+    stmt = insert(JobSearchEntry).from_select(_INDEXED_COLUMNS, source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[JobSearchEntry.job_id],
+        set_={column: stmt.excluded[column] for column in _INDEXED_COLUMNS[1:]},
+    )
+    db.execute(stmt)
+
+
+def sync_job(db: Session, job: Job) -> None:
+    """
+    Bring the index row for `job` in line with it: upserted while the job is
+    active, removed otherwise. Call after a flush and before the commit, so the
+    index changes in the same transaction as the job.
+    """
+    if job.is_active:
+        _index_active_jobs(db, Job.id == job.id)
+    else:
+        unindex_job(db, job.id)
+
+
+def unindex_job(db: Session, job_id: int) -> None:
+    db.execute(delete(JobSearchEntry).where(JobSearchEntry.job_id == job_id))
+
+
+def rebuild_index(db: Session) -> int:
+    """(Re)index every active job and drop entries for inactive ones."""
+    db.execute(
+        delete(JobSearchEntry).where(
+            ~select(Job.id)
+            .where(Job.id == JobSearchEntry.job_id, Job.is_active == True)
+            .exists()
+        )
+    )
+    _index_active_jobs(db)
+    db.commit()
+    return db.query(func.count(JobSearchEntry.job_id)).scalar()
+
+
+def parse_cursor(cursor: Optional[str], sort: str) -> Optional[tuple]:
+    """A `next_cursor` back into a keyset position for `sort`. Raises ValueError."""
+    if not cursor:
+        return None
+    if sort == "salary":
+        salary, _, job_id = cursor.partition(".")
+        return int(salary), int(job_id)
+    return (int(cursor),)
+
+
+def search_jobs_global(
+    db: Session,
+    search: Optional[str] = None,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    min_salary: Optional[int] = None,
+    max_salary: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    sort: str = "newest",
+    near: Optional[str] = None,
+    radius_km: float = 50,
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
+) -> dict:
+    """
+    Search active jobs across all companies, newest first or by salary.
+
+    - `search`: web-search syntax (`react "senior engineer" -intern`) against
+      title, company name and location, served by the GIN index.
+    - `location`: the place it names (any spelling the gazetteer knows), else
+      a partial, case-insensitive match against job location.
+    - `near` / `radius_km`: jobs within `radius_km` of a place, via the geohash
+      index. Raises `UnknownPlace` if the gazetteer does not know `near`.
+    - `remote` / `hybrid`: the flags parsed from job locations.
+    - `min_salary` / `max_salary`: in the base currency; keep jobs whose
+      normalized range reaches at least / starts at most this amount.
+    - `sort`: "newest", or "salary" (highest normalized maximum first; jobs
+      without a comparable salary are left out).
+    - `cursor`: the `next_cursor` of the previous page (keyset pagination, so
+      deep pages cost the same as the first). Raises ValueError if malformed.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    position = parse_cursor(cursor, sort)
+    places = location_filters(JobSearchEntry, location, near, radius_km, remote, hybrid)
+    key = (
+        "global", search, location, job_type, min_salary, max_salary, sort, position, limit,
+        near, radius_km, remote, hybrid,
+    )
+    return _flight.do(
+        key,
+        lambda: _search(
+            db, search, places, job_type, min_salary, max_salary, position, limit, sort
+        ),
+    )
+
+
+def _search(
+    db, search, places, job_type, min_salary, max_salary, cursor, limit, sort="newest"
+) -> dict:
+    query = db.query(
+        JobSearchEntry.job_id.label("id"),
+        JobSearchEntry.company_name,
+        JobSearchEntry.company_slug,
+        JobSearchEntry.title,
+        JobSearchEntry.location,
+        JobSearchEntry.job_type,
+        JobSearchEntry.min_salary,
+        JobSearchEntry.max_salary,
+        JobSearchEntry.currency,
+        JobSearchEntry.min_salary_normalized,
+        JobSearchEntry.max_salary_normalized,
+        JobSearchEntry.is_remote,
+        JobSearchEntry.is_hybrid,
+        JobSearchEntry.description_excerpt,
+        JobSearchEntry.created_at,
+    )
+
+    if search:
+        query = query.filter(
+            JobSearchEntry.search_vector.op("@@")(
+                func.websearch_to_tsquery(TS_CONFIG, search)
+            )
+        )
+
+    # Location, radius and remote / hybrid (see app.crud.locations)
+    query = query.filter(*places)
+
+    if job_type:
+        query = query.filter(JobSearchEntry.job_type == job_type)
+
+    # Plain column comparisons on the precomputed base-currency values, so
+    # both bounds can use the salary indexes.
+    if min_salary is not None:
+        query = query.filter(JobSearchEntry.max_salary_normalized >= min_salary)
+
+    if max_salary is not None:
+        query = query.filter(JobSearchEntry.min_salary_normalized <= max_salary)
+
+    if sort == "salary":
+        salary = JobSearchEntry.max_salary_normalized
+        query = query.filter(salary.isnot(None))
+        if cursor is not None:
+            query = query.filter(tuple_(salary, JobSearchEntry.job_id) < cursor)
+        order = (salary.desc(), JobSearchEntry.job_id.desc())
+    else:
+        if cursor is not None:
+            query = query.filter(JobSearchEntry.job_id < cursor[0])
+        order = (JobSearchEntry.job_id.desc(),)
+
+    # Fetch one extra row to learn whether there is a next page.
+    rows = query.order_by(*order).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = (
+            f"{last.max_salary_normalized}.{last.id}" if sort == "salary" else str(last.id)
+        )
+    return {"items": rows[:limit], "next_cursor": next_cursor}
@@ -1,17 +1,31 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
-from app import schemas
+from app import idempotency, schemas
+from app.cache import jobs_cache
+from app.crud import changes
+from app.crud.job_search import sync_job, unindex_job
+from app.crud.locations import apply_location, location_filters
+from app.crud.salaries import normalize_salaries
+from app.database import run_in_session
 from app.models.job import Job
+from app.utils.rendering import render_description
+from app.utils.singleflight import SingleFlight
+
+_search_flight = SingleFlight()
 
 
 def create_job(db: Session, job_in: schemas.JobCreate, company_id: int) -> Job:
     """Create a new job posting for a company."""
+    description_html, description_excerpt = render_description(job_in.description)
     db_job = Job(
         title=job_in.title,
         location=job_in.location,
         description=job_in.description,
+        description_html=description_html,
+        description_excerpt=description_excerpt,
         job_type=job_in.job_type,
         min_salary=job_in.min_salary,
         max_salary=job_in.max_salary,
@@ -19,16 +33,49 @@ def create_job(db: Session, job_in: schemas.JobCreate, company_id: int) -> Job:
         company_id=company_id,
         is_active=True,
     )
+    apply_location(db_job)
 
     db.add(db_job)
+    db.flush()
+    normalize_salaries(db, Job.id == db_job.id)
+    sync_job(db, db_job)
+    changes.record_job_change(db, db_job, changes.CREATE)
+    idempotency.record_response(db, db_job)
     db.commit()
     db.refresh(db_job)
+    jobs_cache.invalidate(str(company_id))
     return db_job
 
 
 def get_job_by_id(db: Session, job_id: int) -> Optional[Job]:
-    """Fetch a job by ID."""
-    return db.query(Job).filter(Job.id == job_id).first()
+    """Fetch a job by ID. Description columns are loaded lazily on access."""
+    return db.query(Job).filter(Job.id == job_id, Job.deleted_at.is_(None)).first()
+
+
+def _get_live_job(db: Session, job_id: int, company_id: int) -> Optional[Job]:
+    """A job of `company_id` that has not been (soft) deleted."""
+    return (
+        db.query(Job)
+        .filter(
+            Job.id == job_id,
+            Job.company_id == company_id,
+            Job.deleted_at.is_(None),
+        )
+        .first()
+    )
+
+
+def get_public_job(db: Session, job_id: int, company_id: int) -> Optional[Job]:
+    """
+    Fetch an active job of `company_id` together with its description columns,
+    in one query. Returns None for other companies' or inactive jobs.
+    """
+    return (
+        db.query(Job)
+        .options(undefer_group("body"))
+        .filter(Job.id == job_id, Job.company_id == company_id, Job.is_active == True)
+        .first()
+    )
 
 
 def get_jobs_by_company(
@@ -38,11 +85,21 @@ def get_jobs_by_company(
     location: Optional[str] = None,
     job_type: Optional[str] = None,
     search: Optional[str] = None,
+    include_excerpt: bool = False,
+    near: Optional[str] = None,
+    radius_km: float = 50,
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
 ) -> List[Job]:
     """
     Fetch jobs for a company with optional filters.
     - `active_only`: if True, returns only active jobs.
-    - `location`: partial match against `Job.location` (case-insensitive).
+    - `include_excerpt`: also select the precomputed plain-text excerpt.
+    - `location`: the place it names (any spelling the gazetteer knows), else
+      a partial match against `Job.location` (case-insensitive).
+    - `near` / `radius_km`: jobs within `radius_km` of a place. Raises
+      `UnknownPlace` if the gazetteer does not know `near`.
+    - `remote` / `hybrid`: the flags parsed from `Job.location`.
     - `job_type`: exact match against `Job.job_type`.
     - `search`: partial match against `Job.title` (case-insensitive).
     """
@@ -57,15 +114,20 @@ def get_jobs_by_company(
         Job.job_type,
         Job.created_at,
         Job.is_active,  # Useful to include this so the frontend knows the status
-    ).filter(Job.company_id == company_id)
+        Job.is_remote,
+        Job.is_hybrid,
+    ).filter(Job.company_id == company_id, Job.deleted_at.is_(None))
+
+    if include_excerpt:
+        query = query.add_columns(Job.description_excerpt)
 
     # 2. Apply the conditional filters
     if active_only:
         query = query.filter(Job.is_active == True)
 
-    if location:
-        # case-insensitive partial match
-        query = query.filter(Job.location.ilike(f"%{location}%"))
+    query = query.filter(
+        *location_filters(Job, location, near, radius_km, remote, hybrid)
+    )
 
     if job_type:
         query = query.filter(Job.job_type == job_type)
@@ -77,13 +139,65 @@ def get_jobs_by_company(
     return query.all()
 
 
+def get_active_jobs_payload(db: Session, company_id: int) -> List[dict]:
+    """
+    Unfiltered list of active job summaries for the public career page,
+    served from the shared cache when available.
+    """
+    return jobs_cache.get_or_load(
+        str(company_id),
+        lambda: _load_active_jobs_payload(db, company_id),
+        refresh=lambda: run_in_session(_load_active_jobs_payload, company_id),
+    )
+
+
+def _load_active_jobs_payload(db: Session, company_id: int) -> List[dict]:
+    jobs = get_jobs_by_company(db, company_id, active_only=True, include_excerpt=True)
+    return [
+        schemas.JobSummaryResponse.model_validate(job).model_dump(mode="json")
+        for job in jobs
+    ]
+
+
+def search_jobs_public(
+    db: Session,
+    company_id: int,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    search: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = 50,
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
+) -> List[Job]:
+    """
+    Filtered public job search. Identical searches that arrive while one is
+    already running share its result instead of issuing their own query.
+    """
+    key = ("jobs", company_id, location, job_type, search, near, radius_km, remote, hybrid)
+    return _search_flight.do(
+        key,
+        lambda: get_jobs_by_company(
+            db,
+            company_id,
+            active_only=True,
+            location=location,
+            job_type=job_type,
+            search=search,
+            include_excerpt=True,
+            near=near,
+            radius_km=radius_km,
+            remote=remote,
+            hybrid=hybrid,
+        ),
+    )
+
+
 def update_job(
     db: Session, job_id: int, company_id: int, job_in: schemas.JobUpdate
 ) -> Optional[Job]:
     """Update a job posting (only if it belongs to the company)."""
-    db_job = (
-        db.query(Job).filter(Job.id == job_id, Job.company_id == company_id).first()
-    )
+    db_job = _get_live_job(db, job_id, company_id)
 
     if not db_job:
         return None
@@ -95,8 +209,12 @@ def update_job(
         db_job.title = job_in.title
     if getattr(job_in, "location", None) is not None:
         db_job.location = job_in.location
+        apply_location(db_job)
     if getattr(job_in, "description", None) is not None:
         db_job.description = job_in.description
+        db_job.description_html, db_job.description_excerpt = render_description(
+            job_in.description
+        )
     if getattr(job_in, "job_type", None) is not None:
         db_job.job_type = job_in.job_type
     if getattr(job_in, "min_salary", None) is not None:
@@ -106,22 +224,40 @@ def update_job(
     if getattr(job_in, "currency", None) is not None:
         db_job.currency = job_in.currency
 
+    db.flush()
+    if any(
+        getattr(job_in, field, None) is not None
+        for field in ("min_salary", "max_salary", "currency")
+    ):
+        normalize_salaries(db, Job.id == db_job.id)
+    sync_job(db, db_job)
+    # Inactive jobs are not public; their edits reach partners on re-activation.
+    if db_job.is_active:
+        changes.record_job_change(db, db_job, changes.UPDATE)
     db.commit()
     db.refresh(db_job)
+    jobs_cache.invalidate(str(company_id))
     return db_job
 
 
 def delete_job(db: Session, job_id: int, company_id: int) -> bool:
-    """Delete a job posting (only if it belongs to the company)."""
-    db_job = (
-        db.query(Job).filter(Job.id == job_id, Job.company_id == company_id).first()
-    )
+    """
+    Soft-delete a job posting (only if it belongs to the company). The row is
+    deactivated and stays restorable until the archiver moves it out of `jobs`.
+    """
+    db_job = _get_live_job(db, job_id, company_id)
 
     if not db_job:
         return False
 
-    db.delete(db_job)
+    was_active = db_job.is_active
+    db_job.is_active = False
+    db_job.deleted_at = datetime.now(timezone.utc)
+    unindex_job(db, job_id)
+    if was_active:
+        changes.record_job_change(db, db_job, changes.DELETE)
     db.commit()
+    jobs_cache.invalidate(str(company_id))
     return True
 
 
@@ -129,14 +265,21 @@ def toggle_job_active(
     db: Session, job_id: int, company_id: int, is_active: bool
 ) -> Optional[Job]:
     """Toggle job active status (only if it belongs to the company)."""
-    db_job = (
-        db.query(Job).filter(Job.id == job_id, Job.company_id == company_id).first()
-    )
+    db_job = _get_live_job(db, job_id, company_id)
 
     if not db_job:
         return None
 
+    was_active = bool(db_job.is_active)
     db_job.is_active = is_active
+    db.flush()
+    sync_job(db, db_job)
+    # To partners, deactivating is a delete and re-activating a create.
+    if is_active != was_active:
+        changes.record_job_change(
+            db, db_job, changes.CREATE if is_active else changes.DELETE
+        )
     db.commit()
     db.refresh(db_job)
+    jobs_cache.invalidate(str(company_id))
     return db_job
@@ -0,0 +1,147 @@
+import math
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.job_search import JobSearchEntry
+from app.utils import geohash
+from app.utils.gazetteer import get_gazetteer
+
+# Stored geohash length (~5 m cells); radius searches use shorter prefixes
+GEOHASH_PRECISION = 9
+MAX_RADIUS_KM = 500
+
+
+class UnknownPlace(ValueError):
+    """A `near` place the gazetteer does not know."""
+
+
+def geocode(location: str) -> dict:
+    """Column values for `location`: canonical place, coordinates, geohash, flags."""
+    parsed = get_gazetteer().parse(location)
+    place = parsed.place
+    return {
+        "place_id": place.id if place else None,
+        "latitude": place.latitude if place else None,
+        "longitude": place.longitude if place else None,
+        "geohash": (
+            geohash.encode(place.latitude, place.longitude, GEOHASH_PRECISION)
+            if place
+            else None
+        ),
+        "is_remote": parsed.is_remote,
+        "is_hybrid": parsed.is_hybrid,
+    }
+
+
+def apply_location(job: Job) -> None:
+    """Geocode `job.location` onto the job (call on create / location change)."""
+    for column, value in geocode(job.location).items():
+        setattr(job, column, value)
+
+
+def location_filters(
+    model,
+    location: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = 50,
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
+) -> List:
+    """
+    WHERE clauses for the location parameters of a job listing, against any
+    model with the geocoded columns (`Job`, `JobSearchEntry`).
+
+    - `location` resolving to a known place matches that place by id, so
+      "Bengaluru" finds jobs posted as "Bangalore"; "remote" / "hybrid" in it
+      become the flags. Unknown text falls back to a substring match.
+    - `near` + `radius_km`: geohash prefix ranges (index scans), then an exact
+      great-circle check on the few candidates. Raises UnknownPlace.
+    """
+    filters = []
+
+    if location:
+        parsed = get_gazetteer().parse(location)
+        if parsed.place is not None:
+            filters.append(model.place_id == parsed.place.id)
+        if parsed.is_remote:
+            filters.append(model.is_remote == True)
+        if parsed.is_hybrid:
+            filters.append(model.is_hybrid == True)
+        if not filters:
+            filters.append(model.location.ilike(f"%{location}%"))
+
+    if near:
+        place = get_gazetteer().lookup(near)
+        if place is None:
+            raise UnknownPlace(near)
+        radius_km = min(radius_km, MAX_RADIUS_KM)
+        cells = geohash.covering_cells(place.latitude, place.longitude, radius_km)
+        # '{' sorts right after 'z', the last geohash character (C collation)
+        filters.append(
+            or_(*[and_(model.geohash >= cell, model.geohash < cell + "{") for cell in cells])
+        )
+        filters.append(
+            _distance_km(model, place.latitude, place.longitude) <= radius_km
+        )
+
+    if remote is not None:
+        filters.append(model.is_remote == remote)
+    if hybrid is not None:
+        filters.append(model.is_hybrid == hybrid)
+
+    return filters
+
+
+def _distance_km(model, latitude: float, longitude: float):
+    """Haversine distance in SQL (evaluated only on geohash candidates)."""
+    half_dlat = (model.latitude - latitude) * (math.pi / 360)
+    half_dlon = (model.longitude - longitude) * (math.pi / 360)
+    a = func.power(func.sin(half_dlat), 2) + math.cos(math.radians(latitude)) * func.cos(
+        func.radians(model.latitude)
+    ) * func.power(func.sin(half_dlon), 2)
+    return 2 * geohash.EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+_GEOCODED_COLUMNS = ["place_id", "latitude", "longitude", "geohash", "is_remote", "is_hybrid"]
+
+
+def geocode_jobs(db: Session, batch_size: int = 1000) -> int:
+    """
+    (Re)geocode every job and its search index row, e.g. after the gazetteer
+    file was replaced, one committed batch at a time. Returns the job count.
+    """
+    last_id = 0
+    count = 0
+    while True:
+        rows = db.execute(
+            select(Job.id, Job.location, Job.updated_at)
+            .where(Job.id > last_id)
+            .order_by(Job.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return count
+        # Bulk UPDATE by primary key; updated_at kept so feeds do not republish
+        db.execute(
+            update(Job),
+            [
+                {"id": row.id, "updated_at": row.updated_at, **geocode(row.location)}
+                for row in rows
+            ],
+        )
+        db.execute(
+            update(JobSearchEntry)
+            .where(
+                JobSearchEntry.job_id == Job.id,
+                Job.id > last_id,
+                Job.id <= rows[-1].id,
+            )
+            .values({column: getattr(Job, column) for column in _GEOCODED_COLUMNS})
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        count += len(rows)
+        last_id = rows[-1].id
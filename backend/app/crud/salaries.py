@@ -0,0 +1,162 @@
+"""
+Salaries normalized to one base currency, for cross-currency filters / sorts.
+
+Job writes recompute their own row (`normalize_salaries`); when exchange rates
+change, `renormalize_salaries` rewrites the affected jobs and search index
+rows in batches. Rates come from a local JSON file:
+
+    {"base": "USD", "rates": {"EUR": "1.08", "GBP": "1.27", "INR": "0.012"}}
+
+meaning one EUR is worth 1.08 USD. `refresh_exchange_rates` (run at startup,
+then as a background task) reloads it whenever the file changes.
+"""
+import json
+import logging
+import os
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional
+
+from sqlalchemy import Integer, cast, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.exchange_rate import ExchangeRate
+from app.models.job import Job
+from app.models.job_search import JobSearchEntry
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_CURRENCY_RE = re.compile(r"^[A-Z]{3}$")
+
+# mtime of the rates file this worker last loaded
+_loaded_mtime: Optional[float] = None
+
+
+def _normalized(amount, fallback):
+    rate = (
+        select(ExchangeRate.rate)
+        .where(ExchangeRate.currency == Job.currency)
+        .scalar_subquery()
+    )
+    return cast(func.round(func.coalesce(amount, fallback) * rate), Integer)
+
+
+def normalize_salaries(db: Session, *filters) -> int:
+    """
+    Recompute `*_salary_normalized` for the jobs matching `filters` in one
+    UPDATE. Call after a flush and before `sync_job`, so the search index
+    picks the new values up in the same transaction.
+    """
+    result = db.execute(
+        update(Job)
+        .where(*filters)
+        .values(
+            min_salary_normalized=_normalized(Job.min_salary, Job.max_salary),
+            max_salary_normalized=_normalized(Job.max_salary, Job.min_salary),
+            # A rate change is not an edit: keep feeds from republishing the job
+            updated_at=Job.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def renormalize_salaries(
+    db: Session, currencies: Optional[List[str]] = None, batch_size: int = 5000
+) -> int:
+    """
+    Recompute normalized salaries of every job (or only those in `currencies`)
+    and copy them into the search index, one committed primary key range at a
+    time so row locks stay short. Returns the number of jobs updated.
+    """
+    max_id = db.query(func.max(Job.id)).scalar() or 0
+    updated = 0
+    for low in range(0, max_id, batch_size):
+        in_range = (Job.id > low, Job.id <= low + batch_size)
+        by_currency = (Job.currency.in_(currencies),) if currencies is not None else ()
+        updated += normalize_salaries(db, *in_range, *by_currency)
+        db.execute(
+            update(JobSearchEntry)
+            .where(JobSearchEntry.job_id == Job.id, *in_range, *by_currency)
+            .values(
+                min_salary_normalized=Job.min_salary_normalized,
+                max_salary_normalized=Job.max_salary_normalized,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    return updated
+
+
+def read_rates_file(path: str) -> Dict[str, Decimal]:
+    """Parse a rates file (see module docstring). Raises ValueError."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    base = settings.salary_base_currency
+    if data.get("base") != base:
+        raise ValueError(f"Rates file base is {data.get('base')!r}, expected {base!r}")
+
+    rates = {base: Decimal(1)}
+    for currency, value in data.get("rates", {}).items():
+        try:
+            rate = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(f"Invalid rate for {currency!r}: {value!r}")
+        if not _CURRENCY_RE.match(currency) or rate <= 0:
+            raise ValueError(f"Invalid rate for {currency!r}: {value!r}")
+        rates[currency] = rate
+    return rates
+
+
+def load_exchange_rates(db: Session, rates: Dict[str, Decimal]) -> List[str]:
+    """
+    Make the table match `rates`: upsert them and delete currencies no longer
+    listed. Returns the currencies that are new, changed or removed (jobs in a
+    removed currency lose their normalized salary).
+    """
+    if not rates:
+        return []
+    stmt = insert(ExchangeRate).values(
+        [{"currency": currency, "rate": rate} for currency, rate in rates.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExchangeRate.currency],
+        set_={"rate": stmt.excluded.rate, "updated_at": func.now()},
+        where=ExchangeRate.rate != stmt.excluded.rate,
+    ).returning(ExchangeRate.currency)
+    changed = [currency for (currency,) in db.execute(stmt)]
+    removed = db.execute(
+        delete(ExchangeRate)
+        .where(ExchangeRate.currency.notin_(list(rates)))
+        .returning(ExchangeRate.currency)
+    )
+    changed += [currency for (currency,) in removed]
+    db.commit()
+    return changed
+
+
+def refresh_exchange_rates(db: Session) -> int:
+    """
+    Background task: reload the rates file if it changed and renormalize the
+    jobs in currencies whose rate moved. Several workers may run this; only
+    the first to upsert a changed rate sees it as changed and does the work.
+    """
+    global _loaded_mtime
+    path = settings.exchange_rates_file
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return 0  # no rates file: normalized salaries stay as they are
+    if mtime == _loaded_mtime:
+        return 0
+
+    changed = load_exchange_rates(db, read_rates_file(path))
+    _loaded_mtime = mtime
+    if not changed:
+        return 0
+    updated = renormalize_salaries(db, changed)
+    logger.info("Exchange rates changed for %s; renormalized %s jobs", changed, updated)
+    return updated
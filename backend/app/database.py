@@ -1,35 +1,268 @@
+import hashlib
+import itertools
 import os
-from typing import Generator
+import threading
+import time
+from typing import Dict, Generator, List, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+
+from config import settings
 
 # Load environment variables from .env at startup
 load_dotenv()
 
 # Direct connection to Supabase Postgres (port 5432) with SSL required
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_CONNECTION_STRING","")
-if SQLALCHEMY_DATABASE_URL is None:
-    raise RuntimeError(
-        f"Database configuration incomplete. Missing:. "
-        "Ensure .env is populated with USER, PASSWORD, HOST, PORT, DBNAME."
-    )
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_CONNECTION_STRING", "")
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"sslmode": "require"},
-)
+# The engine is created lazily (see `init_engine`) so importing the app never
+# opens a network connection. The FastAPI lifespan in `main.py` initialises it.
+engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 
-def get_db() -> Generator:
-    """FastAPI dependency to provide a scoped DB session."""
+def init_engine() -> Engine:
+    """Create the engine on first use and bind `SessionLocal` to it."""
+    global engine
+    if engine is not None:
+        return engine
+
+    with _engine_lock:
+        if engine is None:
+            if not SQLALCHEMY_DATABASE_URL:
+                raise RuntimeError(
+                    "Database configuration incomplete. "
+                    "Ensure .env is populated with DATABASE_CONNECTION_STRING."
+                )
+            engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+            SessionLocal.configure(bind=engine)
+            replicas.configure(
+                [_create_engine(url) for url in settings.database_replica_urls]
+            )
+    return engine
+
+
+def _create_engine(url: str) -> Engine:
+    return create_engine(
+        url,
+        connect_args={"sslmode": "require"},
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections (called on application shutdown)."""
+    global engine
+    with _engine_lock:
+        if engine is not None:
+            engine.dispose()
+            engine = None
+        replicas.dispose()
+
+
+class ReplicaSet:
+    """
+    Round-robin over read replica engines. A replica that fails to hand out
+    a connection is skipped for `retry_seconds` before being tried again.
+    """
+
+    def __init__(self, retry_seconds: int):
+        self.retry_seconds = retry_seconds
+        self._engines: List[Engine] = []
+        self._unhealthy_until: Dict[int, float] = {}
+        self._cycle = itertools.cycle([])
+        self._lock = threading.Lock()
+
+    def configure(self, engines: List[Engine]) -> None:
+        with self._lock:
+            self._reset(engines)
+
+    def dispose(self) -> None:
+        with self._lock:
+            for replica in self._engines:
+                replica.dispose()
+            self._reset([])
+
+    def _reset(self, engines: List[Engine]) -> None:
+        self._engines = engines
+        self._unhealthy_until = {}
+        self._cycle = itertools.cycle(range(len(engines)))
+
+    def healthy(self) -> List[int]:
+        """Indexes of replicas currently eligible, in round-robin order."""
+        now = time.monotonic()
+        with self._lock:
+            count = len(self._engines)
+            order = [next(self._cycle) for _ in range(count)]
+            return [i for i in order if self._unhealthy_until.get(i, 0) <= now]
+
+    def engine_at(self, index: int) -> Engine:
+        return self._engines[index]
+
+    def mark_unhealthy(self, index: int) -> None:
+        with self._lock:
+            self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+
+    def status(self) -> List[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "index": i,
+                    "healthy": self._unhealthy_until.get(i, 0) <= now,
+                }
+                for i in range(len(self._engines))
+            ]
+
+
+class ReadYourWrites:
+    """
+    Remembers clients that recently wrote so their reads go to the primary
+    until replicas have had time to catch up. Clients are keyed by a hash of
+    their bearer token. State is per process.
+    """
+
+    def __init__(self, window_seconds: int):
+        self.window_seconds = window_seconds
+        self._until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, key: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) > 10_000:
+                self._until = {k: v for k, v in self._until.items() if v > now}
+            self._until[key] = now + self.window_seconds
+
+    def is_sticky(self, key: str) -> bool:
+        with self._lock:
+            until = self._until.get(key)
+        return until is not None and until > time.monotonic()
+
+
+replicas = ReplicaSet(retry_seconds=settings.replica_retry_seconds)
+read_your_writes = ReadYourWrites(window_seconds=settings.read_your_writes_seconds)
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _client_key(request: Request) -> Optional[str]:
+    auth = request.headers.get("authorization")
+    if not auth:
+        return None
+    return hashlib.sha256(auth.encode()).hexdigest()
+
+
+def _open_replica_session() -> Optional[Session]:
+    """Session on the next healthy replica, or None if none can connect."""
+    for index in replicas.healthy():
+        db = SessionLocal(bind=replicas.engine_at(index))
+        try:
+            # Check out a connection now so a dead replica fails here,
+            # not halfway through the request.
+            db.connection()
+            return db
+        except OperationalError:
+            db.close()
+            replicas.mark_unhealthy(index)
+    return None
+
+
+def warm_pool(connections: int) -> int:
+    """
+    Pre-fill the connection pool by checking out `connections` connections
+    at once and returning them. Returns how many were opened successfully.
+    """
+    db_engine = init_engine()
+    opened = []
+    try:
+        for _ in range(min(connections, settings.db_pool_size)):
+            conn = db_engine.connect()
+            conn.execute(text("SELECT 1"))
+            opened.append(conn)
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+def pool_status() -> dict:
+    """Snapshot of the connection pool for readiness reporting."""
+    if engine is None:
+        return {"initialized": False}
+
+    pool = engine.pool
+    status = {"initialized": True}
+    # QueuePool exposes these counters; other pool classes may not.
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            status[name] = counter()
+    return status
+
+
+def check_database() -> None:
+    """Run a trivial query against the primary; raises if unreachable."""
+    if engine is None:
+        raise RuntimeError("Database engine not initialized")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def run_in_session(fn, *args):
+    """Call `fn(db, *args)` with a fresh primary session (for background work)."""
+    init_engine()
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def get_db_write(request: Request) -> Generator:
+    """FastAPI dependency to provide a scoped DB session on the primary."""
+    init_engine()
+    if request.method not in _SAFE_METHODS:
+        client_key = _client_key(request)
+        if client_key:
+            read_your_writes.mark(client_key)
+
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+
+def get_db_read(request: Request) -> Generator:
+    """
+    FastAPI dependency for read-only public routes. Uses a replica when one
+    is configured and healthy, otherwise falls back to the primary. Clients
+    that wrote within the last few seconds stay on the primary.
+    """
+    init_engine()
+    db = None
+    client_key = _client_key(request)
+    if not (client_key and read_your_writes.is_sticky(client_key)):
+        db = _open_replica_session()
+    if db is None:
+        db = SessionLocal()
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Backwards-compatible name for the read-write dependency.
+get_db = get_db_write
@@ -1,4 +1,3 @@
-from app.database import get_db
-
-__all__ = ["get_db"]
+from app.database import get_db, get_db_read, get_db_write
 
+__all__ = ["get_db", "get_db_read", "get_db_write"]
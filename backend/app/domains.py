@@ -0,0 +1,108 @@
+"""
+Custom domains: Host header -> company slug.
+
+Every worker keeps the whole map in memory. It is loaded at startup, reloaded
+in every worker when a domain is added or removed (through the cache
+invalidation channel) and, as a safety net, on a timer. Resolving a host is a
+dict lookup, so domain-routed requests add no database round trip.
+
+Only verified domains are in the map: a company proves it controls a domain
+by publishing a TXT record (see `CustomDomain.verification_record`).
+"""
+import logging
+from typing import Dict, Optional, Set
+from urllib.parse import urlsplit
+
+from sqlalchemy.orm import Session
+
+from app import cache, database
+from app.models.company import Company
+from app.models.custom_domain import CustomDomain, verification_record_name, verification_value
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_NAMESPACE = "domains"
+
+
+class HostMap:
+    """hostname -> company slug. Reads take no lock: `replace` swaps the dict."""
+
+    def __init__(self):
+        self._hosts: Dict[str, str] = {}
+
+    def resolve(self, host: str) -> Optional[str]:
+        return self._hosts.get(host)
+
+    def replace(self, hosts: Dict[str, str]) -> None:
+        self._hosts = hosts
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+
+host_map = HostMap()
+
+
+def normalize_host(value: str) -> str:
+    """`Careers.Acme.com:443.` -> `careers.acme.com` (IPv6 literals kept whole)."""
+    host = value.strip().lower()
+    if host.startswith("["):
+        return host.split("]", 1)[0] + "]"
+    return host.split(":", 1)[0].rstrip(".")
+
+
+def platform_hosts() -> Set[str]:
+    hosts = set(settings.platform_hosts)
+    for url in (settings.site_base_url, settings.feeds_base_url, settings.media_base_url):
+        host = urlsplit(url).hostname
+        if host:
+            hosts.add(host)
+    return hosts
+
+
+def is_platform_host(host: str) -> bool:
+    """`host` is, or is under, one of the platform's own hostnames."""
+    return any(host == own or host.endswith("." + own) for own in platform_hosts())
+
+
+def verify_ownership(company_id: int, hostname: str) -> bool:
+    """Whether `hostname` publishes the TXT record for `company_id`."""
+    import dns.exception  # dnspython; only needed here
+    import dns.resolver
+
+    expected = verification_value(company_id, hostname)
+    try:
+        answer = dns.resolver.resolve(verification_record_name(hostname), "TXT", lifetime=5)
+    except dns.exception.DNSException:
+        return False
+    return any(
+        b"".join(record.strings).decode("ascii", "replace") == expected for record in answer
+    )
+
+
+def load_host_map(db: Session) -> int:
+    rows = (
+        db.query(CustomDomain.hostname, Company.slug)
+        .join(Company, Company.id == CustomDomain.company_id)
+        .filter(CustomDomain.verified_at.isnot(None))
+    )
+    host_map.replace({hostname: slug for hostname, slug in rows})
+    return len(host_map)
+
+
+def _reload(_key: str = "") -> None:
+    try:
+        database.run_in_session(load_host_map)
+    except Exception:
+        logger.exception("Could not reload the custom domain map")
+
+
+def start_listener() -> None:
+    """Reload the map whenever any worker calls `publish_change`."""
+    cache.add_invalidation_listener(_NAMESPACE, _reload)
+
+
+def publish_change() -> None:
+    """Tell every worker (this one included) to reload; call after the commit."""
+    cache.publish_invalidation(_NAMESPACE)
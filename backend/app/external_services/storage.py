@@ -0,0 +1,47 @@
+import os
+import shutil
+from typing import Optional
+
+from config import settings
+
+
+class LocalStorage:
+    """
+    Content-addressed file storage on local disk, served under
+    `settings.media_base_url`. Keys look like `<sha256>/<name>`; since a key's
+    content never changes, files can be cached by browsers and CDNs forever.
+
+    Swap for an object-store client (S3, GCS, Supabase Storage) exposing the
+    same methods to serve media from a bucket instead.
+    """
+
+    def __init__(self, root: str, base_url: str):
+        self.root = root
+        self.base_url = base_url
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def put_file(self, key: str, source_path: str) -> None:
+        """Move a finished temp file into place (atomic on the same filesystem)."""
+        target = self.path(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(source_path, target)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def key_from_url(self, url: Optional[str]) -> Optional[str]:
+        if not url or not url.startswith(self.base_url + "/"):
+            return None
+        return url[len(self.base_url) + 1 :]
+
+
+storage = LocalStorage(settings.media_root, settings.media_base_url)
+
+# Candidate resumes. Private: not mounted, served only through authenticated
+# endpoints, so `url()` is never used for it.
+resume_storage = LocalStorage(settings.resume_root, "")
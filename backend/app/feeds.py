@@ -0,0 +1,333 @@
+"""
+SEO feeds: sharded `sitemap.xml` files and schema.org `JobPosting` JSON-LD.
+
+Files are written under `settings.feeds_root` and served statically from
+`/feeds`. Regeneration is incremental: only shards / companies touched since
+the last run are rewritten.
+
+- Job sitemap shards hold the jobs whose id falls in
+  `[n * SHARD_SIZE, (n + 1) * SHARD_SIZE)`, so a job mutation dirties
+  exactly one shard. Company career pages get their own shards the same way.
+- A shard (or company JSON-LD file) is dirty when a job / company in it has
+  `updated_at` past the stored high-water mark, or when its active job count
+  changed (which catches hard deletes, which leave no `updated_at` behind).
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, Optional, Set
+from xml.sax.saxutils import escape
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session, undefer_group
+
+from app.models.company import Company
+from app.models.job import Job, JobType
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+SHARD_SIZE = 50_000
+STATE_FILE = "state.json"
+# Re-scan this far behind the high-water mark: rows committed late by
+# long transactions may carry an `updated_at` older than the mark.
+HIGH_WATER_OVERLAP = timedelta(minutes=1)
+# pg_try_advisory_xact_lock key so only one worker regenerates at a time
+ADVISORY_LOCK_KEY = 736_251_001
+
+_SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_SITEMAP_FOOTER = "</urlset>\n"
+
+_EMPLOYMENT_TYPES = {
+    JobType.FULL_TIME: "FULL_TIME",
+    JobType.PART_TIME: "PART_TIME",
+    JobType.CONTRACT: "CONTRACTOR",
+    JobType.INTERNSHIP: "INTERN",
+}
+
+
+# --- Files ---
+
+
+def _path(*parts: str) -> str:
+    return os.path.join(settings.feeds_root, *parts)
+
+
+def _write_atomic(path: str, chunks: Iterable[str]) -> None:
+    """Stream `chunks` to a temp file and swap it in, so readers never see half a file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for chunk in chunks:
+            out.write(chunk)
+    os.replace(tmp_path, path)
+
+
+def _load_state() -> dict:
+    try:
+        with open(_path(STATE_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_state(state: dict) -> None:
+    _write_atomic(_path(STATE_FILE), [json.dumps(state)])
+
+
+# --- URLs ---
+
+
+def career_page_url(slug: str) -> str:
+    return f"{settings.site_base_url}/{slug}/careers"
+
+
+def job_page_url(slug: str, job_id: int) -> str:
+    return f"{settings.site_base_url}/{slug}/jobs/{job_id}"
+
+
+def _url_entry(loc: str, lastmod: datetime) -> str:
+    return (
+        f"<url><loc>{escape(loc)}</loc>"
+        f"<lastmod>{lastmod.date().isoformat()}</lastmod></url>\n"
+    )
+
+
+# --- Generators ---
+
+
+def _job_shard_xml(db: Session, shard: int) -> Iterator[str]:
+    yield _SITEMAP_HEADER
+    rows = (
+        db.query(Job.id, Job.updated_at, Company.slug)
+        .join(Company, Company.id == Job.company_id)
+        .filter(
+            Job.is_active == True,
+            Job.id >= shard * SHARD_SIZE,
+            Job.id < (shard + 1) * SHARD_SIZE,
+        )
+        .order_by(Job.id)
+        .yield_per(1000)
+    )
+    for job_id, updated_at, slug in rows:
+        yield _url_entry(job_page_url(slug, job_id), updated_at)
+    yield _SITEMAP_FOOTER
+
+
+def _company_shard_xml(db: Session, shard: int) -> Iterator[str]:
+    yield _SITEMAP_HEADER
+    rows = (
+        db.query(Company.slug, Company.updated_at)
+        .filter(
+            Company.id >= shard * SHARD_SIZE,
+            Company.id < (shard + 1) * SHARD_SIZE,
+        )
+        .order_by(Company.id)
+        .yield_per(1000)
+    )
+    for slug, updated_at in rows:
+        yield _url_entry(career_page_url(slug), updated_at)
+    yield _SITEMAP_FOOTER
+
+
+def job_posting_jsonld(job: Job, company: Company) -> dict:
+    """schema.org JobPosting for one job."""
+    posting = {
+        "@context": "https://schema.org/",
+        "@type": "JobPosting",
+        "title": job.title,
+        "description": job.description_html or job.description,
+        "datePosted": job.created_at.date().isoformat(),
+        "employmentType": _EMPLOYMENT_TYPES.get(job.job_type, "OTHER"),
+        "hiringOrganization": {
+            "@type": "Organization",
+            "name": company.company_name,
+            "sameAs": career_page_url(company.slug),
+        },
+        "jobLocation": {
+            "@type": "Place",
+            "address": {"@type": "PostalAddress", "addressLocality": job.location},
+        },
+        "url": job_page_url(company.slug, job.id),
+        "identifier": {
+            "@type": "PropertyValue",
+            "name": company.company_name,
+            "value": str(job.id),
+        },
+    }
+    if job.min_salary is not None or job.max_salary is not None:
+        value = {"@type": "QuantitativeValue", "unitText": "YEAR"}
+        if job.min_salary is not None:
+            value["minValue"] = job.min_salary
+        if job.max_salary is not None:
+            value["maxValue"] = job.max_salary
+        posting["baseSalary"] = {
+            "@type": "MonetaryAmount",
+            "currency": job.currency,
+            "value": value,
+        }
+    return posting
+
+
+def _company_jsonld(db: Session, company: Company) -> Iterator[str]:
+    jobs = (
+        db.query(Job)
+        .options(undefer_group("body"))
+        .filter(Job.company_id == company.id, Job.is_active == True)
+        .order_by(Job.id)
+        .yield_per(500)
+    )
+    yield "["
+    for index, job in enumerate(jobs):
+        if index:
+            yield ","
+        yield json.dumps(job_posting_jsonld(job, company))
+    yield "]\n"
+
+
+def _sitemap_index(job_shards: Iterable[int], company_shards: Iterable[int]) -> Iterator[str]:
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    )
+    files = [f"sitemap-jobs-{n}.xml" for n in sorted(job_shards)]
+    files += [f"sitemap-companies-{n}.xml" for n in sorted(company_shards)]
+    for name in files:
+        lastmod = datetime.fromtimestamp(os.path.getmtime(_path(name)))
+        yield (
+            f"<sitemap><loc>{escape(settings.feeds_base_url + '/' + name)}</loc>"
+            f"<lastmod>{lastmod.date().isoformat()}</lastmod></sitemap>\n"
+        )
+    yield "</sitemapindex>\n"
+
+
+# --- Incremental regeneration ---
+
+
+def _counts(db: Session, key_column, *filters) -> Dict[str, int]:
+    rows = db.query(key_column, func.count()).filter(*filters).group_by(key_column)
+    return {str(key): count for key, count in rows}
+
+
+def regenerate_feeds(db: Session, full: bool = False) -> dict:
+    """
+    Rewrite the sitemap shards and JSON-LD files that changed since the last
+    run (or all of them with `full=True`). Returns a summary of what was written.
+    """
+    state = {} if full else _load_state()
+    previous_mark: Optional[datetime] = (
+        datetime.fromisoformat(state["high_water"]) if state.get("high_water") else None
+    )
+
+    # Take the new mark before scanning so nothing slips between the two.
+    new_mark = max(
+        filter(
+            None,
+            [
+                db.query(func.max(Job.updated_at)).scalar(),
+                db.query(func.max(Company.updated_at)).scalar(),
+            ],
+        ),
+        default=None,
+    )
+
+    job_shard_key = (Job.id // SHARD_SIZE).label("shard")
+    company_shard_key = (Company.id // SHARD_SIZE).label("shard")
+    job_shard_counts = _counts(db, job_shard_key, Job.is_active == True)
+    company_job_counts = _counts(db, Job.company_id, Job.is_active == True)
+    company_shard_counts = _counts(db, company_shard_key)
+
+    if previous_mark is None:
+        dirty_job_shards: Set[str] = set(job_shard_counts)
+        dirty_companies: Set[str] = {
+            str(company_id) for (company_id,) in db.query(Company.id)
+        }
+        dirty_company_shards: Set[str] = set(company_shard_counts)
+    else:
+        since = previous_mark - HIGH_WATER_OVERLAP
+        changed_jobs = (
+            db.query(job_shard_key, Job.company_id)
+            .filter(Job.updated_at > since)
+            .distinct()
+            .all()
+        )
+        changed_companies = (
+            db.query(company_shard_key, Company.id)
+            .filter(Company.updated_at > since)
+            .all()
+        )
+        dirty_job_shards = {str(shard) for shard, _ in changed_jobs}
+        dirty_companies = {str(company_id) for _, company_id in changed_jobs}
+        dirty_companies |= {str(company_id) for _, company_id in changed_companies}
+        dirty_company_shards = {str(shard) for shard, _ in changed_companies}
+
+        # Count changes catch deletes, which leave no updated_at behind.
+        for current, previous, dirty in (
+            (job_shard_counts, state.get("job_shards", {}), dirty_job_shards),
+            (company_job_counts, state.get("company_jobs", {}), dirty_companies),
+            (company_shard_counts, state.get("company_shards", {}), dirty_company_shards),
+        ):
+            for key in set(current) | set(previous):
+                if current.get(key, 0) != previous.get(key, 0):
+                    dirty.add(key)
+
+    for shard in dirty_job_shards:
+        _write_atomic(_path(f"sitemap-jobs-{shard}.xml"), _job_shard_xml(db, int(shard)))
+    for shard in dirty_company_shards:
+        _write_atomic(
+            _path(f"sitemap-companies-{shard}.xml"), _company_shard_xml(db, int(shard))
+        )
+
+    dirty_ids = [int(company_id) for company_id in dirty_companies]
+    for company in db.query(Company).filter(Company.id.in_(dirty_ids)):
+        _write_atomic(_path("jsonld", f"{company.slug}.json"), _company_jsonld(db, company))
+
+    if dirty_job_shards or dirty_company_shards or previous_mark is None:
+        _write_atomic(
+            _path("sitemap.xml"),
+            _sitemap_index(
+                [int(shard) for shard in job_shard_counts],
+                [int(shard) for shard in company_shard_counts],
+            ),
+        )
+
+    mark = new_mark or previous_mark
+    _save_state(
+        {
+            "high_water": mark.isoformat() if mark else None,
+            "job_shards": job_shard_counts,
+            "company_jobs": company_job_counts,
+            "company_shards": company_shard_counts,
+        }
+    )
+
+    return {
+        "job_shards": len(dirty_job_shards),
+        "company_shards": len(dirty_company_shards),
+        "companies": len(dirty_companies),
+    }
+
+
+def refresh_feeds(db: Session) -> Optional[dict]:
+    """
+    Incremental regeneration guarded by a Postgres advisory lock, so with
+    several workers only one does the work. Returns None if another holds it.
+
+    The lock is transaction-scoped: ending the transaction releases it even
+    when regeneration fails, so a pooled connection never keeps it.
+    """
+    try:
+        locked = db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            return None
+        summary = regenerate_feeds(db)
+        logger.info("Feeds refreshed: %s", summary)
+        return summary
+    finally:
+        db.rollback()  # read-only work; releases the lock
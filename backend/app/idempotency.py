@@ -0,0 +1,205 @@
+"""
+Idempotency keys for create endpoints.
+
+A client that may retry a POST sends `Idempotency-Key: <unique value>`. The
+first request with a key claims it in `idempotency_keys`, runs, and stores its
+response there in the same transaction as the create (the create calls
+`record_response` just before its commit), so a crash can never leave a
+created row without its stored response; a retry gets the stored response
+back without running anything. A duplicate that arrives while the first is still running waits for
+it: on a single-flight inside a worker, by polling the claim across workers.
+Completed responses are also held in a per-worker TTL cache, so most retries
+never reach the database.
+"""
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.cache import TTLCache
+from app.models.idempotency import IdempotencyKey
+from app.utils.singleflight import SingleFlight
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# (fingerprint, status_code, response body)
+Stored = Tuple[str, int, Any]
+
+_POLL_SECONDS = 0.1
+
+# Session.info key of the request `record_response` stores a response for
+_PENDING = "idempotency_pending"
+
+_responses = TTLCache(ttl_seconds=settings.idempotency_cache_seconds, max_entries=10_000)
+_flight = SingleFlight()
+
+
+def request_fingerprint(request, payload) -> str:
+    """Identifies what was asked for, so a key cannot be replayed for another request."""
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode())
+    digest.update(payload.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def idempotent(
+    db: Session,
+    key: str,
+    scope: str,
+    fingerprint: str,
+    execute: Callable[[], Any],
+    response_model,
+    status_code: int = status.HTTP_201_CREATED,
+):
+    """
+    Run `execute()` at most once per (`scope`, `key`) and respond with its
+    result serialized through `response_model`. Repeats get the first response
+    back, marked `Idempotent-Replayed: true`. Without a key this is just
+    `execute()`.
+    """
+    if not key:
+        return execute()
+
+    cache_key = (scope, key)
+    executed = []
+
+    def run() -> Stored:
+        executed.append(True)
+        return _run_once(db, scope, key, fingerprint, execute, response_model, status_code)
+
+    stored = _responses.get(cache_key)
+    if stored is None:
+        stored = _flight.do(cache_key, run)
+        _responses.set(cache_key, stored)
+
+    stored_fingerprint, stored_status, body = stored
+    if stored_fingerprint != fingerprint:
+        raise _key_reused()
+    headers = None if executed else {"Idempotent-Replayed": "true"}
+    return JSONResponse(body, status_code=stored_status, headers=headers)
+
+
+def _run_once(
+    db: Session,
+    scope: str,
+    key: str,
+    fingerprint: str,
+    execute: Callable[[], Any],
+    response_model,
+    status_code: int,
+) -> Stored:
+    match = (IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+
+    while not _claim(db, scope, key, fingerprint):
+        row = db.execute(
+            select(
+                IdempotencyKey.fingerprint,
+                IdempotencyKey.status_code,
+                IdempotencyKey.response_body,
+            ).where(*match)
+        ).first()
+        db.rollback()
+        if row is None:
+            continue  # the holder failed and released it; claim it ourselves
+        if row.status_code is not None:
+            return row.fingerprint, row.status_code, row.response_body
+        if row.fingerprint != fingerprint:
+            raise _key_reused()
+        # Another worker is running this request right now. It either finishes,
+        # or its claim outlives the lease and the next _claim takes it over.
+        time.sleep(_POLL_SECONDS)
+
+    # Hold the claim's row lock for the whole create: a takeover (_claim) of a
+    # slow but live request blocks on it instead of running the create twice,
+    # and sees the stored response once the create commits.
+    db.execute(select(IdempotencyKey.key).where(*match).with_for_update())
+    pending = {"match": match, "response_model": response_model, "status_code": status_code}
+    db.info[_PENDING] = pending
+    try:
+        result = execute()
+    except BaseException:
+        db.rollback()
+        try:
+            db.execute(delete(IdempotencyKey).where(*match))
+            db.commit()
+        except Exception:
+            logger.warning("Could not release idempotency key %r", key, exc_info=True)
+        raise
+    finally:
+        db.info.pop(_PENDING, None)
+
+    if "body" not in pending:
+        # `execute` did not call record_response; store it after the fact.
+        pending["body"] = response_model.model_validate(result).model_dump(mode="json")
+        db.execute(
+            update(IdempotencyKey)
+            .where(*match)
+            .values(status_code=status_code, response_body=pending["body"])
+        )
+        db.commit()
+    return fingerprint, status_code, pending["body"]
+
+
+def record_response(db: Session, obj) -> None:
+    """
+    Store the response for `obj` on the idempotency key being executed, if
+    any. Creates call this after their flush and right before their commit,
+    so the key is completed atomically with the row it describes.
+    """
+    pending = db.info.get(_PENDING)
+    if pending is None:
+        return
+    db.refresh(obj)  # server defaults (id, created_at, ...) as the client sees them
+    body = pending["response_model"].model_validate(obj).model_dump(mode="json")
+    db.execute(
+        update(IdempotencyKey)
+        .where(*pending["match"])
+        .values(status_code=pending["status_code"], response_body=body)
+    )
+    pending["body"] = body
+
+
+def _claim(db: Session, scope: str, key: str, fingerprint: str) -> bool:
+    """
+    Take the key: insert it, or take over a claim whose holder has been gone
+    longer than the lease (a worker that died mid-request). Completed keys are
+    never taken over.
+    """
+    lease_expired = IdempotencyKey.locked_at < func.now() - timedelta(
+        seconds=settings.idempotency_lease_seconds
+    )
+    stmt = insert(IdempotencyKey).values(scope=scope, key=key, fingerprint=fingerprint)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IdempotencyKey.scope, IdempotencyKey.key],
+        set_={"fingerprint": stmt.excluded.fingerprint, "locked_at": func.now()},
+        where=IdempotencyKey.status_code.is_(None)
+        & (IdempotencyKey.fingerprint == stmt.excluded.fingerprint)
+        & lease_expired,
+    ).returning(IdempotencyKey.key)
+    claimed = db.execute(stmt).first() is not None
+    db.commit()
+    return claimed
+
+
+def _key_reused() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Idempotency-Key was already used for a different request",
+    )
+
+
+def purge_expired_keys(db: Session) -> int:
+    """Forget keys older than `idempotency_key_ttl_hours`."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.idempotency_key_ttl_hours)
+    deleted = db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+    ).rowcount
+    db.commit()
+    return deleted
@@ -0,0 +1 @@
+# ASGI middleware (admission control, routing, etc.)
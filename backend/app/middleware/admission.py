@@ -0,0 +1,244 @@
+import json
+import logging
+import math
+import re
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tenant slug for the public routes: /api/{slug}/jobs... and /api/companies/{slug}/...
+_JOBS_PATH_RE = re.compile(r"^/api/([^/]+)/jobs(?:/|$)")
+_COMPANY_PATH_RE = re.compile(r"^/api/companies/([^/]+)/")
+
+_EXEMPT_PATHS = ("/health", "/api/health")
+
+# Public (unauthenticated) API routes, the only ones the token buckets apply
+# to. Static files (/media, /feeds) and recruiter routes, which need a valid
+# token, are only subject to the in-flight cap.
+_PUBLIC_ROUTES = (
+    ("GET", re.compile(r"^/api/jobs/search$")),
+    ("GET", re.compile(r"^/api/[^/]+/jobs/?$")),
+    ("GET", re.compile(r"^/api/[^/]+/jobs/\d+$")),
+    ("POST", re.compile(r"^/api/[^/]+/jobs/\d+/(?:apply|apply-click)$")),
+    ("GET", re.compile(r"^/api/companies/[^/]+/careers$")),
+    ("GET", re.compile(r"^/api/changes/?$")),
+)
+
+# Routes whose every request runs a query: the global job search never goes
+# through the cache.
+_SEARCH_PATHS = ("/api/jobs/search",)
+# Routes served from the cache only without a query string; any filter
+# (search, location, near / radius, remote, salary, ...) runs a query instead.
+_LISTING_PATH_RE = re.compile(r"^/api/[^/]+/jobs/?$")
+
+
+_warned_untrusted_proxy = False
+
+
+def client_ip(scope) -> str:
+    """Client address, from X-Forwarded-For only when configured to trust it."""
+    global _warned_untrusted_proxy
+    for name, value in scope["headers"]:
+        if name != b"x-forwarded-for":
+            continue
+        if settings.trust_forwarded_for:
+            # The entry our proxy appended; earlier ones are client-supplied.
+            return value.decode("latin-1").split(",")[-1].strip()
+        if not _warned_untrusted_proxy:
+            _warned_untrusted_proxy = True
+            logger.warning(
+                "Requests arrive through a proxy (X-Forwarded-For) but "
+                "TRUST_FORWARDED_FOR is off: every client shares the proxy's "
+                "rate limit bucket. Set TRUST_FORWARDED_FOR=True behind a load balancer."
+            )
+        break
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def is_public_route(method: str, path: str) -> bool:
+    return any(
+        method == route_method and pattern.match(path)
+        for route_method, pattern in _PUBLIC_ROUTES
+    )
+
+
+class MemoryRateLimiter:
+    """Token buckets held in this worker's memory."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, last update, time the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+
+    async def acquire(self, key: str, rate: float, burst: int, cost: int) -> float:
+        """Take `cost` tokens. Returns 0 if allowed, else seconds until allowed."""
+        now = time.monotonic()
+        tokens, last, _ = self._buckets.get(key, (float(burst), now, now))
+        tokens = min(float(burst), tokens + (now - last) * rate)
+
+        if len(self._buckets) >= self.max_keys and key not in self._buckets:
+            self._prune(now)
+
+        if tokens >= cost:
+            tokens -= cost
+            wait = 0.0
+        else:
+            wait = (cost - tokens) / rate
+        self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+        return wait
+
+    def _prune(self, now: float) -> None:
+        # Buckets that have refilled carry no state worth keeping. Each bucket
+        # knows when that is: IP and tenant buckets refill at different rates.
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items() if bucket[2] > now
+        }
+
+
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter:
+    """Token buckets shared by all workers, updated atomically by a Lua script."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis_asyncio  # optional dependency
+
+        self._client = redis_asyncio.Redis.from_url(url, decode_responses=True)
+        self._script = self._client.register_script(_TOKEN_BUCKET_LUA)
+        self._fallback = MemoryRateLimiter()
+
+    async def acquire(self, key: str, rate: float, burst: int, cost: int) -> float:
+        try:
+            wait = await self._script(
+                keys=[f"ratelimit:{key}"], args=[rate, burst, time.time(), cost]
+            )
+            return float(wait)
+        except Exception:
+            # Shared store unavailable: keep limiting per worker instead of failing.
+            logger.warning("Shared rate limiter unavailable", exc_info=True)
+            return await self._fallback.acquire(key, rate, burst, cost)
+
+
+def create_rate_limiter():
+    if settings.rate_limit_backend == "redis" and settings.redis_url:
+        return RedisRateLimiter(settings.redis_url)
+    return MemoryRateLimiter()
+
+
+class AdmissionControlMiddleware:
+    """
+    Rejects work the database cannot absorb before it reaches a route.
+
+    - Per client IP and per tenant slug token buckets on the public API
+      routes -> 429 + Retry-After. Searches (routes or filters that skip the cache) cost more tokens.
+    - A per-worker cap on in-flight requests sized to the DB pool -> 503 +
+      Retry-After, so overload is shed immediately instead of queueing on
+      pool checkout.
+    """
+
+    def __init__(self, app, limiter=None, max_concurrent: Optional[int] = None):
+        self.app = app
+        self.limiter = limiter or create_rate_limiter()
+        self.max_concurrent = max_concurrent or settings.max_concurrent_requests
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith(_EXEMPT_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        if is_public_route(scope["method"], path):
+            retry_after = await self._acquire(scope, path)
+            if retry_after:
+                await self._reject(send, 429, "Too many requests", retry_after)
+                return
+
+        if self.in_flight >= self.max_concurrent:
+            await self._reject(send, 503, "Server busy, please retry", 1)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    async def _acquire(self, scope, path: str) -> float:
+        cost = self._cost(scope)
+        retry_after = await self.limiter.acquire(
+            f"ip:{client_ip(scope)}",
+            settings.rate_limit_ip_rate,
+            settings.rate_limit_ip_burst,
+            cost,
+        )
+        if not retry_after:
+            slug = self._tenant_slug(path)
+            if slug:
+                retry_after = await self.limiter.acquire(
+                    f"tenant:{slug}",
+                    settings.rate_limit_tenant_rate,
+                    settings.rate_limit_tenant_burst,
+                    cost,
+                )
+        return retry_after
+
+    @staticmethod
+    def _tenant_slug(path: str) -> Optional[str]:
+        match = _JOBS_PATH_RE.match(path) or _COMPANY_PATH_RE.match(path)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _cost(scope) -> int:
+        path = scope["path"]
+        if path in _SEARCH_PATHS:
+            return settings.rate_limit_search_cost
+        if _LISTING_PATH_RE.match(path):
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            if any(query.values()):
+                return settings.rate_limit_search_cost
+        return 1
+
+    @staticmethod
+    async def _reject(send, status_code: int, detail: str, retry_after: float) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
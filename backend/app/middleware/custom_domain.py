@@ -0,0 +1,53 @@
+import re
+from urllib.parse import quote
+
+from app.domains import host_map, normalize_host
+
+# Public routes as seen on a custom domain -> the slug-scoped API route.
+# `/api/jobs/search` is the cross-tenant search and stays as it is.
+_REWRITES = (
+    (re.compile(r"^/api/careers/?$"), "/api/companies/{slug}/careers"),
+    (re.compile(r"^/api/jobs(?!/search(?:/|$))(/.*)?$"), "/api/{slug}/jobs{rest}"),
+)
+
+
+class CustomDomainMiddleware:
+    """
+    Serves tenant custom domains from the existing slug routes.
+
+    On a mapped host (`careers.acme.com`), `/api/careers` and `/api/jobs...`
+    are rewritten to `/api/companies/acme/careers` and `/api/acme/jobs...`
+    before routing. The host map is in memory (`app.domains`); requests for
+    unmapped hosts pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and len(host_map):
+            slug = self._slug(scope)
+            if slug:
+                scope = self._rewrite(scope, slug)
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _slug(scope):
+        for name, value in scope["headers"]:
+            if name == b"host":
+                return host_map.resolve(normalize_host(value.decode("latin-1")))
+        return None
+
+    @staticmethod
+    def _rewrite(scope, slug: str):
+        path = scope["path"]
+        for pattern, template in _REWRITES:
+            match = pattern.match(path)
+            if match:
+                rest = match.group(1) if match.groups() else ""
+                new_path = template.format(slug=slug, rest=rest or "")
+                scope = dict(scope)
+                scope["path"] = new_path
+                scope["raw_path"] = quote(new_path).encode()
+                return scope
+        return scope
@@ -1,5 +1,29 @@
+from app.models.analytics import AnalyticsRollup  # noqa: F401
+from app.models.application import Application  # noqa: F401
+from app.models.asset import Asset  # noqa: F401
+from app.models.change_log import ChangeLogEntry  # noqa: F401
 from app.models.company import Company  # noqa: F401
+from app.models.company_version import CompanyPageVersion  # noqa: F401
+from app.models.custom_domain import CustomDomain  # noqa: F401
+from app.models.exchange_rate import ExchangeRate  # noqa: F401
+from app.models.idempotency import IdempotencyKey  # noqa: F401
 from app.models.job import Job  # noqa: F401
+from app.models.job_archive import ArchivedJob  # noqa: F401
+from app.models.job_search import JobSearchEntry  # noqa: F401
 from app.database import Base 
 
-__all__ = ["Base", "Company", "Job"]
\ No newline at end of file
+__all__ = [
+    "AnalyticsRollup",
+    "Application",
+    "ArchivedJob",
+    "Asset",
+    "Base",
+    "ChangeLogEntry",
+    "Company",
+    "CompanyPageVersion",
+    "CustomDomain",
+    "ExchangeRate",
+    "IdempotencyKey",
+    "Job",
+    "JobSearchEntry",
+]
\ No newline at end of file
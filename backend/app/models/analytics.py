@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Column, Date, ForeignKey, Integer, LargeBinary
+from app.database import Base
+
+
+class AnalyticsRollup(Base):
+    """
+    Daily view / apply-click counts, written in batches by `app.analytics`.
+    `job_id = 0` is the career page itself. `job_id` has no FK so stats
+    survive a job being archived.
+    """
+
+    __tablename__ = "analytics_daily"
+
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    job_id = Column(Integer, primary_key=True, default=0)
+    day = Column(Date, primary_key=True)
+
+    views = Column(BigInteger, nullable=False, default=0, server_default="0")
+    apply_clicks = Column(BigInteger, nullable=False, default=0, server_default="0")
+    # HyperLogLog sketch of distinct visitors (app.utils.hyperloglog)
+    visitors_hll = Column(LargeBinary, nullable=True)
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.orm import deferred
+from app.database import Base
+
+
+class ApplicationStatus:
+    RECEIVED = "received"  # stored, post-processing pending
+    PROCESSED = "processed"
+    FAILED = "failed"  # resume could not be read
+
+
+class Application(Base):
+    """
+    A candidate's application to a job. The resume file lives in private
+    storage under its SHA-256 (`resume_key`); identical files are stored once.
+    `job_id` carries no FK so applications survive the job being archived.
+    """
+
+    __tablename__ = "applications"
+
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    job_id = Column(Integer, nullable=False, index=True)
+
+    candidate_name = Column(String, nullable=False)
+    candidate_email = Column(String, nullable=False)
+    phone = Column(String, nullable=True)
+    cover_letter = deferred(Column(Text, nullable=True))
+
+    resume_key = Column(String, nullable=False)
+    resume_filename = Column(String, nullable=False)
+    resume_content_type = Column(String, nullable=False)
+    resume_size = Column(Integer, nullable=False)
+    resume_sha256 = Column(String(64), nullable=False, index=True)
+    # Filled in by post-processing
+    resume_text = deferred(Column(Text, nullable=True))
+    # Earlier application by the same candidate (same resume or email) to this job
+    duplicate_of_id = Column(
+        Integer, ForeignKey("applications.id", ondelete="SET NULL"), nullable=True
+    )
+
+    status = Column(String, nullable=False, default=ApplicationStatus.RECEIVED)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
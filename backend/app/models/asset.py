@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
+from app.database import Base
+
+
+class Asset(Base):
+    """
+    An uploaded image, identified by the SHA-256 of its bytes. Re-uploading
+    the same file reuses the row and the stored files.
+    """
+
+    __tablename__ = "assets"
+
+    sha256 = Column(String(64), primary_key=True)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    content_type = Column(String, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+
+    # Storage key of the original, e.g. "<sha256>/original.png"
+    original_key = Column(String, nullable=False)
+    # [{"width": 640, "format": "webp", "key": "<sha256>/640.webp"}, ...]
+    variants = Column(JSONB, nullable=False, default=list)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
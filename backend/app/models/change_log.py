@@ -0,0 +1,34 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
+from app.database import Base
+
+
+class ChangeLogEntry(Base):
+    """
+    Append-only log of public job / company changes for syndication partners
+    (`GET /api/changes`). Written in the same transaction as the change and
+    read in `(txid, id)` order; the feed only returns rows of transactions
+    older than every transaction still running, so that pair doubles as the
+    feed cursor (see `app.crud.changes.get_changes`).
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_txid_id", "txid", "id"),
+        Index("ix_change_log_company_id_txid_id", "company_id", "txid", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    # Writing transaction (64-bit, never wraps around)
+    txid = Column(
+        BigInteger, nullable=False, server_default=text("(pg_current_xact_id()::text::bigint)")
+    )
+    entity = Column(String(16), nullable=False)  # "job" | "company"
+    entity_id = Column(Integer, nullable=False)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False
+    )
+    op = Column(String(16), nullable=False)  # "create" | "update" | "delete"
+    # Public representation after the change; NULL for deletes (tombstones)
+    data = Column(JSONB, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
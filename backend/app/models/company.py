@@ -1,5 +1,5 @@
 from logging import NullHandler
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -20,6 +20,17 @@ class Company(Base):
 
     page_content = Column(JSONB, default=dict)
 
+    # Bumped on every draft write; clients send it back for optimistic concurrency.
+    draft_version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Draft lives in the two columns above; the public page serves this snapshot.
+    # use_alter breaks the companies <-> company_page_versions FK cycle for create_all.
+    published_version_id = Column(
+        Integer,
+        ForeignKey("company_page_versions.id", use_alter=True, ondelete="SET NULL"),
+        nullable=True,
+    )
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
+from app.database import Base
+
+
+class CompanyPageVersion(Base):
+    """
+    Immutable snapshot of a company's career page, written on publish.
+    `Company.branding_config` / `page_content` hold the editor draft; the public
+    page serves the snapshot that `Company.published_version_id` points to.
+    Rows are never updated, so they can be cached indefinitely by id.
+    """
+
+    __tablename__ = "company_page_versions"
+    __table_args__ = (UniqueConstraint("company_id", "version"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    # Per-company sequence: 1, 2, 3, ...
+    version = Column(Integer, nullable=False)
+
+    branding_config = Column(JSONB, nullable=False, default=dict)
+    page_content = Column(JSONB, nullable=False, default=dict)
+
+    published_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
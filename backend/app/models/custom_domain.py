@@ -0,0 +1,49 @@
+import hashlib
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from app.database import Base
+
+
+class CustomDomain(Base):
+    """
+    A hostname (e.g. `careers.acme.com`) that serves a company's public career
+    page. Looked up from the in-memory host map (`app.domains`), never per
+    request.
+
+    A domain only goes live once `verified_at` is set, i.e. once the company
+    proved control of its DNS with a TXT record (`app.domains.verify_ownership`).
+    Until then the claim grants nothing, and another company may take it over.
+    """
+
+    __tablename__ = "custom_domains"
+
+    # Lowercase, no port, no trailing dot
+    hostname = Column(String(253), primary_key=True)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+
+    @property
+    def verification_record(self) -> str:
+        return verification_record_name(self.hostname)
+
+    @property
+    def verification_value(self) -> str:
+        return verification_value(self.company_id, self.hostname)
+
+
+def verification_record_name(hostname: str) -> str:
+    """DNS name of the TXT record that proves ownership of `hostname`."""
+    return f"_careers-verify.{hostname}"
+
+
+def verification_value(company_id: int, hostname: str) -> str:
+    """
+    TXT value for `company_id` claiming `hostname`. Bound to the company, so
+    one company's record never verifies the domain for another, and stable,
+    so a claim that was taken over and re-added keeps the same record.
+    """
+    digest = hashlib.sha256(f"{company_id}:{hostname}".encode()).hexdigest()
+    return f"careers-verify={digest[:32]}"
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, DateTime, Numeric, String, func
+from app.database import Base
+
+
+class ExchangeRate(Base):
+    """
+    Conversion rates into the salary base currency (`SALARY_BASE_CURRENCY`),
+    loaded from a local rates file by `app.crud.salaries.load_exchange_rates`.
+    Used only to precompute `jobs.*_salary_normalized`; never read per request.
+    """
+
+    __tablename__ = "exchange_rates"
+
+    currency = Column(String(3), primary_key=True)
+    # Base currency units per one unit of `currency` (EUR -> USD: ~1.08)
+    rate = Column(Numeric(18, 8), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
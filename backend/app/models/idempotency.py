@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
+from app.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    The stored outcome of a create request sent with an `Idempotency-Key`
+    header (see `app.idempotency`). A row without `status_code` is a claim:
+    the request is still running, and duplicates wait for it.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    # Keys are only unique per caller (the recruiter id)
+    scope = Column(String(255), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    # SHA-256 of method, path and body; reusing a key for another request is an error
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(JSONB, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+    # When the claim was taken; a claim older than the lease can be taken over
+    locked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
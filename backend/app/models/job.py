@@ -1,5 +1,5 @@
-from sqlalchemy import Column, DateTime, Integer, String, Boolean, ForeignKey, Enum as SqEnum, Text, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Boolean, ForeignKey, Enum as SqEnum, Text, func, text
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.dialects.postgresql import JSONB  # Specific import for Postgres JSONB
 import enum
 from app.database import Base
@@ -13,19 +13,55 @@ class JobType(str, enum.Enum):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Public listings only ever read active jobs; keep their index small.
+        Index(
+            "ix_jobs_company_active",
+            "company_id",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        # Location filters on a company's listing: exact place, or a radius
+        # search as geohash prefix ranges (see app.crud.locations)
+        Index("ix_jobs_company_place", "company_id", "place_id"),
+        Index("ix_jobs_company_geohash", "company_id", "geohash"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, index=True) # Indexed for search
     location = Column(String, nullable=False)
     
-    description = Column(Text, nullable=False)
+    # Heavy text columns are deferred so list views and ownership / active
+    # checks never load them. Query with `undefer_group("body")` when needed.
+    description = deferred(Column(Text, nullable=False), group="body")
+    # Rendered once on write (see app.utils.rendering)
+    description_html = deferred(Column(Text, nullable=True), group="body")
+    description_excerpt = Column(String(256), nullable=True)
     min_salary = Column(Integer, nullable=True)  # e.g. 50000
     max_salary = Column(Integer, nullable=True)  # e.g. 80000
     currency = Column(String, default="USD", nullable=False)
+    # The salary range converted to the base currency (SALARY_BASE_CURRENCY)
+    # with the exchange_rates table, so salaries compare across currencies. An
+    # open-ended range uses its one bound for both. NULL without a salary or a
+    # known rate. Maintained by app.crud.salaries.
+    min_salary_normalized = Column(Integer, nullable=True)
+    max_salary_normalized = Column(Integer, nullable=True)
+
+    # `location` geocoded on write against the gazetteer (app.utils.gazetteer):
+    # GeoNames id and coordinates of the place, NULL when no place is named or
+    # known, plus the remote / hybrid markers found in the text.
+    # Maintained by app.crud.locations.
+    place_id = Column(Integer, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    # Byte-wise collation so prefix ranges (>= 'tdr1', < 'tdr1{') use the index
+    geohash = Column(String(12, collation="C"), nullable=True)
+    is_remote = Column(Boolean, server_default=text("false"), nullable=False)
+    is_hybrid = Column(Boolean, server_default=text("false"), nullable=False)
 
     job_type = Column(SqEnum(JobType), default=JobType.FULL_TIME)
     is_active = Column(Boolean, default=True)
-    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False, index=True)
     company = relationship("Company", back_populates="jobs")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -34,4 +70,8 @@ class Job(Base):
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
-    )
\ No newline at end of file
+        index=True,  # feeds scan past a high-water mark
+    )
+    # Soft delete: set by `delete_job`, restorable until the archiver moves the
+    # row to `jobs_archive` (see app.crud.job_archive)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
\ No newline at end of file
@@ -0,0 +1,44 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text, Enum as SqEnum, func, text
+from app.database import Base
+from app.models.job import JobType
+
+
+class ArchivedJob(Base):
+    """
+    Cold storage for postings that were deleted, or inactive, for longer than
+    the retention window. Rows keep their original `jobs.id` so a restore puts
+    the posting back unchanged. Nothing public reads this table.
+
+    Mirrors every column of `jobs` (the archiver copies them by name), plus
+    `archived_at`. Add new `jobs` columns here too.
+    """
+
+    __tablename__ = "jobs_archive"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    location = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    description_html = Column(Text, nullable=True)
+    description_excerpt = Column(String(256), nullable=True)
+    min_salary = Column(Integer, nullable=True)
+    max_salary = Column(Integer, nullable=True)
+    currency = Column(String, nullable=False)
+    min_salary_normalized = Column(Integer, nullable=True)
+    max_salary_normalized = Column(Integer, nullable=True)
+    place_id = Column(Integer, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12, collation="C"), nullable=True)
+    is_remote = Column(Boolean, server_default=text("false"), nullable=False)
+    is_hybrid = Column(Boolean, server_default=text("false"), nullable=False)
+    job_type = Column(SqEnum(JobType))
+    is_active = Column(Boolean, nullable=False)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
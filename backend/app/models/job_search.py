@@ -0,0 +1,61 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Enum as SqEnum, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from app.database import Base
+from app.models.job import JobType
+
+
+class JobSearchEntry(Base):
+    """
+    Global job board index: one row per *active* job, denormalized with the
+    company name / slug so cross-tenant searches never touch `jobs` or
+    `companies`. `search_vector` is the inverted index (GIN) over title,
+    company name and location.
+
+    Maintained on every job write in `app.crud.jobs` (see `app.crud.job_search`).
+    Company name and slug cannot change after creation, so company writes never
+    need to touch it.
+    """
+
+    __tablename__ = "job_search_index"
+    __table_args__ = (
+        Index("ix_job_search_vector", "search_vector", postgresql_using="gin"),
+        # Newest-first keyset pagination, optionally narrowed by job type
+        Index("ix_job_search_type_id", "job_type", "job_id"),
+        # Salary filters and the salary sort (keyset on salary, then job_id)
+        Index("ix_job_search_max_salary_id", "max_salary_normalized", "job_id"),
+        Index("ix_job_search_min_salary_id", "min_salary_normalized", "job_id"),
+        # Location filters (app.crud.locations): exact place, radius search as
+        # geohash prefix ranges, and the remote / hybrid flags
+        Index("ix_job_search_place_id", "place_id", "job_id"),
+        Index("ix_job_search_geohash", "geohash"),
+        Index("ix_job_search_remote_id", "job_id", postgresql_where=text("is_remote")),
+        Index("ix_job_search_hybrid_id", "job_id", postgresql_where=text("is_hybrid")),
+    )
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    company_id = Column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    company_name = Column(String, nullable=False)
+    company_slug = Column(String, nullable=False)
+
+    title = Column(String, nullable=False)
+    location = Column(String, nullable=False)
+    job_type = Column(SqEnum(JobType), nullable=False)
+    min_salary = Column(Integer, nullable=True)
+    max_salary = Column(Integer, nullable=True)
+    currency = Column(String, nullable=False)
+    # Copies of jobs.*_salary_normalized (base currency)
+    min_salary_normalized = Column(Integer, nullable=True)
+    max_salary_normalized = Column(Integer, nullable=True)
+    # Copies of the geocoded jobs.location columns
+    place_id = Column(Integer, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12, collation="C"), nullable=True)
+    is_remote = Column(Boolean, server_default=text("false"), nullable=False)
+    is_hybrid = Column(Boolean, server_default=text("false"), nullable=False)
+    description_excerpt = Column(String(256), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    search_vector = Column(TSVECTOR, nullable=False)
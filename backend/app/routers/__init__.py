@@ -1,9 +1,12 @@
 from fastapi import APIRouter
-from app.routers import auth, health, companies, jobs
+from app.routers import applications, assets, auth, changes, health, companies, jobs
 
 api_router = APIRouter()
 
 api_router.include_router(health.router, prefix="/health", tags=["health"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(companies.router, prefix="/companies", tags=["companies"])
+api_router.include_router(assets.router, prefix="/companies", tags=["assets"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
 api_router.include_router(jobs.router, prefix="", tags=["jobs"])
+api_router.include_router(applications.router, prefix="", tags=["applications"])
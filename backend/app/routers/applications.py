@@ -0,0 +1,217 @@
+import os
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.crud.applications import (
+    create_application,
+    get_application,
+    get_applications_for_job,
+    process_application,
+)
+from app.crud.company import get_company_by_recruiter, get_company_public_payload
+from app.crud.jobs import get_active_jobs_payload
+from app.database import run_in_session
+from app.dependencies import get_db_write
+from app.external_services.storage import resume_storage
+from app.utils import workers
+from app.utils.authentication import verify_token
+from app.utils.multipart import (
+    FORM_OVERHEAD_BYTES,
+    MalformedForm,
+    UploadTooLarge,
+    create_upload_dir,
+    remove_upload_dir,
+    stream_form,
+)
+from app.utils.resume_text import RESUME_TYPES
+from config import settings
+
+router = APIRouter()
+
+
+@router.post(
+    "/{company_slug}/jobs/{job_id}/apply",
+    response_model=schemas.ApplicationReceipt,
+    status_code=status.HTTP_201_CREATED,
+)
+async def apply_endpoint(
+    company_slug: str,
+    job_id: int,
+    request: Request,
+):
+    """
+    Apply to an active job (public, no auth required).
+
+    Send `multipart/form-data` with `candidate_name`, `candidate_email`,
+    optional `phone` / `cover_letter`, and the `resume` file (PDF, DOCX or
+    TXT). The upload is streamed to disk, never held in memory, and rejected
+    with 413 as soon as it passes `MAX_RESUME_UPLOAD_BYTES`.
+
+    No database connection is held while the body streams in: the lookups
+    and the insert each use their own short session, so slow uploads cannot
+    drain the pool. File system work runs in the threadpool, off the event
+    loop.
+    """
+    company, job_is_active = await run_in_threadpool(
+        run_in_session, _find_active_job, company_slug, job_id
+    )
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found",
+        )
+    if not job_is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    # Refuse oversized bodies before reading a byte of them.
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > settings.max_resume_upload_bytes + FORM_OVERHEAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Resume is too large",
+            )
+
+    work_dir = await create_upload_dir(os.path.join(settings.resume_root, "tmp"))
+    try:
+        try:
+            form = await stream_form(request, work_dir, settings.max_resume_upload_bytes)
+        except UploadTooLarge as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=str(e),
+            )
+        except MalformedForm as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+        try:
+            application_in = schemas.ApplicationCreate(**form.fields)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=e.errors(include_url=False, include_context=False),
+            )
+
+        resume = next((f for f in form.files if f.field == "resume"), None)
+        if resume is None or resume.size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="A resume file is required",
+            )
+        extension = os.path.splitext(resume.filename)[1].lower()
+        if extension not in RESUME_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Resume must be a PDF, DOCX or TXT file",
+            )
+
+        key = f"{resume.sha256}{extension}"
+        await run_in_threadpool(_store_resume, key, resume.path)
+
+        application = await run_in_threadpool(
+            run_in_session,
+            create_application,
+            company["id"],
+            job_id,
+            application_in,
+            {
+                "key": key,
+                "filename": resume.filename[:255],
+                "content_type": RESUME_TYPES[extension],
+                "size": resume.size,
+                "sha256": resume.sha256,
+            },
+        )
+    finally:
+        await remove_upload_dir(work_dir)
+
+    workers.submit(run_in_session, process_application, application.id)
+    return application
+
+
+def _store_resume(key: str, path: str) -> None:
+    # Content-addressed: the same file uploaded twice is stored once.
+    if not resume_storage.exists(key):
+        resume_storage.put_file(key, path)
+
+
+def _find_active_job(db: Session, company_slug: str, job_id: int):
+    """(company payload or None, whether `job_id` is one of its active jobs)."""
+    company = get_company_public_payload(db, company_slug)
+    if not company:
+        return None, False
+    active_jobs = get_active_jobs_payload(db, company["id"])
+    return company, job_id in {job["id"] for job in active_jobs}
+
+
+@router.get(
+    "/{company_slug}/jobs/{job_id}/applications",
+    response_model=List[schemas.ApplicationResponse],
+    status_code=status.HTTP_200_OK,
+)
+def get_applications_endpoint(
+    company_slug: str,
+    job_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """List applications to a job, newest first (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    return get_applications_for_job(db, company.id, job_id, limit=limit, offset=offset)
+
+
+@router.get(
+    "/{company_slug}/applications/{application_id}/resume",
+    status_code=status.HTTP_200_OK,
+)
+def download_resume_endpoint(
+    company_slug: str,
+    application_id: int,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Download the resume attached to an application (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    application = get_application(db, application_id, company.id)
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found",
+        )
+
+    return FileResponse(
+        resume_storage.path(application.resume_key),
+        media_type=application.resume_content_type,
+        filename=application.resume_filename,
+    )
+
+
+def _get_owned_company(db: Session, company_slug: str, token_payload: dict):
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    company = get_company_by_recruiter(db, company_slug, recruiter_id)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found or you do not have access to it",
+        )
+    return company
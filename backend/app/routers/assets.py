@@ -0,0 +1,162 @@
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app import schemas
+from app.crud.assets import build_srcset, create_asset, get_asset, largest_variant_url
+from app.crud.company import get_company_by_recruiter
+from app.database import run_in_session
+from app.external_services.storage import storage
+from app.models.asset import Asset
+from app.utils.authentication import verify_token
+from app.utils.images import generate_variants, get_pool
+from app.utils.multipart import (
+    MalformedForm,
+    UploadTooLarge,
+    create_upload_dir,
+    remove_upload_dir,
+    stream_form,
+)
+from config import settings
+
+router = APIRouter()
+
+# Room for multipart framing on top of the image itself
+_FORM_OVERHEAD_BYTES = 16 * 1024
+
+
+def _store_files(files) -> None:
+    """Move `(key, path)` pairs into storage (blocking file I/O)."""
+    for key, path in files:
+        storage.put_file(key, path)
+
+
+def _asset_response(asset: Asset) -> schemas.AssetResponse:
+    formats = sorted({variant["format"] for variant in asset.variants})
+    return schemas.AssetResponse(
+        sha256=asset.sha256,
+        content_type=asset.content_type,
+        size_bytes=asset.size_bytes,
+        width=asset.width,
+        height=asset.height,
+        original_url=storage.url(asset.original_key),
+        url=largest_variant_url(asset.variants) or storage.url(asset.original_key),
+        srcset={fmt: build_srcset(asset.variants, fmt) for fmt in formats},
+        created_at=asset.created_at,
+    )
+
+
+@router.post(
+    "/{company_slug}/assets",
+    response_model=schemas.AssetResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_asset_endpoint(
+    company_slug: str,
+    request: Request,
+    token_payload=Depends(verify_token),
+):
+    """
+    Upload a logo / section image (recruiter only).
+
+    Send `multipart/form-data` with the image in the `file` field. The body is
+    streamed to disk and rejected with 413 as soon as it passes
+    `MAX_IMAGE_UPLOAD_BYTES`. The file is stored under its SHA-256 and resized WebP/AVIF variants are
+    generated in a process pool. Use the returned `url` and `srcset` in
+    `branding.logo_url` / `about_sections[].image_url`; publishing fills in
+    the srcset automatically for uploaded assets.
+    """
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    # Short sessions only: no pooled connection is held while the body uploads
+    company = await run_in_threadpool(
+        run_in_session, get_company_by_recruiter, company_slug, recruiter_id
+    )
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found or you do not have access to it",
+        )
+
+    # Refuse oversized bodies before reading a byte of them.
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > settings.max_image_upload_bytes + _FORM_OVERHEAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Image is too large",
+            )
+
+    # Not under MEDIA_ROOT: half-written uploads must never be served
+    work_dir = await create_upload_dir(settings.upload_tmp_root)
+    try:
+        # Streamed to disk while hashing, enforcing the size limit as it arrives.
+        try:
+            form = await stream_form(
+                request,
+                work_dir,
+                settings.max_image_upload_bytes,
+                max_body_bytes=settings.max_image_upload_bytes + _FORM_OVERHEAD_BYTES,
+            )
+        except UploadTooLarge:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Image is too large",
+            )
+        except MalformedForm as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+        upload = next((f for f in form.files if f.field == "file"), None)
+        if upload is None or upload.size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="An image file is required",
+            )
+        upload_path, size, sha256 = upload.path, upload.size, upload.sha256
+
+        existing = await run_in_threadpool(run_in_session, get_asset, sha256)
+        if existing:
+            return _asset_response(existing)
+
+        loop = asyncio.get_running_loop()
+        try:
+            info = await loop.run_in_executor(
+                get_pool(),
+                generate_variants,
+                upload_path,
+                work_dir,
+                settings.image_variant_widths,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e),
+            )
+
+        extension = info["content_type"].rsplit("/", 1)[-1]
+        original_key = f"{sha256}/original.{extension}"
+        await run_in_threadpool(
+            _store_files,
+            [(original_key, upload_path)]
+            + [
+                (f"{sha256}/{variant['filename']}", os.path.join(work_dir, variant["filename"]))
+                for variant in info["variants"]
+            ],
+        )
+
+        asset = await run_in_threadpool(
+            run_in_session, create_asset, company.id, sha256, size, original_key, info
+        )
+        return _asset_response(asset)
+    finally:
+        await remove_upload_dir(work_dir)
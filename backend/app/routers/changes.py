@@ -0,0 +1,76 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.crud.changes import encode_cursor, get_changes, resolve_cursor
+from app.crud.company import get_company_public_payload
+from app.dependencies import get_db_read
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=schemas.ChangeFeedResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_changes_endpoint(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    company_slug: Optional[str] = None,
+    db: Session = Depends(get_db_read),
+):
+    """Ordered job / company changes for syndication (public, no auth required).
+
+    Start without `since` to read the log from the beginning, then keep
+    passing the returned `next_cursor`. Deleted or deactivated jobs appear as
+    `delete` events with no `data`. Call again right away while `has_more`.
+
+    Without `company_slug` the feed covers companies with a published page.
+
+    Optional query parameters:
+    - `company_slug`: only changes of this company
+    - `limit`: page size (max 1000)
+    """
+    try:
+        after = resolve_cursor(db, since)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    company_id = None
+    if company_slug:
+        company = get_company_public_payload(db, company_slug)
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found",
+            )
+        company_id = company["id"]
+
+    # One extra row tells us whether another page follows.
+    rows = get_changes(db, after, limit=limit + 1, company_id=company_id)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    events = [
+        schemas.ChangeEvent(
+            cursor=encode_cursor((row.txid, row.id)),
+            entity=row.entity,
+            op=row.op,
+            entity_id=row.entity_id,
+            company_slug=row.company_slug,
+            data=row.data,
+            occurred_at=row.created_at,
+        )
+        for row in rows
+    ]
+    return schemas.ChangeFeedResponse(
+        events=events,
+        next_cursor=events[-1].cursor if events else encode_cursor(after),
+        has_more=has_more,
+    )
@@ -1,18 +1,31 @@
-from typing import List
+from typing import List, Optional
 from app.models.company import Company
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app import schemas
+from app import analytics, schemas
+from app.crud.analytics import get_company_stats
+from app.crud.domains import add_domain, get_domains, remove_domain, verify_domain
+from app.domains import normalize_host
 from app.crud.company import (
     create_company,
     get_all_companies_by_recruiter,
     update_company,
-    get_company_by_slug_public,
+    get_company_public_payload,
     get_company_by_recruiter,
+    get_company_versions,
+    get_recruiter_dashboard,
+    patch_company_draft,
+    publish_company,
+    StaleDraftError,
+    rollback_company,
 )
-from app.dependencies import get_db
+from app.dependencies import get_db_read, get_db_write
+from app.idempotency import idempotent, request_fingerprint
+from app.utils.json_patch import JsonPatchError
 from app.utils.authentication import verify_token
+from config import settings
 
 router = APIRouter()
 
@@ -22,10 +35,17 @@ router = APIRouter()
 )
 def create_company_endpoint(
     payload: schemas.CompanyCreate,
-    db: Session = Depends(get_db),
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
-    """Create a company with automatic, unique slug generation."""
+    """
+    Create a company with automatic, unique slug generation.
+
+    Send an `Idempotency-Key` header to make retries safe: repeats of the same
+    request return the original response instead of creating another company.
+    """
     recruiter_id = token_payload.get("sub")
     if not recruiter_id:
         raise HTTPException(
@@ -33,8 +53,14 @@ def create_company_endpoint(
             detail="Missing user id in token",
         )
 
-    company = create_company(db, payload, recruiter_id=recruiter_id)
-    return company
+    return idempotent(
+        db,
+        idempotency_key,
+        recruiter_id,
+        request_fingerprint(request, payload),
+        lambda: create_company(db, payload, recruiter_id=recruiter_id),
+        schemas.CompanyResponse,
+    )
 
 
 @router.patch(
@@ -45,7 +71,7 @@ def create_company_endpoint(
 def update_company_endpoint(
     company_slug: str,
     payload: schemas.CompanyUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
     """Update company branding and content using company slug."""
@@ -56,7 +82,13 @@ def update_company_endpoint(
             detail="Missing user id in token",
         )
 
-    company = update_company(db, company_slug, payload)
+    try:
+        company = update_company(db, company_slug, payload)
+    except StaleDraftError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Draft was modified by another request; reload and retry",
+        )
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,18 +105,43 @@ def update_company_endpoint(
 )
 def get_company_public_endpoint(
     company_slug: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db_read),
 ):
-    """Fetch company data by slug for public access (career page view)."""
-    company = get_company_by_slug_public(db, company_slug)
+    """Fetch the published career page for a company (public access)."""
+    company = get_company_public_payload(db, company_slug)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found",
         )
+    analytics.track(request, analytics.VIEW, company["id"])
+    response.headers["Cache-Control"] = (
+        f"public, max-age={settings.careers_max_age_seconds}, must-revalidate"
+    )
+    version_id = company["published_version_id"]
+    if version_id is not None:
+        etag = f'"v{version_id}"'
+        response.headers["ETag"] = etag
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers)
+            )
     return company
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header (RFC 9110)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get(
     "/{company_slug}/preview",
     response_model=schemas.CompanyDetailResponse,
@@ -92,7 +149,7 @@ def get_company_public_endpoint(
 )
 def get_company_recruiter_endpoint(
     company_slug: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
     """Fetch full company data for recruiter (requires authentication)."""
@@ -117,7 +174,7 @@ def get_company_recruiter_endpoint(
     status_code=status.HTTP_200_OK,
 )
 def get_company_recruiter_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ) -> List[schemas.CompanyBasicResponse]:
     """Fetch full company data for recruiter (requires authentication)."""
@@ -130,3 +187,232 @@ def get_company_recruiter_endpoint(
 
     companies = get_all_companies_by_recruiter(db, recruiter_id)
     return companies
+
+
+@router.get(
+    "/dashboard",
+    response_model=List[schemas.CompanyDashboardResponse],
+    status_code=status.HTTP_200_OK,
+)
+def get_dashboard_endpoint(
+    recent_days: int = Query(7, ge=1, le=365),
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Recruiter's companies with total / active / recent job counts (one query)."""
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    return get_recruiter_dashboard(db, recruiter_id, recent_days=recent_days)
+
+
+@router.get(
+    "/{company_slug}/stats",
+    response_model=schemas.CompanyStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_company_stats_endpoint(
+    company_slug: str,
+    days: int = Query(30, ge=1, le=365),
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Career page and per-job views, unique visitors and apply clicks (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    return get_company_stats(db, company.id, days=days)
+
+
+@router.get(
+    "/{company_slug}/domains",
+    response_model=List[schemas.CustomDomainResponse],
+    status_code=status.HTTP_200_OK,
+)
+def get_domains_endpoint(
+    company_slug: str,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """List the custom domains serving this career page (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    return get_domains(db, company.id)
+
+
+@router.post(
+    "/{company_slug}/domains",
+    response_model=schemas.CustomDomainResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def add_domain_endpoint(
+    company_slug: str,
+    payload: schemas.CustomDomainCreate,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """
+    Claim a custom domain for the career page (recruiter only).
+
+    The domain is not served until ownership is verified: publish the TXT
+    record from the response (`verification_record` = `verification_value`),
+    point the domain's DNS (CNAME) at this deployment, then call
+    `POST /{company_slug}/domains/{hostname}/verify`. Requests with that Host
+    then get `/api/careers` and `/api/jobs` for this company.
+    """
+    company = _get_owned_company(db, company_slug, token_payload)
+    domain = add_domain(db, company.id, payload.hostname)
+    if not domain:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Domain is already in use",
+        )
+    return domain
+
+
+@router.post(
+    "/{company_slug}/domains/{hostname}/verify",
+    response_model=schemas.CustomDomainResponse,
+    status_code=status.HTTP_200_OK,
+)
+def verify_domain_endpoint(
+    company_slug: str,
+    hostname: str,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Check the domain's TXT record and, if it is there, start serving it (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    domain = verify_domain(db, company.id, normalize_host(hostname))
+    if not domain:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Domain not found",
+        )
+    if domain.verified_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"TXT record {domain.verification_record} not found or does not match",
+        )
+    return domain
+
+
+@router.delete(
+    "/{company_slug}/domains/{hostname}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def remove_domain_endpoint(
+    company_slug: str,
+    hostname: str,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Stop serving the career page on a custom domain (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    if not remove_domain(db, company.id, normalize_host(hostname)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Domain not found",
+        )
+
+
+def _get_owned_company(db: Session, company_slug: str, token_payload: dict) -> Company:
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    company = get_company_by_recruiter(db, company_slug, recruiter_id)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found or you do not have access to it",
+        )
+    return company
+
+
+@router.post(
+    "/{company_slug}/publish",
+    response_model=schemas.CompanyVersionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def publish_company_endpoint(
+    company_slug: str,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Publish the current draft as a new immutable version (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    return publish_company(db, company)
+
+
+@router.get(
+    "/{company_slug}/versions",
+    response_model=List[schemas.CompanyVersionResponse],
+    status_code=status.HTTP_200_OK,
+)
+def get_company_versions_endpoint(
+    company_slug: str,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """List published versions of the career page, newest first (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    return get_company_versions(db, company.id)
+
+
+@router.post(
+    "/{company_slug}/versions/{version}/rollback",
+    response_model=schemas.CompanyVersionResponse,
+    status_code=status.HTTP_200_OK,
+)
+def rollback_company_endpoint(
+    company_slug: str,
+    version: int,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Serve an earlier published version again (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    db_version = rollback_company(db, company, version)
+    if not db_version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Version not found",
+        )
+    return db_version
+
+
+@router.patch(
+    "/{company_slug}/draft",
+    response_model=schemas.CompanyDetailResponse,
+    status_code=status.HTTP_200_OK,
+)
+def patch_company_draft_endpoint(
+    company_slug: str,
+    payload: schemas.CompanyPatch,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Apply JSON Patch (RFC 6902) operations to the draft (recruiter only)."""
+    company = _get_owned_company(db, company_slug, token_payload)
+    try:
+        return patch_company_draft(db, company, payload)
+    except JsonPatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False),
+        )
+    except StaleDraftError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Draft was modified by another request; reload and retry",
+        )
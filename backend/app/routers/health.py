@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+import logging
+
+from fastapi import APIRouter, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.database import check_database, pool_status, replicas
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -7,3 +14,30 @@ router = APIRouter()
 async def health():
     return {"status": "ok", "message": "API is running"}
 
+
+@router.get("/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests. Never touches the DB."""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness(response: Response):
+    """
+    Readiness probe: returns 503 unless the database is reachable, so the
+    load balancer only routes traffic to instances that can serve it.
+    """
+    try:
+        await run_in_threadpool(check_database)
+    except Exception:
+        # Details (host, DSN, driver message) go to the log, not to anonymous callers
+        logger.exception("Readiness check: database unavailable")
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "unavailable", "database": "unavailable", "pool": pool_status()}
+
+    return {
+        "status": "ready",
+        "database": "ok",
+        "pool": pool_status(),
+        "replicas": replicas.status(),
+    }
@@ -1,23 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from app import schemas
+from app import analytics, schemas
 from app.crud.jobs import (
     create_job,
-    get_job_by_id,
-    get_jobs_by_company,
+    get_active_jobs_payload,
+    get_public_job,
+    search_jobs_public,
     update_job,
     delete_job,
     toggle_job_active,
 )
-from app.crud.company import get_company_by_slug
-from app.dependencies import get_db
+from app.crud.job_archive import list_archived_jobs, restore_job
+from app.crud.job_search import MAX_PAGE_SIZE, parse_cursor, search_jobs_global
+from app.crud.locations import MAX_RADIUS_KM, UnknownPlace
+from app.crud.company import get_company_by_slug, get_company_public_payload
+from app.dependencies import get_db_read, get_db_write
+from app.idempotency import idempotent, request_fingerprint
 from app.utils.authentication import verify_token
 
 router = APIRouter()
 
 
+@router.get(
+    "/jobs/search",
+    response_model=schemas.GlobalJobSearchResponse,
+    status_code=status.HTTP_200_OK,
+)
+def search_all_jobs_endpoint(
+    search: Optional[str] = None,
+    location: Optional[str] = None,
+    job_type: Optional[schemas.JobType] = None,
+    min_salary: Optional[int] = Query(None, ge=0),
+    max_salary: Optional[int] = Query(None, ge=0),
+    near: Optional[str] = None,
+    radius_km: float = Query(50, gt=0, le=MAX_RADIUS_KM),
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
+    sort: Literal["newest", "salary"] = "newest",
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db_read),
+):
+    """Search active jobs across every company (public job board).
+
+    Optional query parameters:
+    - `search`: keywords matched against title, company name and location
+    - `location`: a place name in any known spelling ("Bengaluru" matches
+      "Bangalore"); otherwise a partial, case-insensitive match
+    - `near` / `radius_km`: jobs within `radius_km` (default 50) of a place
+    - `remote` / `hybrid`: only (or, with `false`, no) remote / hybrid jobs
+    - `job_type`: filter by job type (uses `JobType` enum values)
+    - `min_salary` / `max_salary`: salary range bounds in the base currency
+      (USD unless configured otherwise), compared across all currencies
+    - `sort`: `newest` (default) or `salary` (highest first; only jobs with a
+      comparable salary)
+    - `cursor` / `limit`: pagination; pass the previous `next_cursor`
+    """
+    try:
+        parse_cursor(cursor, sort)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    try:
+        return search_jobs_global(
+            db,
+            search=search,
+            location=location,
+            job_type=job_type.value if job_type is not None else None,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            cursor=cursor,
+            limit=limit,
+            sort=sort,
+            near=near,
+            radius_km=radius_km,
+            remote=remote,
+            hybrid=hybrid,
+        )
+    except UnknownPlace:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown place",
+        )
+
+
 @router.post(
     "/{company_slug}/jobs",
     response_model=schemas.JobResponse,
@@ -26,10 +97,17 @@ router = APIRouter()
 def create_job_endpoint(
     company_slug: str,
     payload: schemas.JobCreate,
-    db: Session = Depends(get_db),
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
-    """Create a new job posting for a company (recruiter only)."""
+    """
+    Create a new job posting for a company (recruiter only).
+
+    Send an `Idempotency-Key` header to make retries safe: repeats of the same
+    request return the original response instead of creating another job.
+    """
     recruiter_id = token_payload.get("sub")
     if not recruiter_id:
         raise HTTPException(
@@ -51,8 +129,14 @@ def create_job_endpoint(
             detail="You do not have permission to create jobs for this company",
         )
 
-    job = create_job(db, payload, company_id=company.id)
-    return job
+    return idempotent(
+        db,
+        idempotency_key,
+        recruiter_id,
+        request_fingerprint(request, payload),
+        lambda: create_job(db, payload, company_id=company.id),
+        schemas.JobResponse,
+    )
 
 
 @router.get(
@@ -65,33 +149,90 @@ def get_jobs_public_endpoint(
     location: Optional[str] = None,
     job_type: Optional[schemas.JobType] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    near: Optional[str] = None,
+    radius_km: float = Query(50, gt=0, le=MAX_RADIUS_KM),
+    remote: Optional[bool] = None,
+    hybrid: Optional[bool] = None,
+    db: Session = Depends(get_db_read),
 ):
     """Fetch all active jobs for a company (public view, no auth required).
 
     Optional query parameters:
-    - `location`: partial, case-insensitive match against job location
+    - `location`: a place name in any known spelling ("Bengaluru" matches
+      "Bangalore"); otherwise a partial, case-insensitive match
+    - `near` / `radius_km`: jobs within `radius_km` (default 50) of a place
+    - `remote` / `hybrid`: only (or, with `false`, no) remote / hybrid jobs
     - `job_type`: filter by job type (uses `JobType` enum values)
     - `search`: partial, case-insensitive match against job title
     """
-    company = get_company_by_slug(db, company_slug)
+    company = get_company_public_payload(db, company_slug)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found",
         )
+
+    # The unfiltered list is what every career page view asks for; cache it.
+    if not (location or job_type or search or near) and remote is None and hybrid is None:
+        return get_active_jobs_payload(db, company["id"])
+
     # Return only active jobs in the public endpoint by default
-    jobs = get_jobs_by_company(
-        db,
-        company.id,
-        active_only=True,
-        location=location,
-        job_type=job_type.value if job_type is not None else None,
-        search=search,
-    )
+    try:
+        jobs = search_jobs_public(
+            db,
+            company["id"],
+            location=location,
+            job_type=job_type.value if job_type is not None else None,
+            search=search,
+            near=near,
+            radius_km=radius_km,
+            remote=remote,
+            hybrid=hybrid,
+        )
+    except UnknownPlace:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown place",
+        )
     return jobs
 
 
+@router.get(
+    "/{company_slug}/jobs/archived",
+    response_model=List[schemas.ArchivedJobResponse],
+    status_code=status.HTTP_200_OK,
+)
+def get_archived_jobs_endpoint(
+    company_slug: str,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """List deleted and archived job postings of a company (recruiter only)."""
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    company = get_company_by_slug(db, company_slug)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found",
+        )
+
+    if company.recruiter_id != recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view jobs for this company",
+        )
+
+    return list_archived_jobs(db, company.id, limit=limit, offset=offset)
+
+
 @router.get(
     "/{company_slug}/jobs/{job_id}",
     response_model=schemas.JobResponse,
@@ -100,26 +241,57 @@ def get_jobs_public_endpoint(
 def get_job_detail_endpoint(
     company_slug: str,
     job_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: Session = Depends(get_db_read),
 ):
     """Fetch detailed job information by job ID (public view, no auth required)."""
-    company = get_company_by_slug(db, company_slug)
+    company = get_company_public_payload(db, company_slug)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found",
         )
 
-    job = get_job_by_id(db, job_id)
-    if not job or job.company_id != company.id or not job.is_active:
+    job = get_public_job(db, job_id, company["id"])
+    if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
+    analytics.track(request, analytics.VIEW, company["id"], job.id)
     return job
 
 
+@router.post(
+    "/{company_slug}/jobs/{job_id}/apply-click",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def track_apply_click_endpoint(
+    company_slug: str,
+    job_id: int,
+    request: Request,
+    db: Session = Depends(get_db_read),
+):
+    """Record a click on a job's Apply button (public, no auth required)."""
+    company = get_company_public_payload(db, company_slug)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found",
+        )
+
+    # Checked against the cached active job list, so a click costs no query.
+    active_ids = {job["id"] for job in get_active_jobs_payload(db, company["id"])}
+    if job_id not in active_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    analytics.track(request, analytics.APPLY_CLICK, company["id"], job_id)
+
+
 @router.patch(
     "/{company_slug}/jobs/{job_id}",
     response_model=schemas.JobResponse,
@@ -129,7 +301,7 @@ def update_job_endpoint(
     company_slug: str,
     job_id: int,
     payload: schemas.JobUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
     """Update a job posting (recruiter only)."""
@@ -171,7 +343,7 @@ def update_job_endpoint(
 def delete_job_endpoint(
     company_slug: str,
     job_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
     """Delete a job posting (recruiter only)."""
@@ -213,7 +385,7 @@ def toggle_job_status_endpoint(
     company_slug: str,
     job_id: int,
     is_active: bool,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_write),
     token_payload=Depends(verify_token),
 ):
     """Toggle job active/inactive status (recruiter only)."""
@@ -246,3 +418,45 @@ def toggle_job_status_endpoint(
         )
 
     return job
+
+
+@router.post(
+    "/{company_slug}/jobs/{job_id}/restore",
+    response_model=schemas.JobResponse,
+    status_code=status.HTTP_200_OK,
+)
+def restore_job_endpoint(
+    company_slug: str,
+    job_id: int,
+    db: Session = Depends(get_db_write),
+    token_payload=Depends(verify_token),
+):
+    """Restore a deleted or archived job posting as inactive (recruiter only)."""
+    recruiter_id = token_payload.get("sub")
+    if not recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Missing user id in token",
+        )
+
+    company = get_company_by_slug(db, company_slug)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found",
+        )
+
+    if company.recruiter_id != recruiter_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to restore jobs for this company",
+        )
+
+    job = restore_job(db, job_id, company.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No deleted or archived job with this id",
+        )
+
+    return job
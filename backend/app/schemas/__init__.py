@@ -1,3 +1,13 @@
+from app.schemas.analytics import CompanyStatsResponse, DailyStats, JobStats
+from app.schemas.application import (
+    ApplicationCreate,
+    ApplicationReceipt,
+    ApplicationResponse,
+)
+from app.schemas.asset import AssetResponse
+from app.schemas.change import ChangeEvent, ChangeFeedResponse
+from app.schemas.domain import CustomDomainCreate, CustomDomainResponse
+
 from app.schemas.company import (
     CompanyCreate,
     CompanyResponse,
@@ -5,9 +15,16 @@ from app.schemas.company import (
     CompanyPublicResponse,
     CompanyDetailResponse,
     CompanyBasicResponse,
+    CompanyDashboardResponse,
+    CompanyPatch,
+    CompanyVersionResponse,
+    JsonPatchOperation,
 )
 
 from app.schemas.job import ( 
+    ArchivedJobResponse,
+    GlobalJobResult,
+    GlobalJobSearchResponse,
     JobCreate,
     JobResponse,
     JobSummaryResponse,
@@ -0,0 +1,26 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class DailyStats(BaseModel):
+    day: date
+    views: int
+    apply_clicks: int
+    unique_visitors: int  # HyperLogLog estimate (~3% error)
+
+
+class JobStats(BaseModel):
+    job_id: int
+    title: Optional[str] = None
+    views: int
+    apply_clicks: int
+    unique_visitors: int
+
+
+class CompanyStatsResponse(BaseModel):
+    since: date
+    career_page: List[DailyStats]
+    career_page_unique_visitors: int
+    jobs: List[JobStats]
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, EmailStr, Field
+
+
+# Text fields of the multipart form sent to /{slug}/jobs/{job_id}/apply
+class ApplicationCreate(BaseModel):
+    candidate_name: str = Field(..., min_length=2, max_length=200)
+    candidate_email: EmailStr
+    phone: Optional[str] = Field(None, max_length=40)
+    cover_letter: Optional[str] = Field(None, max_length=10_000)
+
+
+class ApplicationReceipt(BaseModel):
+    id: int
+    status: str
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ApplicationResponse(BaseModel):
+    id: int
+    job_id: int
+    candidate_name: str
+    candidate_email: str
+    phone: Optional[str] = None
+    resume_filename: str
+    resume_size: int
+    status: str
+    duplicate_of_id: Optional[int] = None
+    created_at: datetime
+    processed_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class AssetResponse(BaseModel):
+    """Uploaded image with ready-to-use URLs for `<img>` / `<picture>`."""
+
+    sha256: str
+    content_type: str
+    size_bytes: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    # Original upload (immutable, content-addressed)
+    original_url: str
+    # Largest WebP variant; use this as `src`
+    url: str
+    # `srcset` per format, e.g. {"webp": "... 320w, ... 640w", "avif": "..."}
+    srcset: Dict[str, str]
+    created_at: datetime
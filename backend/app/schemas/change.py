@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class ChangeEvent(BaseModel):
+    cursor: str  # position of this event; resume after it with ?since=
+    entity: Literal["job", "company"]
+    op: Literal["create", "update", "delete"]
+    entity_id: int
+    company_slug: str
+    # Public representation after the change; null for deletes (tombstones)
+    data: Optional[dict] = None
+    occurred_at: datetime
+
+
+class ChangeFeedResponse(BaseModel):
+    events: List[ChangeEvent]
+    # Pass as `since` on the next call; unchanged when there was nothing new
+    next_cursor: str
+    has_more: bool
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, List, Literal
+from typing import Any, Optional, List, Literal
 
 # --- Sub-Models ---
 
@@ -13,6 +13,8 @@ class BrandingConfig(BaseModel):
     logo_url: Optional[str] = (
         None  # Changed to str to be more forgiving with inputs, or keep HttpUrl if strict
     )
+    # Filled in on publish when logo_url points at an uploaded asset
+    logo_srcset: Optional[str] = None
 
 
 class HeaderSection(BaseModel):
@@ -24,6 +26,8 @@ class AboutSubSection(BaseModel):
     title: str
     description: str
     image_url: Optional[str] = None
+    # Filled in on publish when image_url points at an uploaded asset
+    image_srcset: Optional[str] = None
     # alignment determines if text is on the left or right
     alignment: Literal["left", "right"] = "left"
 
@@ -48,6 +52,30 @@ class CompanyUpdate(BaseModel):
     page_content: Optional[PageContent] = None  # ← CHANGE: "content" to "page_content"
 
 
+class JsonPatchOperation(BaseModel):
+    """A single RFC 6902 operation."""
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Optional[Any] = None
+    from_: Optional[str] = Field(default=None, alias="from")
+
+    model_config = {"populate_by_name": True}
+
+
+class CompanyPatch(BaseModel):
+    """
+    Partial draft update. Each list is applied to the stored document and the
+    result is validated against `BrandingConfig` / `PageContent`.
+    `base_version` is the `draft_version` the client last saw; a mismatch is
+    rejected with 409 instead of overwriting someone else's edits.
+    """
+
+    base_version: Optional[int] = None
+    branding: List[JsonPatchOperation] = Field(default_factory=list)
+    page_content: List[JsonPatchOperation] = Field(default_factory=list)
+
+
 # --- Response Models ---
 
 
@@ -60,6 +88,7 @@ class CompanyResponse(BaseModel):
     page_content: PageContent
     created_at: datetime
     updated_at: datetime
+    draft_version: int = 1
 
     model_config = {"from_attributes": True}
 
@@ -73,6 +102,9 @@ class CompanyPublicResponse(BaseModel):
     branding_config: BrandingConfig
     page_content: PageContent
     created_at: datetime
+    # Published snapshot served (None for companies never published)
+    version: Optional[int] = None
+    published_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -88,6 +120,8 @@ class CompanyDetailResponse(BaseModel):
     page_content: PageContent
     created_at: datetime
     updated_at: datetime
+    draft_version: int = 1
+    published_version_id: Optional[int] = None
 
     model_config = {"from_attributes": True}
 
@@ -103,3 +137,30 @@ class CompanyBasicResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class CompanyVersionResponse(BaseModel):
+    """Published version metadata (content is served by the public route)."""
+
+    id: int
+    version: int
+    published_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class CompanyDashboardResponse(BaseModel):
+    """Recruiter dashboard card: company plus job counts."""
+
+    id: int
+    slug: str
+    company_name: str
+    branding_config: BrandingConfig
+    published_version_id: Optional[int] = None
+    created_at: datetime
+    total_jobs: int
+    active_jobs: int
+    recent_jobs: int
+    last_updated_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.domains import is_platform_host, normalize_host
+
+_HOSTNAME_PATTERN = r"^([a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}$"
+
+
+class CustomDomainCreate(BaseModel):
+    hostname: str = Field(
+        ..., max_length=253, pattern=_HOSTNAME_PATTERN, examples=["careers.acme.com"]
+    )
+
+    @field_validator("hostname", mode="before")
+    @classmethod
+    def _normalize(cls, value):
+        return normalize_host(value) if isinstance(value, str) else value
+
+    @field_validator("hostname")
+    @classmethod
+    def _not_platform_host(cls, value: str) -> str:
+        if is_platform_host(value):
+            raise ValueError("The platform's own domains cannot be used")
+        return value
+
+
+class CustomDomainResponse(BaseModel):
+    hostname: str
+    created_at: datetime
+    # None until ownership is verified; only verified domains are served
+    verified_at: Optional[datetime] = None
+    # Publish a TXT record `verification_record` = `verification_value`, then
+    # call the verify endpoint
+    verification_record: str
+    verification_value: str
+
+    model_config = {"from_attributes": True}
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field, model_validator
-from typing import Optional
+from typing import List, Optional
 from enum import Enum
 
 
@@ -52,6 +52,7 @@ class JobResponse(JobBase):
     company_id: int
     is_active: bool
     description: str = Field(..., min_length=10)
+    description_html: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -63,11 +64,48 @@ class JobSummaryResponse(JobBase):
     id: int
     is_active: bool
     created_at: datetime
+    description_excerpt: Optional[str] = None
+    # Parsed from `location` (e.g. "Hybrid - Pune")
+    is_remote: bool = False
+    is_hybrid: bool = False
 
     class Config:
         from_attributes = True  # specific to Pydantic v2 (was orm_mode = True in v1)
 
 
+class ArchivedJobResponse(JobBase):
+    id: int
+    created_at: datetime
+    deleted_at: Optional[datetime] = None
+    # None while a deleted job is still restorable in place
+    archived_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class GlobalJobResult(JobBase):
+    id: int
+    company_name: str
+    company_slug: str
+    created_at: datetime
+    description_excerpt: Optional[str] = None
+    # Salary range in the base currency (SALARY_BASE_CURRENCY), when known
+    min_salary_normalized: Optional[int] = None
+    max_salary_normalized: Optional[int] = None
+    is_remote: bool = False
+    is_hybrid: bool = False
+
+    class Config:
+        from_attributes = True
+
+
+class GlobalJobSearchResponse(BaseModel):
+    items: List[GlobalJobResult]
+    # Pass back as `cursor` for the next page; None on the last page
+    next_cursor: Optional[str] = None
+
+
 # 4. Update Schema (for PATCH semantics) - all fields optional
 class JobUpdate(BaseModel):
     title: Optional[str] = None
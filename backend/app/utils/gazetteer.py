@@ -0,0 +1,140 @@
+"""
+Offline place lookup for job locations.
+
+Reads a GeoNames cities dump (e.g. `cities15000.txt` from
+https://download.geonames.org/export/dump/; tab-separated, one place per
+line) into memory once per worker. Names and alternate names ("Bengaluru",
+"Bangalore") both resolve to the same canonical place.
+"""
+import logging
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_REMOTE_RE = re.compile(r"\b(remote|anywhere|work from home|wfh)\b")
+_HYBRID_RE = re.compile(r"\bhybrid\b")
+_SEPARATORS_RE = re.compile(r"[,;/|()\[\]]+|\s[-–]\s")
+
+
+@dataclass(frozen=True)
+class Place:
+    id: int
+    name: str
+    country_code: str
+    latitude: float
+    longitude: float
+    population: int
+
+
+@dataclass(frozen=True)
+class ParsedLocation:
+    place: Optional[Place]
+    is_remote: bool
+    is_hybrid: bool
+
+
+def normalize_name(value: str) -> str:
+    """Case-, accent- and whitespace-insensitive lookup key."""
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.replace(".", " ").split())
+
+
+class Gazetteer:
+    def __init__(self):
+        self._by_name: Dict[str, Place] = {}
+        self._by_name_country: Dict[Tuple[str, str], Place] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def add(self, place: Place, names) -> None:
+        # On a name clash the most populous place wins ("Paris" is in France).
+        for name in names:
+            key = normalize_name(name)
+            if not key:
+                continue
+            current = self._by_name.get(key)
+            if current is None or place.population > current.population:
+                self._by_name[key] = place
+            key_cc = (key, place.country_code.lower())
+            current = self._by_name_country.get(key_cc)
+            if current is None or place.population > current.population:
+                self._by_name_country[key_cc] = place
+
+    @classmethod
+    def from_geonames(cls, path: str) -> "Gazetteer":
+        gazetteer = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 15:
+                    continue
+                place = Place(
+                    id=int(fields[0]),
+                    name=fields[1],
+                    country_code=fields[8],
+                    latitude=float(fields[4]),
+                    longitude=float(fields[5]),
+                    population=int(fields[14] or 0),
+                )
+                alternate = fields[3].split(",") if fields[3] else []
+                gazetteer.add(place, [fields[1], fields[2], *alternate])
+        return gazetteer
+
+    def lookup(self, name: str, country_code: Optional[str] = None) -> Optional[Place]:
+        key = normalize_name(name)
+        if country_code:
+            place = self._by_name_country.get((key, country_code.lower()))
+            if place is not None:
+                return place
+        return self._by_name.get(key)
+
+    def parse(self, location: str) -> ParsedLocation:
+        """
+        Free-form job location -> place + remote / hybrid flags, e.g.
+        "Hybrid - Bangalore, IN" or "Remote (Berlin)". The first part that
+        names a known place wins; a trailing two-letter part narrows the
+        country.
+        """
+        text = location.casefold()
+        is_remote = bool(_REMOTE_RE.search(text))
+        is_hybrid = bool(_HYBRID_RE.search(text))
+        text = _HYBRID_RE.sub(" ", _REMOTE_RE.sub(" ", text))
+
+        parts = [part.strip() for part in _SEPARATORS_RE.split(text) if part.strip()]
+        country = parts[-1] if len(parts) > 1 and len(parts[-1]) == 2 else None
+        place = self.lookup(" ".join(parts), country) if parts else None
+        for part in parts:
+            if place is not None:
+                break
+            place = self.lookup(part, country)
+        return ParsedLocation(place=place, is_remote=is_remote, is_hybrid=is_hybrid)
+
+
+_gazetteer: Optional[Gazetteer] = None
+_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """The configured gazetteer, loaded on first use (empty if the file is missing)."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _lock:
+            if _gazetteer is None:
+                try:
+                    _gazetteer = Gazetteer.from_geonames(settings.gazetteer_file)
+                    logger.info("Loaded %s place names", len(_gazetteer))
+                except OSError:
+                    logger.warning(
+                        "Gazetteer %s not found; locations will not be geocoded",
+                        settings.gazetteer_file,
+                    )
+                    _gazetteer = Gazetteer()
+    return _gazetteer
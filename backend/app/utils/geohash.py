@@ -0,0 +1,71 @@
+import math
+from typing import List, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Smaller side of a cell, in km, per precision (at the equator)
+_CELL_KM = {1: 4992.6, 2: 624.1, 3: 156.0, 4: 19.5, 5: 4.9, 6: 0.61, 7: 0.15}
+
+
+def encode(latitude: float, longitude: float, precision: int = 9) -> str:
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # longitude first
+    while len(chars) < precision:
+        value, bounds = (longitude, lon_range) if even else (latitude, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            bounds[0] = mid
+        else:
+            bits <<= 1
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """(height, width) of a cell in degrees."""
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 - lon_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def covering_cells(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """
+    Geohash prefixes whose cells together contain every point within
+    `radius_km` of the given point: the cell around it and its neighbours, at
+    the finest precision whose cells are still at least `radius_km` across.
+    Candidates still need an exact distance check.
+    """
+    precision = max((p for p, km in _CELL_KM.items() if km >= radius_km), default=1)
+    height, width = cell_size(precision)
+    # Cells narrow towards the poles; widen the longitude step to match.
+    width_km = width * 111.32 * max(math.cos(math.radians(latitude)), 0.01)
+    lon_steps = max(1, math.ceil(radius_km / width_km))
+    cells = set()
+    for dlat in (-1, 0, 1):
+        lat = min(max(latitude + dlat * height, -89.999999), 89.999999)
+        for dlon in range(-lon_steps, lon_steps + 1):
+            lon = (longitude + dlon * width + 180.0) % 360.0 - 180.0
+            cells.add(encode(lat, lon, precision))
+    return sorted(cells)
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle (haversine) distance."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Process pool for CPU-heavy image work, created on first upload."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.image_workers)
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def generate_variants(source_path: str, out_dir: str, widths: List[int]) -> dict:
+    """
+    Decode the image at `source_path` and write resized WebP (and AVIF, when
+    this Pillow build supports it) copies into `out_dir`. Runs inside the
+    process pool, so it only takes and returns plain data.
+
+    Raises ValueError if the file is not an image Pillow can read.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+    try:
+        with Image.open(source_path) as probe:
+            probe.verify()
+        image = Image.open(source_path)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ValueError(f"Not a supported image: {e}")
+
+    with image:
+        content_type = Image.MIME.get(image.format, "application/octet-stream")
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        formats = [("webp", {"quality": 80, "method": 4})]
+        if features.check("avif"):
+            formats.append(("avif", {"quality": 55}))
+
+        # Never upscale; always include one variant at the original width
+        # (capped at the largest configured size).
+        targets = sorted({w for w in widths if w < image.width} | {min(image.width, max(widths))})
+
+        variants = []
+        for width in targets:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize(
+                (width, height), Image.LANCZOS
+            )
+            for fmt, options in formats:
+                filename = f"{width}.{fmt}"
+                resized.save(os.path.join(out_dir, filename), fmt.upper(), **options)
+                variants.append({"width": width, "format": fmt, "filename": filename})
+
+        return {
+            "content_type": content_type,
+            "width": image.width,
+            "height": image.height,
+            "variants": variants,
+        }
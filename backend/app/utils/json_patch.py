@@ -0,0 +1,146 @@
+import copy
+from typing import Any, List
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied (RFC 6902 section 5)."""
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON Pointer into unescaped reference tokens."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def _list_index(container: list, token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve_parent(doc: Any, tokens: List[str]) -> Any:
+    target = doc
+    for token in tokens[:-1]:
+        if isinstance(target, dict):
+            if token not in target:
+                raise JsonPatchError(f"Path not found: {token!r}")
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_list_index(target, token, allow_end=False)]
+        else:
+            raise JsonPatchError(f"Cannot traverse into scalar at {token!r}")
+    return target
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return doc
+    parent = _resolve_parent(doc, tokens)
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise JsonPatchError(f"Path not found: {pointer!r}")
+        return parent[last]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, last, allow_end=False)]
+    raise JsonPatchError(f"Path not found: {pointer!r}")
+
+
+def _add(doc: Any, pointer: str, value: Any) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    parent = _resolve_parent(doc, tokens)
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        parent[last] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, last, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to scalar at {pointer!r}")
+    return doc
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("Cannot remove the document root")
+    parent = _resolve_parent(doc, tokens)
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise JsonPatchError(f"Path not found: {pointer!r}")
+        del parent[last]
+    elif isinstance(parent, list):
+        del parent[_list_index(parent, last, allow_end=False)]
+    else:
+        raise JsonPatchError(f"Path not found: {pointer!r}")
+    return doc
+
+
+def _replace(doc: Any, pointer: str, value: Any) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    _get(doc, pointer)  # target must exist
+    parent = _resolve_parent(doc, tokens)
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        parent[last] = value
+    else:
+        parent[_list_index(parent, last, allow_end=False)] = value
+    return doc
+
+
+def apply_patch(document: Any, operations: List[dict]) -> Any:
+    """
+    Apply RFC 6902 operations to a copy of `document` and return the result.
+    The input is never mutated, and a failing operation aborts the whole patch.
+    """
+    doc = copy.deepcopy(document)
+    for operation in operations:
+        op = operation.get("op")
+        path = operation.get("path")
+        if path is None:
+            raise JsonPatchError("Operation is missing 'path'")
+
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"'{op}' requires 'value'")
+
+        if op == "add":
+            doc = _add(doc, path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            doc = _remove(doc, path)
+        elif op == "replace":
+            doc = _replace(doc, path, copy.deepcopy(operation["value"]))
+        elif op == "move":
+            source = operation.get("from")
+            if source is None:
+                raise JsonPatchError("'move' requires 'from'")
+            if path.startswith(source + "/"):
+                raise JsonPatchError("Cannot move a value into one of its children")
+            value = _get(doc, source)
+            doc = _add(_remove(doc, source), path, value)
+        elif op == "copy":
+            source = operation.get("from")
+            if source is None:
+                raise JsonPatchError("'copy' requires 'from'")
+            doc = _add(doc, path, copy.deepcopy(_get(doc, source)))
+        elif op == "test":
+            if _get(doc, path) != operation["value"]:
+                raise JsonPatchError(f"Test failed at {path!r}")
+        else:
+            raise JsonPatchError(f"Unsupported operation: {op!r}")
+    return doc
@@ -0,0 +1,240 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional
+
+import anyio
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+# Room for the text fields and multipart framing on top of the file itself
+FORM_OVERHEAD_BYTES = 128 * 1024
+
+# Body bytes handed to the parser per trip to the threadpool (which does the
+# file writes): large enough that the hop costs nothing next to the I/O
+_WRITE_BATCH_BYTES = 256 * 1024
+
+
+class UploadTooLarge(Exception):
+    """A file or form field went over its size limit."""
+
+
+class MalformedForm(ValueError):
+    """The body is not valid multipart/form-data, or breaks the form limits."""
+
+
+@dataclass
+class StreamedFile:
+    field: str
+    filename: str
+    content_type: str
+    path: str
+    size: int
+    sha256: str
+
+
+class StreamingFormParser:
+    """
+    Incremental multipart/form-data parser that writes file parts straight to
+    `upload_dir` as the body arrives, hashing them on the way.
+
+    Unlike `request.form()`, nothing is spooled or buffered whole: memory use
+    is one chunk passed to `write` plus the small text fields, and size limits abort the
+    upload mid-stream rather than after it was received. `max_file_bytes`
+    applies to each file; `max_body_bytes` (default: one full-size file plus
+    `FORM_OVERHEAD_BYTES`) caps the whole body, whatever the number of parts.
+    """
+
+    def __init__(
+        self,
+        content_type_header: str,
+        upload_dir: str,
+        max_file_bytes: int,
+        max_field_bytes: int = 64 * 1024,
+        max_parts: int = 20,
+        max_body_bytes: Optional[int] = None,
+    ):
+        content_type, params = parse_options_header(content_type_header)
+        boundary = params.get(b"boundary")
+        if content_type != b"multipart/form-data" or not boundary:
+            raise MalformedForm("Expected multipart/form-data")
+
+        self.upload_dir = upload_dir
+        self.max_file_bytes = max_file_bytes
+        self.max_field_bytes = max_field_bytes
+        self.max_parts = max_parts
+        self.max_body_bytes = (
+            max_file_bytes + FORM_OVERHEAD_BYTES if max_body_bytes is None else max_body_bytes
+        )
+
+        self.fields: Dict[str, str] = {}
+        self.files: List[StreamedFile] = []
+
+        self._parts = 0
+        self._received = 0
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._name: Optional[str] = None
+        self._filename: Optional[str] = None
+        self._value = bytearray()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        self._size = 0
+        self._digest = None
+
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def write(self, chunk: bytes) -> None:
+        self._received += len(chunk)
+        if self._received > self.max_body_bytes:
+            self.close()
+            raise UploadTooLarge("Request body is too large")
+        try:
+            self._parser.write(chunk)
+        except (UploadTooLarge, MalformedForm):
+            self.close()
+            raise
+        except Exception as e:  # parser errors
+            self.close()
+            raise MalformedForm(str(e))
+
+    def finalize(self) -> None:
+        try:
+            self._parser.finalize()
+        except Exception as e:
+            self.close()
+            raise MalformedForm(str(e))
+        if self._file is not None:
+            self.close()
+            raise MalformedForm("Body ended inside a file part")
+
+    def close(self) -> None:
+        """Close the part being written, if any (the caller removes `upload_dir`)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- parser callbacks ---
+
+    def _on_part_begin(self) -> None:
+        self._parts += 1
+        if self._parts > self.max_parts:
+            raise MalformedForm("Too many form parts")
+        self._headers = {}
+        self._value = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name")
+        if name is None:
+            raise MalformedForm("Form part without a name")
+        self._name = name.decode("utf-8", "replace")
+
+        filename = options.get(b"filename")
+        self._filename = filename.decode("utf-8", "replace") if filename is not None else None
+        if self._filename is not None:
+            self._path = os.path.join(self.upload_dir, f"part-{self._parts}")
+            self._file = open(self._path, "wb")
+            self._size = 0
+            self._digest = hashlib.sha256()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        if self._file is None:
+            self._value += chunk
+            if len(self._value) > self.max_field_bytes:
+                raise UploadTooLarge(f"Field '{self._name}' is too large")
+            return
+
+        self._size += len(chunk)
+        if self._size > self.max_file_bytes:
+            raise UploadTooLarge("File is too large")
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def _on_part_end(self) -> None:
+        if self._file is None:
+            self.fields[self._name] = self._value.decode("utf-8", "replace")
+            return
+
+        self._file.close()
+        self._file = None
+        content_type = self._headers.get(b"content-type", b"application/octet-stream")
+        self.files.append(
+            StreamedFile(
+                field=self._name,
+                filename=os.path.basename(self._filename.replace("\\", "/")),
+                content_type=content_type.decode("latin-1"),
+                path=self._path,
+                size=self._size,
+                sha256=self._digest.hexdigest(),
+            )
+        )
+
+
+async def stream_form(request, upload_dir: str, max_file_bytes: int, **limits) -> StreamingFormParser:
+    """
+    Parse the request body of `request` with a `StreamingFormParser`, reading
+    it chunk by chunk. Parsing and file writes run in the threadpool, a batch
+    of chunks at a time, never on the event loop. Raises `UploadTooLarge` /
+    `MalformedForm`.
+    """
+    form = StreamingFormParser(
+        request.headers.get("content-type", ""), upload_dir, max_file_bytes, **limits
+    )
+    batch = bytearray()
+    try:
+        async for chunk in request.stream():
+            batch += chunk
+            if len(batch) >= _WRITE_BATCH_BYTES:
+                await run_in_threadpool(form.write, bytes(batch))
+                batch.clear()
+        if batch:
+            await run_in_threadpool(form.write, bytes(batch))
+        await run_in_threadpool(form.finalize)
+    except BaseException:
+        # e.g. the client disconnected: don't leave the part's file open
+        form.close()
+        raise
+    return form
+
+
+async def create_upload_dir(root: str) -> str:
+    """New private scratch directory under `root` (created off the event loop)."""
+
+    def create() -> str:
+        os.makedirs(root, exist_ok=True)
+        return tempfile.mkdtemp(dir=root)
+
+    return await run_in_threadpool(create)
+
+
+async def remove_upload_dir(upload_dir: str) -> None:
+    """Delete `upload_dir` off the event loop, also when the request was cancelled."""
+    with anyio.CancelScope(shield=True):
+        await run_in_threadpool(shutil.rmtree, upload_dir, ignore_errors=True)
@@ -0,0 +1,70 @@
+import html
+import re
+from typing import List, Tuple
+
+EXCERPT_LENGTH = 200
+
+_BULLET_RE = re.compile(r"^\s*[-*•]\s+")
+_HEADING_RE = re.compile(r"^\s*#{1,6}\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def render_description(text: str) -> Tuple[str, str]:
+    """
+    Render a free-text job description once, at write time.
+
+    Returns `(html, excerpt)`. The HTML is safe by construction: every piece
+    of user text is escaped and only a fixed set of tags is emitted
+    (`<p>`, `<br>`, `<ul>`, `<li>`, `<h3>`). Supported input conventions:
+    blank lines separate paragraphs, lines starting with `-`, `*` or `•`
+    become list items, and lines starting with `#` become headings.
+    """
+    if not text:
+        return "", ""
+
+    blocks: List[str] = []
+    paragraph: List[str] = []
+    items: List[str] = []
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            blocks.append("<p>" + "<br>".join(paragraph) + "</p>")
+            paragraph.clear()
+
+    def flush_items() -> None:
+        if items:
+            blocks.append(
+                "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+            )
+            items.clear()
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            flush_paragraph()
+            flush_items()
+        elif _BULLET_RE.match(line):
+            flush_paragraph()
+            items.append(html.escape(_BULLET_RE.sub("", line)))
+        elif _HEADING_RE.match(line):
+            flush_paragraph()
+            flush_items()
+            blocks.append(f"<h3>{html.escape(_HEADING_RE.sub('', line))}</h3>")
+        else:
+            flush_items()
+            paragraph.append(html.escape(line))
+
+    flush_paragraph()
+    flush_items()
+
+    return "".join(blocks), make_excerpt(text)
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Plain-text summary: markup stripped, whitespace collapsed, cut at a word."""
+    lines = [_HEADING_RE.sub("", _BULLET_RE.sub("", line)) for line in text.splitlines()]
+    plain = _WHITESPACE_RE.sub(" ", " ".join(lines)).strip()
+    if len(plain) <= length:
+        return plain
+    cut = plain[:length].rsplit(" ", 1)[0]
+    return cut.rstrip(",.;:") + "…"
@@ -0,0 +1,68 @@
+import logging
+import re
+import zipfile
+from typing import Optional
+from xml.etree import ElementTree
+
+logger = logging.getLogger(__name__)
+
+# Extension -> content type for the resume formats we accept
+RESUME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".txt": "text/plain",
+}
+
+MAX_TEXT_CHARS = 100_000
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_WHITESPACE_RE = re.compile(r"[ \t\r\f\v]+")
+
+
+def _pdf_text(path: str) -> Optional[str]:
+    try:
+        from pypdf import PdfReader  # optional dependency
+    except ImportError:
+        logger.info("pypdf not installed; skipping PDF text extraction")
+        return None
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _docx_text(path: str) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = [
+        "".join(node.text or "" for node in paragraph.iter(f"{_WORD_NS}t"))
+        for paragraph in root.iter(f"{_WORD_NS}p")
+    ]
+    return "\n".join(paragraphs)
+
+
+def _txt_text(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read(MAX_TEXT_CHARS * 4).decode("utf-8", "replace")
+
+
+_EXTRACTORS = {".pdf": _pdf_text, ".docx": _docx_text, ".txt": _txt_text}
+
+
+def extract_text(path: str, extension: str) -> Optional[str]:
+    """
+    Plain text of a resume for search / screening, or None when the format
+    cannot be read. Raises ValueError for files that are not what their
+    extension claims.
+    """
+    extractor = _EXTRACTORS.get(extension)
+    if extractor is None:
+        return None
+    try:
+        text = extractor(path)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ValueError(f"Unreadable {extension} file: {e}")
+    except Exception as e:  # pypdf raises its own error types
+        raise ValueError(f"Unreadable {extension} file: {e}")
+    if text is None:
+        return None
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return text[:MAX_TEXT_CHARS]
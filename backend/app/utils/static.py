@@ -0,0 +1,11 @@
+from starlette.staticfiles import StaticFiles
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """Static files whose paths are content-addressed, so they never change."""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
@@ -0,0 +1,38 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Thread pool for application post-processing, created on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(
+            max_workers=settings.application_workers, thread_name_prefix="applications"
+        )
+    return _pool
+
+
+def _log_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Background job failed", exc_info=future.exception())
+
+
+def submit(fn, *args) -> Future:
+    future = get_pool().submit(fn, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def shutdown_pool() -> None:
+    """Let running jobs finish; queued ones are dropped and picked up again at startup."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
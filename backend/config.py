@@ -11,7 +11,8 @@ class Settings:
         self.environment: str = os.getenv("ENVIRONMENT", "development")
         self.debug: bool = os.getenv("DEBUG", "True").lower() == "true"
         self.api_host: str = os.getenv("API_HOST", "0.0.0.0")
-        self.api_port: int = int(os.getenv("API_PORT", "8000"))
+        # PORT (set by most hosting platforms) wins over API_PORT
+        self.api_port: int = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
         
         # Parse CORS origins from comma-separated string
         cors_origins_str = os.getenv(
@@ -30,6 +31,175 @@ class Settings:
         
         self.supabase_secret_key: str = os.getenv("SUPABASE_SECRET_KEY", "")
 
+        # Database pool / startup warm-up
+        self.db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_warm: int = int(os.getenv("DB_POOL_WARM", "2"))
+        self.db_create_tables: bool = (
+            os.getenv("DB_CREATE_TABLES", "True").lower() == "true"
+        )
+
+        # Read replicas for public GET traffic (comma-separated URLs)
+        replica_urls_str = os.getenv("DATABASE_REPLICA_URLS", "")
+        self.database_replica_urls: List[str] = [
+            url.strip()
+            for url in replica_urls_str.split(",")
+            if url.strip()
+        ]
+        self.replica_retry_seconds: int = int(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+        self.read_your_writes_seconds: int = int(
+            os.getenv("READ_YOUR_WRITES_SECONDS", "10")
+        )
+
+        # Public career page cache
+        self.cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "60"))
+        self.cache_prime_slugs: int = int(os.getenv("CACHE_PRIME_SLUGS", "20"))
+        self.cache_shared_ttl_seconds: int = int(
+            os.getenv("CACHE_SHARED_TTL_SECONDS", "600")
+        )
+        # How long an expired entry may still be served while it is refreshed
+        self.cache_stale_seconds: int = int(os.getenv("CACHE_STALE_SECONDS", "300"))
+        self.cache_version_ttl_seconds: int = int(
+            os.getenv("CACHE_VERSION_TTL_SECONDS", "86400")
+        )
+        # Browser / CDN freshness of the public career page; after that clients
+        # revalidate with If-None-Match and usually get a 304
+        self.careers_max_age_seconds: int = int(os.getenv("CAREERS_MAX_AGE_SECONDS", "60"))
+        # Shared cache across workers (Redis protocol). Empty = in-process only.
+        self.redis_url: str = os.getenv("REDIS_URL", "")
+
+        # Admission control (rate limiting / load shedding)
+        self.rate_limit_enabled: bool = (
+            os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+        )
+        # "memory" (per worker) or "redis" (shared, uses REDIS_URL)
+        self.rate_limit_backend: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+        self.rate_limit_ip_rate: float = float(os.getenv("RATE_LIMIT_IP_RATE", "5"))
+        self.rate_limit_ip_burst: int = int(os.getenv("RATE_LIMIT_IP_BURST", "30"))
+        self.rate_limit_tenant_rate: float = float(
+            os.getenv("RATE_LIMIT_TENANT_RATE", "50")
+        )
+        self.rate_limit_tenant_burst: int = int(
+            os.getenv("RATE_LIMIT_TENANT_BURST", "200")
+        )
+        # Job searches (global search, filtered listings) bypass the cache,
+        # so they cost more tokens
+        self.rate_limit_search_cost: int = int(os.getenv("RATE_LIMIT_SEARCH_COST", "5"))
+        # Requests allowed in flight per worker; defaults to DB pool capacity
+        self.max_concurrent_requests: int = int(
+            os.getenv(
+                "MAX_CONCURRENT_REQUESTS",
+                str(self.db_pool_size + self.db_max_overflow),
+            )
+        )
+        # Uploaded images (content-addressed, served as immutable files)
+        self.media_root: str = os.getenv("MEDIA_ROOT", "media")
+        # Public prefix for media URLs; point at a CDN / bucket in production
+        self.media_base_url: str = os.getenv("MEDIA_BASE_URL", "/media").rstrip("/")
+        self.max_image_upload_bytes: int = int(
+            os.getenv("MAX_IMAGE_UPLOAD_BYTES", str(10 * 1024 * 1024))
+        )
+        self.image_variant_widths: List[int] = [
+            int(width)
+            for width in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1280").split(",")
+            if width.strip()
+        ]
+        self.image_workers: int = int(os.getenv("IMAGE_WORKERS", "2"))
+        # Scratch space for uploads in progress. Must be outside MEDIA_ROOT,
+        # which is served publicly; ideally on the same filesystem.
+        self.upload_tmp_root: str = os.getenv("UPLOAD_TMP_ROOT", "upload_tmp")
+
+        # Candidate resumes: private (never served statically), content-addressed
+        self.resume_root: str = os.getenv("RESUME_ROOT", "resumes")
+        self.max_resume_upload_bytes: int = int(
+            os.getenv("MAX_RESUME_UPLOAD_BYTES", str(5 * 1024 * 1024))
+        )
+        # Threads for application post-processing (text extraction, dedup, notify)
+        self.application_workers: int = int(os.getenv("APPLICATION_WORKERS", "2"))
+
+        # SEO feeds (sharded sitemaps + JSON-LD JobPosting per company)
+        self.site_base_url: str = os.getenv(
+            "SITE_BASE_URL", "http://localhost:5173"
+        ).rstrip("/")
+        self.feeds_root: str = os.getenv("FEEDS_ROOT", "feeds")
+        # Absolute URL the feeds directory is served at (used in sitemap.xml)
+        self.feeds_base_url: str = os.getenv(
+            "FEEDS_BASE_URL", f"http://localhost:{self.api_port}/feeds"
+        ).rstrip("/")
+        # Seconds between incremental regenerations; 0 disables the background task
+        self.feeds_interval_seconds: int = int(os.getenv("FEEDS_INTERVAL_SECONDS", "300"))
+
+        # Job archival: deleted jobs stay restorable in place for the retention
+        # window, inactive ones for the idle window; then both move to jobs_archive
+        self.job_delete_retention_days: int = int(os.getenv("JOB_DELETE_RETENTION_DAYS", "30"))
+        self.job_archive_inactive_days: int = int(os.getenv("JOB_ARCHIVE_INACTIVE_DAYS", "90"))
+        # Seconds between archiver runs; 0 disables the background task
+        self.job_archive_interval_seconds: int = int(
+            os.getenv("JOB_ARCHIVE_INTERVAL_SECONDS", "3600")
+        )
+
+        # View / apply-click analytics, buffered per worker (app/analytics.py)
+        self.analytics_enabled: bool = (
+            os.getenv("ANALYTICS_ENABLED", "True").lower() == "true"
+        )
+        self.analytics_flush_seconds: int = int(os.getenv("ANALYTICS_FLUSH_SECONDS", "10"))
+        self.analytics_flush_events: int = int(os.getenv("ANALYTICS_FLUSH_EVENTS", "5000"))
+
+        # Custom domains are reloaded on every change; this periodic reload is
+        # only a fallback for a missed notification. 0 disables it
+        self.domains_refresh_seconds: int = int(os.getenv("DOMAINS_REFRESH_SECONDS", "600"))
+        # The platform's own hostnames (comma-separated), never accepted as a
+        # custom domain, nor any subdomain of them. The hosts of SITE_BASE_URL,
+        # FEEDS_BASE_URL and MEDIA_BASE_URL are always included.
+        self.platform_hosts: List[str] = [
+            host.strip().lower()
+            for host in os.getenv("PLATFORM_HOSTS", "localhost").split(",")
+            if host.strip()
+        ]
+
+        # Idempotency-Key support on create endpoints (app/idempotency.py)
+        self.idempotency_key_ttl_hours: int = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+        # Per-worker cache of completed responses in front of the table
+        self.idempotency_cache_seconds: int = int(os.getenv("IDEMPOTENCY_CACHE_SECONDS", "300"))
+        # A claim older than this is treated as abandoned by a dead worker
+        self.idempotency_lease_seconds: int = int(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "30"))
+        # Seconds between purges of expired keys; 0 disables the background task
+        self.idempotency_purge_interval_seconds: int = int(
+            os.getenv("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", "3600")
+        )
+
+        # Salary normalization (app/crud/salaries.py): salary filters and sorts
+        # compare amounts converted to this currency using the rates file
+        self.salary_base_currency: str = os.getenv("SALARY_BASE_CURRENCY", "USD")
+        self.exchange_rates_file: str = os.getenv("EXCHANGE_RATES_FILE", "exchange_rates.json")
+        # Seconds between checks of the rates file; 0 disables the background task
+        self.exchange_rates_interval_seconds: int = int(
+            os.getenv("EXCHANGE_RATES_INTERVAL_SECONDS", "600")
+        )
+
+        # Offline gazetteer (GeoNames cities dump) job locations are geocoded
+        # against; without it locations are still flagged remote / hybrid but
+        # get no place, so `near=` finds nothing
+        self.gazetteer_file: str = os.getenv("GAZETTEER_FILE", "cities15000.txt")
+
+        # Production server (serve.py). WEB_CONCURRENCY=0 means one worker per
+        # CPU core; each worker has its own DB pool (db_pool_size + db_max_overflow)
+        self.web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+        # Recycle a worker after this many requests (+ up to 10% jitter); 0 = never
+        self.server_max_requests: int = int(os.getenv("SERVER_MAX_REQUESTS", "10000"))
+        # Keep above the load balancer's idle timeout so it never reuses a closed connection
+        self.server_keepalive_seconds: int = int(os.getenv("SERVER_KEEPALIVE_SECONDS", "65"))
+        self.server_backlog: int = int(os.getenv("SERVER_BACKLOG", "2048"))
+        # Seconds in-flight requests get to finish on reload / shutdown
+        self.server_graceful_timeout: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+
+        # Required behind a load balancer / reverse proxy (which sets
+        # X-Forwarded-For): otherwise every visitor shares the proxy's rate
+        # limit bucket. Never enable without one, or clients pick their own IP.
+        self.trust_forwarded_for: bool = (
+            os.getenv("TRUST_FORWARDED_FOR", "False").lower() == "true"
+        )
+
 
 settings = Settings()
 
@@ -1,24 +1,130 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 
-from app import models
-from app.database import engine
+from app import analytics, cache, database, domains, idempotency, models
+from app.crud.applications import get_pending_application_ids, process_application
+from app.crud.company import prime_company_cache
+from app.crud.job_archive import archive_stale_jobs
+from app.crud.salaries import refresh_exchange_rates
+from app.feeds import refresh_feeds
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.custom_domain import CustomDomainMiddleware
 from app.routers import api_router
+from app.utils import workers
+from app.utils.gazetteer import get_gazetteer
+from app.utils.images import shutdown_pool
+from app.utils.static import ImmutableStaticFiles
 from config import settings
 
 import os
 
-# Create DB tables at startup (safe to call multiple times)
-models.Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+
+def _startup() -> None:
+    """Blocking startup work: engine, tables, pool pre-fill and cache priming."""
+    engine = database.init_engine()
+
+    # Create DB tables at startup (safe to call multiple times)
+    if settings.db_create_tables:
+        models.Base.metadata.create_all(bind=engine)
+
+    warmed = database.warm_pool(settings.db_pool_warm)
+    # Load the place names now rather than on the first job write / location search
+    get_gazetteer()
+
+    db = database.SessionLocal()
+    try:
+        primed = prime_company_cache(db, settings.cache_prime_slugs)
+        hosts = domains.load_host_map(db)
+        # Applications whose post-processing was cut short by a restart
+        for application_id in get_pending_application_ids(db):
+            workers.submit(database.run_in_session, process_application, application_id)
+        # Now rather than one interval from now: the rates file may have
+        # changed while the API was down
+        try:
+            refresh_exchange_rates(db)
+        except Exception:
+            db.rollback()
+            logger.exception("Could not load the exchange rates file")
+    finally:
+        db.close()
+
+    logger.info(
+        "Startup complete: %s pooled connections, %s slugs cached, %s custom domains",
+        warmed,
+        primed,
+        hosts,
+    )
+
+
+async def _run_periodically(interval: int, fn) -> None:
+    """Run `fn(db)` in the threadpool every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(database.run_in_session, fn)
+        except Exception:
+            logger.exception("Background task %s failed", fn.__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    domains.start_listener()
+    cache.start_invalidation_listener()
+    analytics.start_flusher()
+    try:
+        await run_in_threadpool(_startup)
+    except Exception:
+        # Keep serving so /health/live answers; /health/ready reports the failure.
+        logger.exception("Database warm-up failed")
+
+    background_tasks = [
+        asyncio.create_task(_run_periodically(interval, fn))
+        for interval, fn in (
+            (settings.feeds_interval_seconds, refresh_feeds),
+            (settings.job_archive_interval_seconds, archive_stale_jobs),
+            (settings.domains_refresh_seconds, domains.load_host_map),
+            (settings.idempotency_purge_interval_seconds, idempotency.purge_expired_keys),
+            (settings.exchange_rates_interval_seconds, refresh_exchange_rates),
+        )
+        if interval > 0
+    ]
+    yield
+    for task in background_tasks:
+        task.cancel()
+    # Before the engine goes away: writes out buffered analytics events.
+    await run_in_threadpool(analytics.stop_flusher)
+    shutdown_pool()
+    await run_in_threadpool(workers.shutdown_pool)
+    cache.stop_invalidation_listener()
+    database.dispose_engine()
+
 
 app = FastAPI(
     title="Career Page Builder API",
     description="API for Career Page Builder application",
     version="1.0.0",
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
+# Rate limiting / load shedding. Added before CORS so CORS wraps it and
+# 429/503 responses still carry CORS headers.
+if settings.rate_limit_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Custom domains: rewrites /api/careers and /api/jobs on a tenant's own host to
+# the slug routes. Runs before admission control so tenant buckets apply.
+app.add_middleware(CustomDomainMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -31,6 +137,14 @@ app.add_middleware(
 # Include routers
 app.include_router(api_router, prefix="/api")
 
+# Uploaded images. Paths are content-addressed, so they are served as immutable.
+os.makedirs(settings.media_root, exist_ok=True)
+app.mount("/media", ImmutableStaticFiles(directory=settings.media_root), name="media")
+
+# Sitemaps and JSON-LD job feeds, regenerated in the background (app/feeds.py).
+os.makedirs(settings.feeds_root, exist_ok=True)
+app.mount("/feeds", StaticFiles(directory=settings.feeds_root), name="feeds")
+
 
 @app.get("/")
 async def root():
@@ -43,7 +157,7 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", settings.api_port))
+    # Single-process development server; run `python serve.py` in production.
     uvicorn.run(
         "main:app",
         host=settings.api_host,
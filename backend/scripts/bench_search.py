@@ -0,0 +1,129 @@
+"""
+Latency benchmark for the global job search index.
+
+Seeds synthetic companies and jobs (default 1M jobs) inside one transaction,
+indexes them, times typical job board queries and rolls everything back, so
+it can be pointed at a staging database without leaving data behind. Needs
+the `job_search_index` table and the migrate.py indexes to exist.
+
+Usage (from backend/):
+    python scripts/bench_search.py [--jobs 1000000] [--companies 5000] [--runs 50]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text  # noqa: E402
+
+from app import database  # noqa: E402
+from app.crud.job_search import _index_active_jobs, _search  # noqa: E402
+from app.crud.salaries import normalize_salaries  # noqa: E402
+from app.models.company import Company  # noqa: E402
+from app.models.job import Job  # noqa: E402
+
+RECRUITER_ID = "bench-search"
+
+SEED_COMPANIES = """
+INSERT INTO companies (company_name, recruiter_id, slug, branding_config, page_content)
+SELECT 'Bench Company ' || g, :recruiter, 'bench-search-' || g, '{}'::jsonb, '{}'::jsonb
+FROM generate_series(1, :companies) AS g
+"""
+
+SEED_JOBS = """
+WITH ids AS (SELECT array_agg(id) AS ids FROM companies WHERE recruiter_id = :recruiter)
+INSERT INTO jobs (title, location, description, job_type, min_salary, max_salary,
+                  currency, company_id, is_active)
+SELECT
+    (ARRAY['Junior', 'Senior', 'Staff', 'Lead'])[1 + g % 4] || ' ' ||
+    (ARRAY['Backend Engineer', 'Frontend Engineer', 'Product Designer',
+           'Data Scientist', 'Account Executive', 'Support Specialist',
+           'DevOps Engineer', 'Product Manager'])[1 + (g / 4) % 8],
+    (ARRAY['Berlin', 'London', 'New York', 'Remote', 'Bangalore', 'Toronto',
+           'Singapore', 'Austin'])[1 + (g / 32) % 8],
+    'Benchmark posting',
+    (ARRAY['FULL_TIME', 'PART_TIME', 'CONTRACT', 'INTERNSHIP'])[1 + (g / 7) % 4]::jobtype,
+    30000 + (g % 120) * 1000,
+    50000 + (g % 120) * 1500,
+    'USD',
+    ids.ids[1 + g % :companies],
+    g % 10 <> 0
+FROM generate_series(1, :jobs) AS g, ids
+"""
+
+# Seeded salaries are in USD, the default base currency
+SEED_BASE_RATE = "INSERT INTO exchange_rates (currency, rate) VALUES ('USD', 1) ON CONFLICT DO NOTHING"
+
+QUERIES = {
+    "first page": {},
+    "keyword": {"search": "engineer"},
+    "phrase + location": {"search": '"product designer"', "location": "berl"},
+    "type + salary": {"job_type": "Contract", "min_salary": 120000},
+    "by salary": {"sort": "salary", "min_salary": 100000},
+    "rare combo": {"search": "staff scientist", "location": "singapore", "max_salary": 40000},
+}
+
+
+def time_query(db, runs: int, **filters) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _search(
+            db,
+            filters.get("search"),
+            filters.get("location"),
+            filters.get("job_type"),
+            filters.get("min_salary"),
+            filters.get("max_salary"),
+            filters.get("cursor"),
+            20,
+            filters.get("sort", "newest"),
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--companies", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    database.init_engine()
+    db = database.SessionLocal()
+    try:
+        params = {"recruiter": RECRUITER_ID, "companies": args.companies, "jobs": args.jobs}
+        start = time.perf_counter()
+        db.execute(text(SEED_COMPANIES), params)
+        db.execute(text(SEED_JOBS), params)
+        bench_companies = select(Company.id).where(Company.recruiter_id == RECRUITER_ID)
+        db.execute(text(SEED_BASE_RATE))
+        normalize_salaries(db, Job.company_id.in_(bench_companies))
+        _index_active_jobs(db, Job.company_id.in_(bench_companies))
+        db.execute(text("ANALYZE jobs, job_search_index"))
+        print(f"Seeded and indexed {args.jobs} jobs in {time.perf_counter() - start:.1f}s")
+
+        # A page deep in the result set: keyset pagination should not slow down.
+        middle = db.execute(
+            text("SELECT percentile_disc(0.5) WITHIN GROUP (ORDER BY job_id) FROM job_search_index")
+        ).scalar()
+        queries = dict(QUERIES, **{"deep page": {"search": "engineer", "cursor": (middle,)}})
+
+        for name, filters in queries.items():
+            samples = sorted(time_query(db, args.runs, **filters))
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            print(
+                f"{name:<20} p50 {statistics.median(samples):7.1f} ms   "
+                f"p95 {p95:7.1f} ms   max {samples[-1]:7.1f} ms"
+            )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Throughput benchmark: the development server (`python main.py`, one process)
+against the production launcher (`python serve.py`).
+
+Starts each server on a free port, waits until it answers, then keeps
+`--connections` keep-alive connections busy against `--path` for
+`--seconds` and reports requests/second and latency percentiles. The default
+path needs no database, so this measures the server stack itself; point it at
+a cached route (e.g. `/api/companies/<slug>/careers`) against a real database
+for end-to-end numbers. The load generator runs on the same machine, so run
+it on a host with spare cores. With more than one core, serve.py needs
+`REDIS_URL` (e.g. a local Redis) or it refuses to start.
+
+Usage (from backend/):
+    python scripts/bench_server.py [--path /health] [--seconds 10] [--connections 64]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "single (python main.py)": ["main.py"],
+    "serve.py": ["serve.py"],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(script, port: int, debug: str) -> subprocess.Popen:
+    env = dict(os.environ, PORT=str(port), API_HOST="127.0.0.1", DEBUG=debug)
+    return subprocess.Popen(
+        [sys.executable, *script],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(server: subprocess.Popen, base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode} before answering")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start")
+
+
+async def _request(reader, writer, request: bytes) -> int:
+    writer.write(request)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Server closed the connection")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def load(port: int, path: str, seconds: float, connections: int):
+    """Raw keep-alive HTTP/1.1 clients: cheap enough not to be the bottleneck."""
+    latencies = []
+    errors = 0
+    # Keep-alive connections the server closed (e.g. a worker being recycled);
+    # like any HTTP client, retry those on a new connection.
+    reconnects = 0
+    request = f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode()
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        nonlocal errors, reconnects
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    if await _request(reader, writer, request) >= 500:
+                        errors += 1
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    reconnects += 1
+                    writer.close()
+                    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                    continue
+                latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    return latencies, errors, reconnects, time.perf_counter() - started
+
+
+def report(name: str, latencies, errors: int, reconnects: int, elapsed: float) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<26} {len(latencies) / elapsed:>9.0f} req/s   "
+        f"p50 {cuts[49] * 1000:6.1f} ms   p99 {cuts[98] * 1000:6.1f} ms   "
+        f"5xx {errors}   reconnects {reconnects}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--warmup", type=float, default=2)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.connections} connections, {args.seconds:g}s per mode")
+    for name, script in MODES.items():
+        port = free_port()
+        # The single-process mode runs as the repo defaults it (DEBUG=True: reload on)
+        server = start_server(script, port, "True" if script == ["main.py"] else "False")
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            wait_ready(server, base_url)
+            asyncio.run(load(port, args.path, args.warmup, args.connections))
+            report(name, *asyncio.run(load(port, args.path, args.seconds, args.connections)))
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measure how long `import main` takes in a fresh interpreter and fail if it
+exceeds the budget. Importing the app must not touch the network, so this
+stays fast even when the database is unreachable.
+
+Usage (from backend/):
+    python scripts/check_import_time.py [--budget-ms 1500] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = (
+    "import time; t = time.perf_counter(); import main; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_once() -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", SNIPPET],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500")),
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print(
+        f"import main: median {median:.0f} ms, "
+        f"min {min(samples):.0f} ms, max {max(samples):.0f} ms "
+        f"(budget {args.budget_ms:.0f} ms)"
+    )
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+Regenerate the sitemap shards and JSON-LD job feeds under FEEDS_ROOT.
+The API does this incrementally in the background; use `--full` to rebuild
+everything from scratch (e.g. after changing SITE_BASE_URL).
+
+Usage (from backend/):
+    python scripts/generate_feeds.py [--full]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import database  # noqa: E402
+from app.feeds import regenerate_feeds  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--full", action="store_true", help="rewrite every file")
+    args = parser.parse_args()
+
+    summary = database.run_in_session(regenerate_feeds, args.full)
+    print(f"Rewrote {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Load exchange rates from a local JSON file into `exchange_rates` and
+re-normalize the salaries of jobs in currencies whose rate changed. The API
+does the same in the background whenever EXCHANGE_RATES_FILE changes; use
+`--full` to recompute every job (e.g. after changing SALARY_BASE_CURRENCY).
+
+Usage (from backend/):
+    python scripts/load_exchange_rates.py [--file exchange_rates.json] [--full]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import database  # noqa: E402
+from app.crud.salaries import (  # noqa: E402
+    load_exchange_rates,
+    read_rates_file,
+    renormalize_salaries,
+)
+from config import settings  # noqa: E402
+
+
+def run(db, path: str, full: bool) -> None:
+    changed = load_exchange_rates(db, read_rates_file(path))
+    print(f"Rates changed: {', '.join(sorted(changed)) or 'none'}")
+    if full or changed:
+        updated = renormalize_salaries(db, None if full else changed)
+        print(f"Re-normalized {updated} jobs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file", default=settings.exchange_rates_file)
+    parser.add_argument("--full", action="store_true", help="recompute every job")
+    args = parser.parse_args()
+
+    database.run_in_session(run, args.file, args.full)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Apply schema changes that `Base.metadata.create_all` cannot make on an
+existing database (new columns / indexes on tables that already exist),
+then run the matching data backfills. Every step is idempotent.
+
+Usage (from backend/):
+    python scripts/migrate.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.orm import undefer  # noqa: E402
+
+from app import database, models  # noqa: E402
+from app.crud.company import _snapshot  # noqa: E402
+from app.crud.job_search import rebuild_index  # noqa: E402
+from app.crud.locations import geocode_jobs  # noqa: E402
+from app.crud.salaries import refresh_exchange_rates, renormalize_salaries  # noqa: E402
+from app.models.company import Company  # noqa: E402
+from app.models.job import Job  # noqa: E402
+from app.utils.rendering import render_description  # noqa: E402
+
+DDL = [
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS description_html TEXT",
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS description_excerpt VARCHAR(256)",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS published_version_id INTEGER "
+    "REFERENCES company_page_versions(id) ON DELETE SET NULL",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS draft_version INTEGER NOT NULL DEFAULT 1",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company_id ON jobs (company_id)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_updated_at ON jobs (updated_at)",
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company_active ON jobs (company_id, id) "
+    "WHERE is_active",
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS min_salary_normalized INTEGER",
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS max_salary_normalized INTEGER",
+    "ALTER TABLE jobs_archive ADD COLUMN IF NOT EXISTS min_salary_normalized INTEGER",
+    "ALTER TABLE jobs_archive ADD COLUMN IF NOT EXISTS max_salary_normalized INTEGER",
+    "ALTER TABLE job_search_index ADD COLUMN IF NOT EXISTS min_salary_normalized INTEGER",
+    "ALTER TABLE job_search_index ADD COLUMN IF NOT EXISTS max_salary_normalized INTEGER",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_max_salary_id "
+    "ON job_search_index (max_salary_normalized, job_id)",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_min_salary_id "
+    "ON job_search_index (min_salary_normalized, job_id)",
+    *[
+        statement
+        for table in ("jobs", "jobs_archive", "job_search_index")
+        for statement in (
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS place_id INTEGER",
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION",
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION",
+            f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS geohash VARCHAR(12) COLLATE "C"',
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS is_remote BOOLEAN NOT NULL DEFAULT false",
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS is_hybrid BOOLEAN NOT NULL DEFAULT false",
+        )
+    ],
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company_place ON jobs (company_id, place_id)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company_geohash ON jobs (company_id, geohash)",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_place_id ON job_search_index (place_id, job_id)",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_geohash ON job_search_index (geohash)",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_remote_id ON job_search_index (job_id) "
+    "WHERE is_remote",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_hybrid_id ON job_search_index (job_id) "
+    "WHERE is_hybrid",
+    "ALTER TABLE custom_domains ADD COLUMN IF NOT EXISTS verified_at TIMESTAMP WITH TIME ZONE",
+    # Trigram index so `location ILIKE '%...%'` on the global index avoids a scan
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_job_search_location_trgm "
+    "ON job_search_index USING gin (location gin_trgm_ops)",
+    # Existing change log rows all get this migration's transaction id and
+    # keep their id order within it
+    "ALTER TABLE change_log ADD COLUMN IF NOT EXISTS txid BIGINT NOT NULL "
+    "DEFAULT (pg_current_xact_id()::text::bigint)",
+    "CREATE INDEX IF NOT EXISTS ix_change_log_txid_id ON change_log (txid, id)",
+    "CREATE INDEX IF NOT EXISTS ix_change_log_company_id_txid_id "
+    "ON change_log (company_id, txid, id)",
+    "DROP INDEX IF EXISTS ix_change_log_company_id_id",
+]
+
+
+def backfill_job_descriptions(db, batch_size: int = 500) -> int:
+    """
+    Render descriptions for jobs created before render-on-write existed, one
+    committed batch at a time. `description` is deferred, so it is loaded
+    with the batch rather than by one query per job.
+    """
+    last_id = 0
+    count = 0
+    while True:
+        jobs = (
+            db.query(Job)
+            .options(undefer(Job.description))
+            .filter(Job.description_html.is_(None), Job.id > last_id)
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not jobs:
+            return count
+        for job in jobs:
+            job.description_html, job.description_excerpt = render_description(
+                job.description
+            )
+        last_id = jobs[-1].id
+        db.commit()
+        count += len(jobs)
+
+
+def backfill_published_versions(db) -> int:
+    """Publish the current content as version 1 for companies never published."""
+    count = 0
+    for company in db.query(Company).filter(Company.published_version_id.is_(None)):
+        _snapshot(db, company)
+        count += 1
+    db.commit()
+    return count
+
+
+def backfill_job_locations(db) -> int:
+    """Geocode job locations against the gazetteer (GAZETTEER_FILE)."""
+    return geocode_jobs(db)
+
+
+def backfill_search_index(db) -> int:
+    """Index the active jobs that existed before the global search index."""
+    return rebuild_index(db)
+
+
+def backfill_normalized_salaries(db) -> int:
+    """Load the rates file, then normalize every job's salary."""
+    refresh_exchange_rates(db)
+    return renormalize_salaries(db)
+
+
+BACKFILLS = [
+    backfill_job_descriptions,
+    backfill_published_versions,
+    backfill_job_locations,
+    backfill_search_index,
+    backfill_normalized_salaries,
+]
+
+
+def main() -> None:
+    engine = database.init_engine()
+    models.Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        for statement in DDL:
+            conn.execute(text(statement))
+
+    db = database.SessionLocal()
+    try:
+        for backfill in BACKFILLS:
+            print(f"{backfill.__name__}: {backfill(db)} rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
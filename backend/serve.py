@@ -0,0 +1,123 @@
+"""
+Production entrypoint: a Gunicorn master supervising uvicorn workers.
+
+Usage (from backend/):
+    python serve.py
+
+- One worker per CPU core by default (`WEB_CONCURRENCY` overrides). Each
+  worker is a full event loop plus threadpool, so more than one per core only
+  adds DB connections.
+- The app is imported once in the master and forked (`preload_app`): workers
+  start instantly and share the imported code's memory pages. Nothing touches
+  the network at import; engines, pools and listeners start in each worker's
+  lifespan.
+- uvloop / httptools are used when installed (uvicorn's "auto").
+- Workers are recycled after `SERVER_MAX_REQUESTS` requests, with jitter so
+  they do not all restart at once.
+- More than one worker requires `REDIS_URL`: without it cache invalidations
+  and custom-domain reloads only reach the worker that made the change, so
+  the others serve stale pages. It refuses to start in that case.
+
+Zero-downtime reloads:
+    kill -HUP <master pid>    new workers replace old ones gracefully. They are
+                              forked from the preloaded master, so code and
+                              settings stay exactly as they were: this only
+                              recycles workers, it picks up no changes
+    kill -USR2 <master pid>   start a new master alongside the old one; it
+                              re-imports the code and re-reads `.env` (process
+                              environment is inherited from the old master).
+                              Once it is up, `kill -TERM <old master pid>`
+
+On platforms without Gunicorn (Windows) it falls back to uvicorn's own
+multi-process supervisor, without preloading.
+"""
+import os
+import sys
+
+from config import settings
+
+
+def worker_count() -> int:
+    if settings.web_concurrency > 0:
+        return settings.web_concurrency
+    try:
+        cores = len(os.sched_getaffinity(0))  # honours container CPU pinning
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(cores, 1)
+
+
+def check_shared_backend(workers: int) -> None:
+    """Exit if several workers would each keep their own in-process cache backend."""
+    if workers > 1 and not settings.redis_url:
+        sys.exit(
+            f"serve.py: {workers} workers need a shared backend, but REDIS_URL is not set.\n"
+            "Without it cache invalidations and custom-domain changes stay inside the\n"
+            "worker that made them and the other workers serve stale data.\n"
+            "Set REDIS_URL, or WEB_CONCURRENCY=1 to run a single worker."
+        )
+
+
+def gunicorn_options() -> dict:
+    return {
+        "bind": f"{settings.api_host}:{settings.api_port}",
+        "workers": worker_count(),
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "max_requests": settings.server_max_requests,
+        "max_requests_jitter": settings.server_max_requests // 10,
+        "keepalive": settings.server_keepalive_seconds,
+        "backlog": settings.server_backlog,
+        "graceful_timeout": settings.server_graceful_timeout,
+        # Startup warms the DB pool and caches; give it time before the
+        # master considers a worker hung.
+        "timeout": 60,
+        "forwarded_allow_ips": "*" if settings.trust_forwarded_for else "127.0.0.1",
+        "accesslog": "-" if settings.debug else None,
+        "errorlog": "-",
+    }
+
+
+def run_gunicorn() -> None:
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options().items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+
+            return app
+
+    Application().run()
+
+
+def run_uvicorn() -> None:
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=worker_count(),
+        loop="auto",
+        http="auto",
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive_seconds,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        # The supervisor replaces a worker that exits after its request limit
+        limit_max_requests=settings.server_max_requests or None,
+        access_log=settings.debug,
+    )
+
+
+if __name__ == "__main__":
+    check_shared_backend(worker_count())
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        run_uvicorn()
+    else:
+        run_gunicorn()
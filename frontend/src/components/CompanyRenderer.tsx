@@ -13,6 +13,7 @@ export type CompanyDataProps = {
   branding: {
     primary_color: string
     logo_url?: string
+    logo_srcset?: string
   }
   content: {
     header: {
@@ -23,6 +24,7 @@ export type CompanyDataProps = {
       title: string
       description: string
       image_url?: string
+      image_srcset?: string
       alignment: 'left' | 'right'
     }>
   }
@@ -52,6 +54,8 @@ const CompanyRenderer: React.FC<{ data: CompanyDataProps; isPreview?: boolean }>
             <div className="mb-8 flex justify-center">
               <img 
                 src={branding.logo_url} 
+                srcSet={branding.logo_srcset}
+                sizes="192px"
                 alt="Company Logo" 
                 className="h-24 object-contain bg-white/20 backdrop-blur-sm p-3 rounded-xl shadow-lg" 
               />
@@ -93,6 +97,9 @@ const CompanyRenderer: React.FC<{ data: CompanyDataProps; isPreview?: boolean }>
                 <div className="relative group">
                   <img 
                     src={section.image_url} 
+                    srcSet={section.image_srcset}
+                    sizes="(min-width: 768px) 50vw, 100vw"
+                    loading="lazy"
                     alt={section.title} 
                     className="rounded-2xl shadow-2xl w-full h-auto object-cover transition-transform duration-300 group-hover:scale-105"
                   />
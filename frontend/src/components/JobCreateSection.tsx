@@ -1,4 +1,4 @@
-import React, { useState } from 'react'
+import React, { useRef, useState } from 'react'
 import { useParams } from 'react-router-dom'
 import { 
   List, 
@@ -33,6 +33,8 @@ const JobCreateSection = () => {
   const [submitting, setSubmitting] = useState(false)
   const [descriptionError, setDescriptionError] = useState('')
   const [refreshKey, setRefreshKey] = useState(0)
+  // One key per job being created: resubmitting after a failure reuses it
+  const idempotencyKey = useRef(crypto.randomUUID())
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault()
@@ -52,7 +54,8 @@ const JobCreateSection = () => {
         max_salary: Number(formData.max_salary) || 0,
       }
 
-      await jobsService.createJob(slug, payload)
+      await jobsService.createJob(slug, payload, idempotencyKey.current)
+      idempotencyKey.current = crypto.randomUUID()
       
       setFormData(INITIAL_FORM)
       setRefreshKey(prev => prev + 1)
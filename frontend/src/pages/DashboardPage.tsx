@@ -1,14 +1,14 @@
 import React, { useEffect, useState } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { supabase } from '../lib/supabaseClient'
-import { companyService, type Company } from '../services/companyService'
+import { companyService, type CompanyDashboardItem } from '../services/companyService'
 import { useAuth } from '../context/AuthContext'
 import { Building2, Plus, LogOut, Briefcase } from 'lucide-react'
 
 const DashboardPage = () => {
   const navigate = useNavigate()
   const { user } = useAuth()
-  const [companies, setCompanies] = useState<Company[]>([])
+  const [companies, setCompanies] = useState<CompanyDashboardItem[]>([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
 
@@ -30,7 +30,7 @@ const DashboardPage = () => {
       setLoading(true)
       setError(null)
       try {
-        const data = await companyService.getRecruiterCompanies()
+        const data = await companyService.getDashboard()
         setCompanies(data || [])
       } catch (err: any) {
         const errorMessage = err.response?.data?.message || err.message || 'Failed to fetch companies'
@@ -170,8 +170,16 @@ const DashboardPage = () => {
                     <p className="text-sm text-slate-500 mt-1">/{c.slug}</p>
                     <div className="mt-3 flex items-center space-x-2">
                       <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800">
-                        Active
+                        {c.active_jobs} active
                       </span>
+                      <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-slate-100 text-slate-700">
+                        {c.total_jobs} total
+                      </span>
+                      {c.recent_jobs > 0 && (
+                        <span className="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-blue-100 text-blue-800">
+                          {c.recent_jobs} new
+                        </span>
+                      )}
                     </div>
                   </div>
                 </div>
@@ -42,6 +42,10 @@ const JobDetailPage = () => {
 
   const handleApply = () => {
     setIsApplied(true)
+    if (slug && job) {
+      // Fire-and-forget: analytics must never block the candidate
+      jobsService.trackApplyClick(slug, job.id).catch(() => {})
+    }
   }
 
   const formatSalary = (job: Job) => {
@@ -155,9 +159,17 @@ const JobDetailPage = () => {
             <h2 className="text-2xl font-semibold text-gray-900">Job Description</h2>
           </div>
           
-          <div className="prose max-w-none text-gray-700 whitespace-pre-wrap leading-relaxed text-base">
-            {job.description}
-          </div>
+          {job.description_html ? (
+            // Rendered and escaped server-side (app/utils/rendering.py)
+            <div
+              className="prose max-w-none text-gray-700 leading-relaxed text-base"
+              dangerouslySetInnerHTML={{ __html: job.description_html }}
+            />
+          ) : (
+            <div className="prose max-w-none text-gray-700 whitespace-pre-wrap leading-relaxed text-base">
+              {job.description}
+            </div>
+          )}
         </div>
 
         {/* Footer */}
@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react'
+import React, { useEffect, useRef, useState } from 'react'
 import { useNavigate, useParams } from 'react-router-dom'
 import { companyService, type AboutSubSection } from '../services/companyService'
 import CompanyRenderer, { type CompanyDataProps } from '../components/CompanyRenderer'
@@ -22,6 +22,8 @@ const PageBuilder = () => {
   const [saving, setSaving] = useState(false)
   const [form, setForm] = useState(INITIAL_STATE)
   const [isLiveLinkOpened, setIsLiveLinkOpened] = useState(false)
+  // Sent with "create company" so a retried save cannot create it twice
+  const createKey = useRef(crypto.randomUUID())
 
   useEffect(() => {
     if (slug) {
@@ -87,9 +89,10 @@ const PageBuilder = () => {
     try {
       if (slug) {
         await companyService.updateCompany(slug, payload)
+        await companyService.publishCompany(slug)
         setIsLiveLinkOpened(true)
       } else {
-        const newCompany = await companyService.createCompany(payload)
+        const newCompany = await companyService.createCompany(payload, createKey.current)
         navigate(`/page-builder/${newCompany.slug}`)
         setIsLiveLinkOpened(true) 
       }
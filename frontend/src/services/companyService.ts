@@ -26,6 +26,38 @@ export type Company = {
   }
 }
 
+// Recruiter dashboard card (GET /api/companies/dashboard)
+export type CompanyDashboardItem = Company & {
+  created_at: string
+  total_jobs: number
+  active_jobs: number
+  recent_jobs: number
+  last_updated_at: string
+}
+
+// GET /api/companies/{slug}/stats (unique_visitors are estimates)
+export type DailyStats = {
+  day: string
+  views: number
+  apply_clicks: number
+  unique_visitors: number
+}
+
+export type JobStats = {
+  job_id: number
+  title: string | null
+  views: number
+  apply_clicks: number
+  unique_visitors: number
+}
+
+export type CompanyStats = {
+  since: string
+  career_page: DailyStats[]
+  career_page_unique_visitors: number
+  jobs: JobStats[]
+}
+
 // Request payloads
 export type CompanyCreate = {
   company_name: string
@@ -44,6 +76,20 @@ export type CompanyCreate = {
 
 export type CompanyUpdate = Partial<CompanyCreate>
 
+// RFC 6902 operation, applied by PATCH /companies/{slug}/draft
+export type JsonPatchOperation = {
+  op: 'add' | 'remove' | 'replace' | 'move' | 'copy' | 'test'
+  path: string
+  value?: unknown
+  from?: string
+}
+
+export type CompanyDraftPatch = {
+  base_version?: number
+  branding?: JsonPatchOperation[]
+  page_content?: JsonPatchOperation[]
+}
+
 // --- Service ---
 
 export const companyService = {
@@ -52,18 +98,46 @@ export const companyService = {
     return response.data
   },
 
+  // Companies with job counts in a single request
+  getDashboard: async (): Promise<CompanyDashboardItem[]> => {
+    const response = await apiClient.get('/api/companies/dashboard')
+    return response.data
+  },
+
+  getStats: async (slug: string, days = 30): Promise<CompanyStats> => {
+    const response = await apiClient.get(`/api/companies/${slug}/stats`, {
+      params: { days },
+    })
+    return response.data
+  },
+
   getCompanyForEdit: async (slug: string): Promise<Company> => {
     const response = await apiClient.get(`/api/companies/${slug}/preview`)
     return response.data
   },
 
-  createCompany: async (data: CompanyCreate): Promise<Company> => {
-    const response = await apiClient.post('/api/companies', data)
+  // Reuse the same idempotencyKey when retrying, so a retry cannot create a duplicate
+  createCompany: async (data: CompanyCreate, idempotencyKey?: string): Promise<Company> => {
+    const response = await apiClient.post('/api/companies', data, {
+      headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined,
+    })
     return response.data
   },
 
   updateCompany: async (slug: string, data: CompanyUpdate): Promise<Company> => {
     const response = await apiClient.patch(`/api/companies/${slug}/edit`, data)
     return response.data
+  },
+
+  // Small autosave edits: send only the changed paths
+  patchCompanyDraft: async (slug: string, patch: CompanyDraftPatch): Promise<Company> => {
+    const response = await apiClient.patch(`/api/companies/${slug}/draft`, patch)
+    return response.data
+  },
+
+  // Edits only change the draft; publishing makes them live on the career page
+  publishCompany: async (slug: string): Promise<{ id: number; version: number; published_at: string }> => {
+    const response = await apiClient.post(`/api/companies/${slug}/publish`)
+    return response.data
   }
 }
\ No newline at end of file
@@ -14,11 +14,17 @@ export interface Job {
   title: string
   location: string
   description: string
+  // Sanitized HTML / plain-text excerpt rendered by the API on write
+  description_html?: string
+  description_excerpt?: string
   min_salary?: number
   max_salary?: number
   currency: string
   job_type: JobType
   is_active: boolean
+  // Parsed from location by the API (e.g. "Hybrid - Pune")
+  is_remote?: boolean
+  is_hybrid?: boolean
   created_at: string
 }
 
@@ -34,19 +40,45 @@ export interface JobCreate {
 
 export type JobUpdate = Partial<JobCreate>
 
+// Deleted postings are restorable in place until archived; archived_at is set after
+export interface ArchivedJob {
+  id: number
+  title: string
+  location: string
+  min_salary?: number
+  max_salary?: number
+  currency: string
+  job_type: JobType
+  created_at: string
+  deleted_at?: string | null
+  archived_at?: string | null
+}
+
 // --- Service ---
 
 export const jobsService = {
   // GET /{company_slug}/jobs
-  // Accepts optional filters: { location?, jobType?, search? }
+  // Accepts optional filters: { location?, jobType?, search?, near?, radiusKm?, remote?, hybrid? }
   getJobs: async (
     slug: string,
-    params?: { location?: string; jobType?: JobType; search?: string }
+    params?: {
+      location?: string
+      jobType?: JobType
+      search?: string
+      near?: string
+      radiusKm?: number
+      remote?: boolean
+      hybrid?: boolean
+    }
   ): Promise<Job[]> => {
     const queryParams: any = {}
     if (params?.location) queryParams.location = params.location
     if (params?.jobType) queryParams.job_type = params.jobType
     if (params?.search) queryParams.search = params.search
+    if (params?.near) queryParams.near = params.near
+    if (params?.radiusKm) queryParams.radius_km = params.radiusKm
+    if (params?.remote !== undefined) queryParams.remote = params.remote
+    if (params?.hybrid !== undefined) queryParams.hybrid = params.hybrid
 
     const response = await apiClient.get(`/api/${slug}/jobs`, {
       params: queryParams,
@@ -60,9 +92,33 @@ export const jobsService = {
     return response.data
   },
 
+  // POST /{company_slug}/jobs/{job_id}/apply-click (analytics beacon)
+  trackApplyClick: async (slug: string, jobId: number): Promise<void> => {
+    await apiClient.post(`/api/${slug}/jobs/${jobId}/apply-click`)
+  },
+
+  // POST /{company_slug}/jobs/{job_id}/apply (multipart; resume: PDF, DOCX or TXT)
+  submitApplication: async (
+    slug: string,
+    jobId: number,
+    data: { candidate_name: string; candidate_email: string; phone?: string; cover_letter?: string },
+    resume: File
+  ): Promise<{ id: number; status: string; created_at: string }> => {
+    const form = new FormData()
+    Object.entries(data).forEach(([key, value]) => {
+      if (value) form.append(key, value)
+    })
+    form.append('resume', resume)
+    const response = await apiClient.post(`/api/${slug}/jobs/${jobId}/apply`, form)
+    return response.data
+  },
+
   // POST /{company_slug}/jobs
-  createJob: async (slug: string, data: JobCreate): Promise<Job> => {
-    const response = await apiClient.post(`/api/${slug}/jobs`, data)
+  // Reuse the same idempotencyKey when retrying, so a retry cannot create a duplicate
+  createJob: async (slug: string, data: JobCreate, idempotencyKey?: string): Promise<Job> => {
+    const response = await apiClient.post(`/api/${slug}/jobs`, data, {
+      headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined,
+    })
     return response.data
   },
 
@@ -77,6 +133,21 @@ export const jobsService = {
     await apiClient.delete(`/api/${slug}/jobs/${jobId}`)
   },
 
+  // GET /{company_slug}/jobs/archived
+  getArchivedJobs: async (
+    slug: string,
+    params?: { limit?: number; offset?: number }
+  ): Promise<ArchivedJob[]> => {
+    const response = await apiClient.get(`/api/${slug}/jobs/archived`, { params })
+    return response.data
+  },
+
+  // POST /{company_slug}/jobs/{job_id}/restore (comes back inactive)
+  restoreJob: async (slug: string, jobId: number): Promise<Job> => {
+    const response = await apiClient.post(`/api/${slug}/jobs/${jobId}/restore`)
+    return response.data
+  },
+
   // PATCH /{company_slug}/jobs/{job_id}/toggle?is_active={bool}
   toggleJobStatus: async (slug: string, jobId: number, isActive: boolean): Promise<Job> => {
     // Note: Passing boolean as query param as defined in your FastAPI endpoint